@@ -0,0 +1,187 @@
+"""
+Versioned binary encoding for cached values
+"""
+from typing import Any, Optional
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from enum import Enum
+import json
+import threading
+import zlib
+import numpy as np
+from app.config import settings
+
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib json module (same format, slower)
+    orjson = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:
+    # lz4 is optional; CACHE_COMPRESSION=lz4 falls back to zlib without it
+    lz4_frame = None
+
+
+# Every entry starts with MAGIC, the format version, the serializer id and
+# the compression id
+MAGIC = b"SA"
+FORMAT_VERSION = 1
+HEADER_SIZE = len(MAGIC) + 3
+
+SERIALIZER_ORJSON = 1
+SERIALIZER_JSON = 2
+
+COMPRESSION_NONE = 0
+COMPRESSION_ZLIB = 1
+COMPRESSION_LZ4 = 2
+
+_COMPRESSION_IDS = {
+    "none": COMPRESSION_NONE,
+    "zlib": COMPRESSION_ZLIB,
+    "lz4": COMPRESSION_LZ4,
+}
+
+
+class CodecError(ValueError):
+    """Raised when a cache entry cannot be decoded"""
+
+
+def _default(obj: Any) -> Any:
+    """Convert values the JSON serializers do not handle natively"""
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Type is not cacheable: {type(obj).__name__}")
+
+
+class CacheCodec:
+    """
+    Encodes cache values as JSON (orjson when installed) behind a small
+    header, compressing payloads above a size threshold.
+
+    Dataclasses, enums and datetimes are stored as their JSON forms, so a
+    cached PlayerInjury comes back as a plain dict. Entries without a valid
+    header (e.g. written by an older release) raise CodecError instead of
+    being guessed at.
+    """
+
+    def __init__(self, compression: str = "zlib", compress_threshold: int = 1024, level: int = 6):
+        """
+        Initialize the codec
+
+        Args:
+            compression: "zlib", "lz4" or "none"
+            compress_threshold: Payloads smaller than this many bytes are stored uncompressed
+            level: zlib compression level
+        """
+        if compression == "lz4" and lz4_frame is None:
+            print("lz4 is not installed; cache compression falls back to zlib")
+            compression = "zlib"
+        if compression not in _COMPRESSION_IDS:
+            raise ValueError(f"Unknown cache compression: {compression}")
+
+        self.compression = _COMPRESSION_IDS[compression]
+        self.compress_threshold = compress_threshold
+        self.level = level
+        self.serializer = SERIALIZER_ORJSON if orjson is not None else SERIALIZER_JSON
+
+    def encode(self, value: Any) -> bytes:
+        """
+        Encode a value for storage
+
+        Args:
+            value: JSON-compatible value (dataclasses, enums, datetimes and numpy values allowed)
+
+        Returns:
+            Header followed by the (possibly compressed) payload
+
+        Raises:
+            TypeError: If the value contains an unsupported type
+        """
+        if self.serializer == SERIALIZER_ORJSON:
+            payload = orjson.dumps(
+                value,
+                default=_default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            )
+        else:
+            payload = json.dumps(value, default=_default, separators=(",", ":")).encode("utf-8")
+
+        compression = COMPRESSION_NONE
+        if self.compression != COMPRESSION_NONE and len(payload) >= self.compress_threshold:
+            if self.compression == COMPRESSION_LZ4:
+                payload = lz4_frame.compress(payload)
+            else:
+                payload = zlib.compress(payload, self.level)
+            compression = self.compression
+
+        return MAGIC + bytes((FORMAT_VERSION, self.serializer, compression)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        """
+        Decode a stored entry
+
+        Args:
+            data: Bytes read from the cache
+
+        Returns:
+            Decoded value
+
+        Raises:
+            CodecError: If the entry has no valid header or cannot be decoded
+        """
+        if len(data) < HEADER_SIZE or not data.startswith(MAGIC):
+            raise CodecError("Missing cache entry header")
+
+        version, serializer, compression = data[len(MAGIC):HEADER_SIZE]
+        if version != FORMAT_VERSION:
+            raise CodecError(f"Unsupported cache entry version: {version}")
+
+        payload = data[HEADER_SIZE:]
+        try:
+            if compression == COMPRESSION_ZLIB:
+                payload = zlib.decompress(payload)
+            elif compression == COMPRESSION_LZ4:
+                if lz4_frame is None:
+                    raise CodecError("lz4 entry but lz4 is not installed")
+                payload = lz4_frame.decompress(payload)
+            elif compression != COMPRESSION_NONE:
+                raise CodecError(f"Unknown compression id: {compression}")
+
+            if serializer not in (SERIALIZER_ORJSON, SERIALIZER_JSON):
+                raise CodecError(f"Unknown serializer id: {serializer}")
+            # Both serializers write JSON, so either parser can read them
+            return orjson.loads(payload) if orjson is not None else json.loads(payload)
+        except CodecError:
+            raise
+        except Exception as e:
+            raise CodecError(f"Corrupt cache entry: {e}") from e
+
+
+# Global codec instance
+_codec_instance: Optional[CacheCodec] = None
+_codec_lock = threading.Lock()
+
+
+def get_codec() -> CacheCodec:
+    """Get or create the codec configured in settings"""
+    global _codec_instance
+    if _codec_instance is None:
+        with _codec_lock:
+            if _codec_instance is None:
+                _codec_instance = CacheCodec(
+                    compression=settings.CACHE_COMPRESSION,
+                    compress_threshold=settings.CACHE_COMPRESS_THRESHOLD
+                )
+    return _codec_instance
@@ -0,0 +1,85 @@
+"""
+In-process LRU cache with per-entry TTL (L1 in front of Redis)
+"""
+from typing import Any, Optional
+from collections import OrderedDict
+import fnmatch
+import threading
+import time
+
+
+class LocalCache:
+    """Bounded, thread-safe LRU cache with per-entry expiry"""
+
+    def __init__(self, max_size: int = 1024, max_ttl: int = 30):
+        """
+        Initialize the cache
+
+        Args:
+            max_size: Maximum number of entries before the least recently used is evicted
+            max_ttl: Upper bound on how long any entry is kept, in seconds
+        """
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a value if present and not expired
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to cache (stored by reference, treat as read-only)
+            ttl: Time to live in seconds, capped at max_ttl
+        """
+        ttl = self.max_ttl if ttl is None else min(ttl, self.max_ttl)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> bool:
+        """Remove a key, returning True if it was present"""
+        with self._lock:
+            return self._entries.pop(key, None) is not None
+
+    def delete_pattern(self, pattern: str) -> int:
+        """Remove all keys matching a glob-style pattern"""
+        with self._lock:
+            keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
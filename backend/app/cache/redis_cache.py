@@ -2,17 +2,116 @@
 Redis caching layer for API efficiency
 """
 import redis
+import redis.asyncio as redis_async
+import asyncio
 import json
-import pickle
-from typing import Optional, Any, Union
+import threading
+import time
+import uuid
+from typing import Optional, Any, Callable, Dict, List, Sequence, Union
+from concurrent.futures import Future
 from functools import wraps
 from datetime import timedelta
+from string import Formatter
 from app.config import settings
+from app.cache.codecs import CodecError, get_codec
+from app.cache.local_cache import LocalCache
+from app.monitoring.prometheus_metrics import record_cache_hit, record_cache_miss
+from app.utils.concurrency import get_executor
 import hashlib
+import inspect
+
+
+# Channel used to tell every worker to drop keys from its in-process cache
+INVALIDATION_CHANNEL = "cache:invalidate"
+
+# Identifies this process so it can ignore its own invalidation messages
+_INSTANCE_ID = uuid.uuid4().hex
+
+
+def _serialize(value: Any) -> bytes:
+    """Serialize a value for storage in Redis"""
+    return get_codec().encode(value)
+
+
+def _deserialize(value: bytes) -> Optional[Any]:
+    """Deserialize a value read from Redis; entries in an unknown format read as a miss"""
+    try:
+        return get_codec().decode(value)
+    except CodecError as e:
+        print(f"Ignoring undecodable cache entry: {e}")
+        return None
+
+
+# Global in-process (L1) cache shared by the sync and async Redis caches
+_local_cache: Optional[LocalCache] = None
+_local_cache_lock = threading.Lock()
+
+
+def get_local_cache() -> LocalCache:
+    """Get or create the process-wide L1 cache"""
+    global _local_cache
+    if _local_cache is None:
+        with _local_cache_lock:
+            if _local_cache is None:
+                _local_cache = LocalCache(
+                    max_size=getattr(settings, 'LOCAL_CACHE_MAX_SIZE', 1024),
+                    max_ttl=getattr(settings, 'LOCAL_CACHE_TTL', 30)
+                )
+    return _local_cache
+
+
+def _local_ttl(pttl: Optional[int]) -> Optional[float]:
+    """Convert a Redis PTTL reply into an L1 TTL (None means no expiry in Redis)"""
+    if pttl is None or pttl < 0:
+        return None
+    return pttl / 1000.0
+
+
+def _namespace_key(namespace: str) -> str:
+    """Redis key holding the version counter of an invalidation namespace"""
+    return f"cache:ns:{namespace}"
+
+
+def _invalidation_message(op: str, value: Union[str, List[str]]) -> str:
+    """Build a pub/sub invalidation message"""
+    return json.dumps({"origin": _INSTANCE_ID, "op": op, "value": value})
+
+
+def _handle_invalidation(message: Dict) -> None:
+    """Evict keys named by an invalidation message published by another worker"""
+    try:
+        data = message.get("data")
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        payload = json.loads(data)
+    except Exception as e:
+        print(f"Invalid cache invalidation message: {e}")
+        return
+
+    if payload.get("origin") == _INSTANCE_ID:
+        return
+
+    local = get_local_cache()
+    if payload.get("op") == "pattern":
+        local.delete_pattern(payload.get("value", ""))
+    elif payload.get("op") == "key":
+        local.delete(payload.get("value", ""))
+    elif payload.get("op") == "keys":
+        for key in payload.get("value", []):
+            local.delete(key)
 
 
 class RedisCache:
-    """Redis cache manager"""
+    """
+    Redis cache manager
+
+    Reads go through the process-wide L1 cache first and only fall through to
+    Redis (L2) on a local miss. L1 entries never outlive the Redis key or
+    LOCAL_CACHE_TTL, and writes/deletes are broadcast on INVALIDATION_CHANNEL
+    so other workers drop their local copies. Values served from L1 are
+    shared objects and must be treated as read-only.
+    """
     
     def __init__(self, host: str = "localhost", port: int = 6379, db: int = 0, decode_responses: bool = False):
         """
@@ -40,6 +139,61 @@ class RedisCache:
             print(f"Redis connection failed: {e}. Caching disabled.")
             self.redis_client = None
             self.enabled = False
+        self._listener = None
+    
+    def start_invalidation_listener(self):
+        """Subscribe to invalidation messages on a background thread (once per process)"""
+        if not self.enabled or self._listener is not None:
+            return
+        
+        def on_error(error, pubsub, thread):
+            # Keep listening; redis-py reconnects on the next poll. Local
+            # entries stay bounded by LOCAL_CACHE_TTL while disconnected.
+            print(f"Redis invalidation listener error: {error}")
+            time.sleep(1)
+        
+        try:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{INVALIDATION_CHANNEL: _handle_invalidation})
+            self._listener = pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=on_error
+            )
+        except Exception as e:
+            print(f"Redis invalidation listener failed to start: {e}")
+    
+    def acquire_lock(self, name: str, timeout: float):
+        """
+        Try to take a cross-process lock without waiting
+        
+        Args:
+            name: Lock name
+            timeout: Seconds before the lock expires if never released
+        
+        Returns:
+            The held lock, or None if another process holds it or Redis failed
+        """
+        try:
+            lock = self.redis_client.lock(f"lock:{name}", timeout=timeout, blocking=False)
+            return lock if lock.acquire() else None
+        except Exception as e:
+            print(f"Redis lock error: {e}")
+            return None
+    
+    def release_lock(self, lock):
+        """Release a lock taken with acquire_lock (no-op if it already expired)"""
+        try:
+            lock.release()
+        except Exception as e:
+            print(f"Redis unlock error: {e}")
+    
+    def publish_invalidation(self, op: str, value: Union[str, List[str]]):
+        """Tell other workers to drop a key (op="key"), keys (op="keys") or pattern (op="pattern")"""
+        try:
+            self.redis_client.publish(INVALIDATION_CHANNEL, _invalidation_message(op, value))
+        except Exception as e:
+            print(f"Redis publish error: {e}")
     
     def get(self, key: str) -> Optional[Any]:
         """
@@ -54,18 +208,24 @@ class RedisCache:
         if not self.enabled:
             return None
         
+        local = get_local_cache()
+        value = local.get(key)
+        if value is not None:
+            record_cache_hit("local")
+            return value
+        record_cache_miss("local")
+        
         try:
-            value = self.redis_client.get(key)
-            if value:
-                # Try to deserialize
-                try:
-                    return pickle.loads(value)
-                except:
-                    # Fallback to JSON
-                    try:
-                        return json.loads(value)
-                    except:
-                        return value
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.get(key)
+            pipe.pttl(key)
+            raw, pttl = pipe.execute()
+            value = _deserialize(raw) if raw else None
+            if value is not None:
+                record_cache_hit("redis")
+                local.set(key, value, ttl=_local_ttl(pttl))
+                return value
+            record_cache_miss("redis")
             return None
         except Exception as e:
             print(f"Redis get error: {e}")
@@ -92,30 +252,121 @@ class RedisCache:
             return False
         
         try:
-            # Serialize value
-            try:
-                serialized = pickle.dumps(value)
-            except:
-                serialized = json.dumps(value).encode('utf-8')
+            serialized = _serialize(value)
             
             if ttl:
-                return self.redis_client.setex(key, ttl, serialized)
+                stored = bool(self.redis_client.setex(key, ttl, serialized))
             else:
-                return self.redis_client.set(key, serialized)
+                stored = bool(self.redis_client.set(key, serialized))
         except Exception as e:
             print(f"Redis set error: {e}")
             return False
+        
+        if stored:
+            # L1 holds the decoded form Redis will return, so every tier
+            # answers with the same shape and callers never share the
+            # caller's own object
+            get_local_cache().set(key, _deserialize(serialized), ttl=ttl)
+            self.publish_invalidation("key", key)
+        return stored
     
     def delete(self, key: str) -> bool:
         """Delete key from cache"""
         if not self.enabled:
             return False
         
+        get_local_cache().delete(key)
         try:
-            return bool(self.redis_client.delete(key))
+            deleted = bool(self.redis_client.delete(key))
         except Exception as e:
             print(f"Redis delete error: {e}")
             return False
+        self.publish_invalidation("key", key)
+        return deleted
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """
+        Get several values in one round-trip
+        
+        Keys held in the L1 cache are served locally; the rest are read with a
+        single pipelined MGET (plus PTTLs to bound their L1 lifetime).
+        
+        Args:
+            keys: Cache keys
+        
+        Returns:
+            Mapping of key to value for the keys that were found
+        """
+        if not self.enabled or not keys:
+            return {}
+        
+        local = get_local_cache()
+        found = {}
+        missing = []
+        for key in keys:
+            value = local.get(key)
+            if value is not None:
+                record_cache_hit("local")
+                found[key] = value
+            else:
+                record_cache_miss("local")
+                missing.append(key)
+        if not missing:
+            return found
+        
+        try:
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.mget(missing)
+            for key in missing:
+                pipe.pttl(key)
+            replies = pipe.execute()
+        except Exception as e:
+            print(f"Redis get_many error: {e}")
+            return found
+        
+        for key, raw, pttl in zip(missing, replies[0], replies[1:]):
+            value = _deserialize(raw) if raw else None
+            if value is not None:
+                record_cache_hit("redis")
+                local.set(key, value, ttl=_local_ttl(pttl))
+                found[key] = value
+            else:
+                record_cache_miss("redis")
+        return found
+    
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Set several values in one pipelined round-trip
+        
+        Args:
+            items: Mapping of key to value
+            ttl: Time to live in seconds
+        
+        Returns:
+            True if every value was stored
+        """
+        if not self.enabled or not items:
+            return False
+        
+        try:
+            serialized = {key: _serialize(value) for key, value in items.items()}
+            pipe = self.redis_client.pipeline(transaction=False)
+            for key, raw in serialized.items():
+                if ttl:
+                    pipe.setex(key, ttl, raw)
+                else:
+                    pipe.set(key, raw)
+            pipe.publish(INVALIDATION_CHANNEL, _invalidation_message("keys", list(items)))
+            replies = pipe.execute()
+        except Exception as e:
+            print(f"Redis set_many error: {e}")
+            return False
+        
+        local = get_local_cache()
+        for key, raw in serialized.items():
+            # Same decoded form as a Redis hit (see set)
+            local.set(key, _deserialize(raw), ttl=ttl)
+        return all(replies[:-1])
     
     def exists(self, key: str) -> bool:
         """Check if key exists"""
@@ -128,19 +379,392 @@ class RedisCache:
             print(f"Redis exists error: {e}")
             return False
     
-    def clear_pattern(self, pattern: str) -> int:
-        """Clear all keys matching pattern"""
+    def clear_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Clear all keys matching pattern
+        
+        Walks the keyspace incrementally with SCAN and frees matches with
+        UNLINK in batches, so Redis is never blocked by a single KEYS/DELETE.
+        Prefer invalidate_namespace for keys written with namespaces.
+        
+        Args:
+            pattern: Glob-style key pattern
+            batch_size: Keys requested per SCAN step and removed per UNLINK
+        
+        Returns:
+            Number of keys removed
+        """
         if not self.enabled:
             return 0
         
+        get_local_cache().delete_pattern(pattern)
+        deleted = 0
         try:
-            keys = self.redis_client.keys(pattern)
-            if keys:
-                return self.redis_client.delete(*keys)
-            return 0
+            batch = []
+            for key in self.redis_client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += self.redis_client.unlink(*batch)
         except Exception as e:
             print(f"Redis clear_pattern error: {e}")
+        self.publish_invalidation("pattern", pattern)
+        return deleted
+    
+    def namespace_versions(self, namespaces: List[str]) -> List[int]:
+        """
+        Get the current version of each namespace (0 if never invalidated)
+        
+        Versions are kept in the L1 cache and refreshed from Redis in one
+        MGET for any that are not held locally.
+        """
+        local = get_local_cache()
+        versions = {ns: local.get(_namespace_key(ns)) for ns in namespaces}
+        missing = [ns for ns, version in versions.items() if version is None]
+        if missing:
+            try:
+                values = self.redis_client.mget([_namespace_key(ns) for ns in missing])
+            except Exception as e:
+                print(f"Redis namespace version error: {e}")
+                values = [None] * len(missing)
+            for ns, raw in zip(missing, values):
+                versions[ns] = int(raw) if raw else 0
+                local.set(_namespace_key(ns), versions[ns])
+        return [versions[ns] for ns in namespaces]
+    
+    def invalidate_namespace(self, namespace: str) -> int:
+        """
+        Invalidate every key written under a namespace in O(1)
+        
+        Bumps the namespace version, so keys built from the old version are
+        never read again and simply expire on their TTL.
+        
+        Args:
+            namespace: Namespace such as "game:nfl_0_1700000000" or "sport:nfl"
+        
+        Returns:
+            New namespace version (0 if Redis is unavailable)
+        """
+        if not self.enabled:
+            return 0
+        
+        version_key = _namespace_key(namespace)
+        try:
+            version = int(self.redis_client.incr(version_key))
+        except Exception as e:
+            print(f"Redis invalidate_namespace error: {e}")
+            return 0
+        # Store the new version rather than dropping the old one: a reader racing
+        # the INCR could re-cache the old version, and this process ignores its
+        # own invalidation message
+        get_local_cache().set(version_key, version)
+        self.publish_invalidation("key", version_key)
+        return version
+
+
+class AsyncRedisCache:
+    """
+    Asyncio Redis cache manager for use inside request handlers
+    
+    Uses redis.asyncio with a single connection pool shared by every
+    coroutine in the process, so cache round-trips yield to the event loop
+    instead of blocking it. Shares the process-wide L1 cache and
+    invalidation channel with RedisCache.
+    """
+    
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        max_connections: int = 50
+    ):
+        """
+        Initialize the connection pool (connections are opened lazily)
+        
+        Args:
+            host: Redis host
+            port: Redis port
+            db: Redis database number
+            max_connections: Maximum pooled connections
+        """
+        self.pool = redis_async.ConnectionPool(
+            host=host,
+            port=port,
+            db=db,
+            max_connections=max_connections,
+            socket_connect_timeout=5,
+            socket_timeout=5
+        )
+        self.redis_client = redis_async.Redis(connection_pool=self.pool)
+        self.enabled = True
+        self._connection_checked = False
+    
+    async def is_available(self) -> bool:
+        """Check the connection once and disable caching if Redis is unreachable"""
+        if not self._connection_checked:
+            self._connection_checked = True
+            try:
+                await self.redis_client.ping()
+            except (redis.ConnectionError, redis.TimeoutError, OSError) as e:
+                print(f"Async Redis connection failed: {e}. Caching disabled.")
+                self.enabled = False
+        return self.enabled
+    
+    async def acquire_lock(self, name: str, timeout: float):
+        """
+        Try to take a cross-process lock without waiting
+        
+        Args:
+            name: Lock name
+            timeout: Seconds before the lock expires if never released
+        
+        Returns:
+            The held lock, or None if another process holds it or Redis failed
+        """
+        try:
+            lock = self.redis_client.lock(f"lock:{name}", timeout=timeout, blocking=False)
+            return lock if await lock.acquire() else None
+        except Exception as e:
+            print(f"Async Redis lock error: {e}")
+            return None
+    
+    async def release_lock(self, lock):
+        """Release a lock taken with acquire_lock (no-op if it already expired)"""
+        try:
+            await lock.release()
+        except Exception as e:
+            print(f"Async Redis unlock error: {e}")
+    
+    async def publish_invalidation(self, op: str, value: Union[str, List[str]]):
+        """Tell other workers to drop a key (op="key"), keys (op="keys") or pattern (op="pattern")"""
+        try:
+            await self.redis_client.publish(INVALIDATION_CHANNEL, _invalidation_message(op, value))
+        except Exception as e:
+            print(f"Async Redis publish error: {e}")
+    
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Get value from cache
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value or None
+        """
+        if not await self.is_available():
+            return None
+        
+        local = get_local_cache()
+        value = local.get(key)
+        if value is not None:
+            record_cache_hit("local")
+            return value
+        record_cache_miss("local")
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(key)
+                pipe.pttl(key)
+                raw, pttl = await pipe.execute()
+            value = _deserialize(raw) if raw else None
+            if value is not None:
+                record_cache_hit("redis")
+                local.set(key, value, ttl=_local_ttl(pttl))
+                return value
+            record_cache_miss("redis")
+            return None
+        except Exception as e:
+            print(f"Async Redis get error: {e}")
+            return None
+    
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set value in cache
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time to live in seconds
+        
+        Returns:
+            True if successful
+        """
+        if not await self.is_available():
+            return False
+        
+        try:
+            serialized = _serialize(value)
+            
+            if ttl:
+                stored = bool(await self.redis_client.setex(key, ttl, serialized))
+            else:
+                stored = bool(await self.redis_client.set(key, serialized))
+        except Exception as e:
+            print(f"Async Redis set error: {e}")
+            return False
+        
+        if stored:
+            get_local_cache().set(key, _deserialize(serialized), ttl=ttl)
+            await self.publish_invalidation("key", key)
+        return stored
+    
+    async def delete(self, key: str) -> bool:
+        """Delete key from cache"""
+        if not await self.is_available():
+            return False
+        
+        get_local_cache().delete(key)
+        try:
+            deleted = bool(await self.redis_client.delete(key))
+        except Exception as e:
+            print(f"Async Redis delete error: {e}")
+            return False
+        await self.publish_invalidation("key", key)
+        return deleted
+    
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Get several values in one round-trip (see RedisCache)"""
+        if not await self.is_available() or not keys:
+            return {}
+        
+        local = get_local_cache()
+        found = {}
+        missing = []
+        for key in keys:
+            value = local.get(key)
+            if value is not None:
+                record_cache_hit("local")
+                found[key] = value
+            else:
+                record_cache_miss("local")
+                missing.append(key)
+        if not missing:
+            return found
+        
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                pipe.mget(missing)
+                for key in missing:
+                    pipe.pttl(key)
+                replies = await pipe.execute()
+        except Exception as e:
+            print(f"Async Redis get_many error: {e}")
+            return found
+        
+        for key, raw, pttl in zip(missing, replies[0], replies[1:]):
+            value = _deserialize(raw) if raw else None
+            if value is not None:
+                record_cache_hit("redis")
+                local.set(key, value, ttl=_local_ttl(pttl))
+                found[key] = value
+            else:
+                record_cache_miss("redis")
+        return found
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Set several values in one pipelined round-trip (see RedisCache)"""
+        if not await self.is_available() or not items:
+            return False
+        
+        try:
+            serialized = {key: _serialize(value) for key, value in items.items()}
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for key, raw in serialized.items():
+                    if ttl:
+                        pipe.setex(key, ttl, raw)
+                    else:
+                        pipe.set(key, raw)
+                pipe.publish(INVALIDATION_CHANNEL, _invalidation_message("keys", list(items)))
+                replies = await pipe.execute()
+        except Exception as e:
+            print(f"Async Redis set_many error: {e}")
+            return False
+        
+        local = get_local_cache()
+        for key, raw in serialized.items():
+            # Same decoded form as a Redis hit (see set)
+            local.set(key, _deserialize(raw), ttl=ttl)
+        return all(replies[:-1])
+    
+    async def exists(self, key: str) -> bool:
+        """Check if key exists"""
+        if not await self.is_available():
+            return False
+        
+        try:
+            return bool(await self.redis_client.exists(key))
+        except Exception as e:
+            print(f"Async Redis exists error: {e}")
+            return False
+    
+    async def clear_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Clear all keys matching pattern with SCAN and batched UNLINK (see RedisCache)"""
+        if not await self.is_available():
+            return 0
+        
+        get_local_cache().delete_pattern(pattern)
+        deleted = 0
+        try:
+            batch = []
+            async for key in self.redis_client.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await self.redis_client.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await self.redis_client.unlink(*batch)
+        except Exception as e:
+            print(f"Async Redis clear_pattern error: {e}")
+        await self.publish_invalidation("pattern", pattern)
+        return deleted
+    
+    async def namespace_versions(self, namespaces: List[str]) -> List[int]:
+        """Get the current version of each namespace (see RedisCache)"""
+        local = get_local_cache()
+        versions = {ns: local.get(_namespace_key(ns)) for ns in namespaces}
+        missing = [ns for ns, version in versions.items() if version is None]
+        if missing:
+            try:
+                values = await self.redis_client.mget([_namespace_key(ns) for ns in missing])
+            except Exception as e:
+                print(f"Async Redis namespace version error: {e}")
+                values = [None] * len(missing)
+            for ns, raw in zip(missing, values):
+                versions[ns] = int(raw) if raw else 0
+                local.set(_namespace_key(ns), versions[ns])
+        return [versions[ns] for ns in namespaces]
+    
+    async def invalidate_namespace(self, namespace: str) -> int:
+        """Invalidate every key written under a namespace in O(1) (see RedisCache)"""
+        if not await self.is_available():
             return 0
+        
+        version_key = _namespace_key(namespace)
+        try:
+            version = int(await self.redis_client.incr(version_key))
+        except Exception as e:
+            print(f"Async Redis invalidate_namespace error: {e}")
+            return 0
+        get_local_cache().set(version_key, version)
+        await self.publish_invalidation("key", version_key)
+        return version
+    
+    async def close(self):
+        """Close pooled connections"""
+        try:
+            await self.redis_client.aclose()
+        except AttributeError:
+            await self.redis_client.close()
+        await self.pool.disconnect()
 
 
 # Global cache instance
@@ -156,9 +780,37 @@ def get_cache() -> RedisCache:
         redis_port = getattr(settings, 'REDIS_PORT', 6379)
         redis_db = getattr(settings, 'REDIS_DB', 0)
         _cache_instance = RedisCache(host=redis_host, port=redis_port, db=redis_db)
+        _cache_instance.start_invalidation_listener()
     return _cache_instance
 
 
+# Global async cache instance
+_async_cache_instance: Optional[AsyncRedisCache] = None
+
+
+def get_async_cache() -> AsyncRedisCache:
+    """Get or create the async cache instance (one connection pool per process)"""
+    global _async_cache_instance
+    if _async_cache_instance is None:
+        # The sync cache owns the invalidation listener for this process
+        get_cache()
+        _async_cache_instance = AsyncRedisCache(
+            host=getattr(settings, 'REDIS_HOST', 'localhost'),
+            port=getattr(settings, 'REDIS_PORT', 6379),
+            db=getattr(settings, 'REDIS_DB', 0),
+            max_connections=getattr(settings, 'REDIS_MAX_CONNECTIONS', 50)
+        )
+    return _async_cache_instance
+
+
+async def close_async_cache():
+    """Close the async cache connection pool (call on shutdown)"""
+    global _async_cache_instance
+    if _async_cache_instance is not None:
+        await _async_cache_instance.close()
+        _async_cache_instance = None
+
+
 def cache_key(*args, **kwargs) -> str:
     """Generate cache key from arguments"""
     key_parts = []
@@ -178,32 +830,229 @@ def cache_key(*args, **kwargs) -> str:
     return hashlib.md5(key_string.encode()).hexdigest()
 
 
-def cached(ttl: int = 300, key_prefix: str = ""):
+# Marks a cached() entry that carries its own freshness deadline
+_ENVELOPE_KEY = "__cached__"
+
+# How often a process waiting on another worker's fill re-checks Redis
+_FILL_POLL_INTERVAL = 0.05
+
+# Sentinel for "nothing usable in the cache"
+_MISS = object()
+
+# In-flight fills per cache key, shared by concurrent callers in this process
+_async_fills: Dict[str, asyncio.Task] = {}
+_sync_fills: Dict[str, Future] = {}
+_sync_fills_lock = threading.Lock()
+
+
+def _envelope(value: Any, ttl: int) -> Dict:
+    """Wrap a value with the time after which it is served stale"""
+    return {_ENVELOPE_KEY: value, "fresh_until": time.time() + ttl}
+
+
+def _unwrap(entry: Any) -> tuple:
+    """
+    Split a cached() entry into (value, is_fresh)
+
+    Entries written before envelopes existed are treated as fresh.
+    """
+    if entry is None:
+        return _MISS, False
+    if isinstance(entry, dict) and _ENVELOPE_KEY in entry:
+        return entry[_ENVELOPE_KEY], entry.get("fresh_until", 0) > time.time()
+    return entry, True
+
+
+def _log_background_error(task: asyncio.Task):
+    """Report a failed background refresh instead of dropping the error"""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"Background cache refresh error: {task.exception()}")
+
+
+async def _fill_async(cache: AsyncRedisCache, key: str, compute, ttl: int, stale_ttl: int, wait: bool) -> Any:
+    """
+    Compute a value and store it, holding the cross-process fill lock
+
+    If another worker holds the lock, either wait for the value it writes
+    (wait=True) or leave the refresh to it (wait=False, returns _MISS).
+    """
+    lock_timeout = getattr(settings, 'CACHE_LOCK_TIMEOUT', 30)
+    lock = await cache.acquire_lock(key, timeout=lock_timeout)
+    if lock is None:
+        if not wait:
+            return _MISS
+        deadline = time.monotonic() + lock_timeout
+        while time.monotonic() < deadline:
+            await asyncio.sleep(_FILL_POLL_INTERVAL)
+            value, fresh = _unwrap(await cache.get(key))
+            if fresh:
+                return value
+        # The other worker never finished; compute it here rather than fail
+    
+    try:
+        result = await compute()
+        await cache.set(key, _envelope(result, ttl), ttl=ttl + stale_ttl)
+        return result
+    finally:
+        if lock is not None:
+            await cache.release_lock(lock)
+
+
+def _start_async_fill(cache: AsyncRedisCache, key: str, compute, ttl: int, stale_ttl: int, wait: bool) -> asyncio.Task:
+    """Start a fill for key unless one is already running in this process"""
+    task = _async_fills.get(key)
+    if task is None or task.done():
+        task = asyncio.ensure_future(_fill_async(cache, key, compute, ttl, stale_ttl, wait))
+        _async_fills[key] = task
+        
+        def forget(done: asyncio.Task):
+            if _async_fills.get(key) is done:
+                del _async_fills[key]
+        
+        task.add_done_callback(forget)
+        # Attached once per fill, however many stale hits join it
+        task.add_done_callback(_log_background_error)
+    return task
+
+
+def _fill_sync(cache: RedisCache, key: str, compute, ttl: int, stale_ttl: int, wait: bool) -> Any:
+    """Blocking counterpart of _fill_async"""
+    lock_timeout = getattr(settings, 'CACHE_LOCK_TIMEOUT', 30)
+    lock = cache.acquire_lock(key, timeout=lock_timeout)
+    if lock is None:
+        if not wait:
+            return _MISS
+        deadline = time.monotonic() + lock_timeout
+        while time.monotonic() < deadline:
+            time.sleep(_FILL_POLL_INTERVAL)
+            value, fresh = _unwrap(cache.get(key))
+            if fresh:
+                return value
+    
+    try:
+        result = compute()
+        cache.set(key, _envelope(result, ttl), ttl=ttl + stale_ttl)
+        return result
+    finally:
+        if lock is not None:
+            cache.release_lock(lock)
+
+
+def _run_sync_fill(cache: RedisCache, key: str, compute, ttl: int, stale_ttl: int, wait: bool) -> Any:
+    """
+    Run a fill for key, or wait for the one already running in this process
+
+    The first caller for a key becomes the leader and computes; concurrent
+    callers block on the leader's future and share its result or error.
+    """
+    with _sync_fills_lock:
+        future = _sync_fills.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _sync_fills[key] = future
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        future.set_result(_fill_sync(cache, key, compute, ttl, stale_ttl, wait))
+    except BaseException as e:
+        future.set_exception(e)
+    finally:
+        with _sync_fills_lock:
+            _sync_fills.pop(key, None)
+    return future.result()
+
+
+def _resolve_namespaces(templates: Sequence[str], signature: inspect.Signature, args, kwargs) -> List[str]:
+    """
+    Fill namespace templates such as "game:{game_id}" from a call's arguments
+
+    Templates that reference a missing or None argument are skipped.
+    """
+    try:
+        bound = signature.bind_partial(*args, **kwargs)
+    except TypeError:
+        return []
+    return _fill_namespaces(templates, bound.arguments)
+
+
+def _fill_namespaces(templates: Sequence[str], arguments: Dict[str, Any]) -> List[str]:
+    """Fill namespace templates from named values, skipping templates with a missing or None field"""
+    namespaces = []
+    for template in templates:
+        fields = [name for _, name, _, _ in Formatter().parse(template) if name]
+        if any(arguments.get(name) is None for name in fields):
+            continue
+        namespaces.append(template.format(**arguments))
+    return namespaces
+
+
+def _versioned_key(base_key: str, namespaces: List[str], versions: List[int]) -> str:
+    """Fold namespace versions into a cache key so bumping a version orphans it"""
+    if not namespaces:
+        return base_key
+    return base_key + ":" + ",".join(f"{ns}@{version}" for ns, version in zip(namespaces, versions))
+
+
+def cached(
+    ttl: int = 300,
+    key_prefix: str = "",
+    stale_ttl: Optional[int] = None,
+    namespaces: Optional[Sequence[str]] = None
+):
     """
     Decorator to cache function results
     
+    Concurrent misses for the same key are coalesced into one call: within a
+    process callers share the in-flight computation, and across processes a
+    Redis lock lets one worker compute while the others wait for its result.
+    Entries stay in Redis for stale_ttl seconds past ttl; during that window
+    the stale value is returned immediately and a single background call
+    refreshes it.
+    
     Args:
         ttl: Time to live in seconds
         key_prefix: Prefix for cache key
+        stale_ttl: Seconds a stale value may be served while it is refreshed
+            (defaults to CACHE_STALE_SECONDS)
+        namespaces: Invalidation namespace templates filled from the call's
+            arguments, e.g. ["game:{game_id}"]; invalidate_namespace on any
+            of them drops the cached result
     """
+    grace = getattr(settings, 'CACHE_STALE_SECONDS', 60) if stale_ttl is None else stale_ttl
+    
     def decorator(func):
+        signature = inspect.signature(func)
+        
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            cache = get_cache()
-            if not cache.enabled:
+            cache = get_async_cache()
+            if not await cache.is_available():
                 return await func(*args, **kwargs)
             
             # Generate cache key
             cache_key_str = f"{key_prefix}:{func.__name__}:{cache_key(*args, **kwargs)}"
+            if namespaces:
+                names = _resolve_namespaces(namespaces, signature, args, kwargs)
+                versions = await cache.namespace_versions(names) if names else []
+                cache_key_str = _versioned_key(cache_key_str, names, versions)
+            compute = lambda: func(*args, **kwargs)
             
             # Try to get from cache
-            cached_value = cache.get(cache_key_str)
-            if cached_value is not None:
-                return cached_value
+            value, fresh = _unwrap(await cache.get(cache_key_str))
+            if value is not _MISS:
+                if not fresh:
+                    _start_async_fill(cache, cache_key_str, compute, ttl, grace, wait=False)
+                return value
             
-            # Call function and cache result
-            result = await func(*args, **kwargs)
-            cache.set(cache_key_str, result, ttl=ttl)
+            # Miss: join (or start) the single in-flight computation
+            task = _start_async_fill(cache, cache_key_str, compute, ttl, grace, wait=True)
+            result = await asyncio.shield(task)
+            if result is _MISS:
+                # Joined a background refresh that deferred to another worker
+                result = await compute()
             return result
         
         @wraps(func)
@@ -214,19 +1063,27 @@ def cached(ttl: int = 300, key_prefix: str = ""):
             
             # Generate cache key
             cache_key_str = f"{key_prefix}:{func.__name__}:{cache_key(*args, **kwargs)}"
+            if namespaces:
+                names = _resolve_namespaces(namespaces, signature, args, kwargs)
+                versions = cache.namespace_versions(names) if names else []
+                cache_key_str = _versioned_key(cache_key_str, names, versions)
+            compute = lambda: func(*args, **kwargs)
             
             # Try to get from cache
-            cached_value = cache.get(cache_key_str)
-            if cached_value is not None:
-                return cached_value
+            value, fresh = _unwrap(cache.get(cache_key_str))
+            if value is not _MISS:
+                if not fresh:
+                    get_executor().submit(
+                        _run_sync_fill, cache, cache_key_str, compute, ttl, grace, False
+                    )
+                return value
             
-            # Call function and cache result
-            result = func(*args, **kwargs)
-            cache.set(cache_key_str, result, ttl=ttl)
+            result = _run_sync_fill(cache, cache_key_str, compute, ttl, grace, True)
+            if result is _MISS:
+                result = compute()
             return result
         
         # Return appropriate wrapper
-        import inspect
         if inspect.iscoroutinefunction(func):
             return async_wrapper
         else:
@@ -234,3 +1091,99 @@ def cached(ttl: int = 300, key_prefix: str = ""):
     
     return decorator
 
+
+def cached_batch(
+    ttl: int = 300,
+    key_prefix: str = "",
+    item_key: Optional[Callable[[Any], Any]] = None,
+    namespaces: Optional[Sequence[str]] = None
+):
+    """
+    Decorator to cache per-item results of a function that works on a batch
+    
+    The decorated function takes a list of items as its first argument and
+    returns a dict mapping item_key(item) to that item's result. Cached
+    results are read with one get_many, the function is called once with
+    only the missing items, and its results are written back with one
+    set_many. Items whose result is missing or None are not cached.
+    
+    Args:
+        ttl: Time to live in seconds
+        key_prefix: Prefix for cache keys
+        item_key: Maps an item to its identity (e.g. lambda game: game["game_id"]);
+            defaults to the item itself. The remaining arguments of the call
+            are part of every key
+        namespaces: Invalidation namespace templates filled from each item's
+            fields (a dict item, otherwise {item}), e.g. ["game:{game_id}"];
+            invalidate_namespace on any of them drops that item's result
+    """
+    if item_key is None:
+        item_key = lambda item: item
+    
+    def item_namespaces(item) -> List[str]:
+        fields = item if isinstance(item, dict) else {"item": item}
+        return _fill_namespaces(namespaces, fields) if namespaces else []
+    
+    def decorator(func):
+        def batch_namespaces(items) -> List[str]:
+            return sorted({ns for item in items for ns in item_namespaces(item)})
+        
+        def item_cache_keys(items, args, kwargs, versions: Dict[str, int]) -> Dict[Any, str]:
+            keys = {}
+            for item in items:
+                ident = item_key(item)
+                names = item_namespaces(item)
+                base_key = f"{key_prefix}:{func.__name__}:{cache_key(ident, *args, **kwargs)}"
+                keys[ident] = _versioned_key(base_key, names, [versions[ns] for ns in names])
+            return keys
+        
+        @wraps(func)
+        async def async_wrapper(items, *args, **kwargs):
+            cache = get_async_cache()
+            if not items or not await cache.is_available():
+                return await func(items, *args, **kwargs)
+            
+            names = batch_namespaces(items)
+            versions = dict(zip(names, await cache.namespace_versions(names))) if names else {}
+            keys = item_cache_keys(items, args, kwargs, versions)
+            hits = await cache.get_many(list(keys.values()))
+            results = {ident: hits[key] for ident, key in keys.items() if key in hits}
+            
+            misses = [item for item in items if item_key(item) not in results]
+            if misses:
+                computed = await func(misses, *args, **kwargs) or {}
+                await cache.set_many(
+                    {keys[ident]: value for ident, value in computed.items() if ident in keys and value is not None},
+                    ttl=ttl
+                )
+                results.update(computed)
+            return results
+        
+        @wraps(func)
+        def sync_wrapper(items, *args, **kwargs):
+            cache = get_cache()
+            if not items or not cache.enabled:
+                return func(items, *args, **kwargs)
+            
+            names = batch_namespaces(items)
+            versions = dict(zip(names, cache.namespace_versions(names))) if names else {}
+            keys = item_cache_keys(items, args, kwargs, versions)
+            hits = cache.get_many(list(keys.values()))
+            results = {ident: hits[key] for ident, key in keys.items() if key in hits}
+            
+            misses = [item for item in items if item_key(item) not in results]
+            if misses:
+                computed = func(misses, *args, **kwargs) or {}
+                cache.set_many(
+                    {keys[ident]: value for ident, value in computed.items() if ident in keys and value is not None},
+                    ttl=ttl
+                )
+                results.update(computed)
+            return results
+        
+        if inspect.iscoroutinefunction(func):
+            return async_wrapper
+        else:
+            return sync_wrapper
+    
+    return decorator
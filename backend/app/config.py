@@ -21,6 +21,51 @@ class Settings(BaseSettings):
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
     REDIS_TTL: int = 300  # Default cache TTL in seconds
+    REDIS_MAX_CONNECTIONS: int = 50  # Async connection pool size per worker
+    LOCAL_CACHE_MAX_SIZE: int = 1024  # Entries kept in each worker's in-process cache
+    LOCAL_CACHE_TTL: int = 30  # Max seconds an entry is served from the in-process cache
+    CACHE_STALE_SECONDS: int = 60  # Grace window a stale cached() value is served while refreshing
+    CACHE_LOCK_TIMEOUT: int = 30  # Max seconds one worker holds a cache fill lock
+    CACHE_COMPRESSION: str = "zlib"  # Cache payload compression: zlib, lz4 or none
+    CACHE_COMPRESS_THRESHOLD: int = 1024  # Payloads smaller than this (bytes) are not compressed
+    
+    # Game catalog
+    GAME_CATALOG_DAYS_AHEAD: int = 14  # Days of schedule kept indexed in memory
+    GAME_CATALOG_REFRESH_SECONDS: int = 300  # Max age of a sport snapshot
+    
+    # Data fetching
+    DATA_FETCH_MAX_WORKERS: int = 16  # Threads for blocking collector/weather calls
+    DATA_FETCH_TIMEOUT: float = 5.0  # Per-source timeout in seconds
+    PLAYER_PROPS_TIMEOUT: float = 8.0  # Timeout for the props sub-pipeline in predictions
+    BATCH_PREDICTION_MAX_GAMES: int = 200  # Upper bound on games scored per batch request
+    
+    # Outbound HTTP
+    HTTP_TIMEOUT: float = 10.0  # Per-attempt timeout for external API calls
+    HTTP_POOL_HOSTS: int = 10  # Hosts with their own keep-alive connection pool
+    HTTP_MAX_PER_HOST: int = 8  # Concurrent requests (and pooled connections) per host
+    HTTP_MAX_RETRIES: int = 2  # Retries after connection errors, timeouts, 429s and 5xx
+    HTTP_BACKOFF_BASE: float = 0.25  # First retry backoff step in seconds (jittered, doubles per retry)
+    HTTP_BACKOFF_MAX: float = 4.0  # Longest wait between retries in seconds
+    
+    # Weather
+    WEATHER_CURRENT_TTL: int = 600  # Seconds current weather is cached per location and hour
+    WEATHER_FORECAST_TTL: int = 3 * 3600  # Seconds a location's 5-day forecast is cached (updated every 3h upstream)
+    WEATHER_PREFETCH_INTERVAL: int = 3600  # Seconds between slate forecast prefetches (0 disables)
+    WEATHER_PREFETCH_CONCURRENCY: int = 8  # Venue forecasts fetched at once during a prefetch
+    WEATHER_PREFETCH_RATE_PER_MINUTE: int = 50  # Forecast requests per minute during a prefetch (API limit is 60)
+    
+    # Simulations
+    SIMULATION_MAX_RUNS: int = 5_000_000  # Upper bound on num_simulations per request
+    SIMULATION_MAX_SEASONS: int = 1_000_000  # Upper bound on simulated league-seasons per request
+    PARLAY_SIMULATIONS: int = 20_000  # Simulated games per correlated parlay price
+    
+    # ML models
+    MODEL_DIR: str = "models"  # Root directory of trained model artifacts
+    MODEL_MIN_ACCURACY: float = 0.6  # Held-out accuracy a model needs before it is published
+    MODEL_WARMUP_SPORTS: List[str] = ["nfl", "nba", "mlb", "nhl"]  # Sports loaded at startup
+    ML_INFERENCE_BACKEND: str = "compiled"  # "compiled" (flattened trees) or "sklearn"
+    MODEL_TRAIN_WORKERS: int = 0  # Training processes (0 = one per core)
+    MODEL_TRAIN_N_JOBS: int = 1  # Tree-building threads per random forest / XGBoost model
     
     # Server
     API_HOST: str = "0.0.0.0"
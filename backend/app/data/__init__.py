@@ -1,5 +1,7 @@
 from .sports_data import SportsDataCollector
 from .odds_collector import OddsCollector
+from .game_catalog import GameCatalog, get_game_catalog
+from .game_context import GameContext
 
-__all__ = ["SportsDataCollector", "OddsCollector"]
+__all__ = ["SportsDataCollector", "OddsCollector", "GameCatalog", "get_game_catalog", "GameContext"]
 
@@ -0,0 +1,245 @@
+"""
+In-process game catalog with indexed lookups
+"""
+from typing import Callable, Dict, List, Optional, Set
+from collections import defaultdict
+from datetime import date, datetime
+import threading
+import time
+from app.config import settings
+from app.cache.redis_cache import get_cache
+
+
+SUPPORTED_SPORTS = ["nfl", "nba", "mlb", "nhl"]
+
+
+class GameCatalog:
+    """
+    Store of upcoming games keyed by game_id, with secondary indexes by
+    sport, date bucket (YYYY-MM-DD) and team.
+
+    Each sport is loaded once through the loader (normally
+    SportsDataCollector.get_upcoming_games, which reads the *_schedule
+    modules) and kept in memory. A sport is reloaded when its snapshot is
+    older than the refresh interval or the calendar day has rolled over;
+    only games that were added, removed or changed are re-indexed.
+
+    Stored game dictionaries are shared between callers and must be
+    treated as read-only.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str, int], List[Dict]],
+        days_ahead: int = 14,
+        refresh_interval: int = 300
+    ):
+        """
+        Initialize the catalog
+
+        Args:
+            loader: Callable returning the upcoming games for (sport, days_ahead)
+            days_ahead: Number of days of schedule to keep indexed
+            refresh_interval: Seconds before a sport snapshot is reloaded
+        """
+        self._loader = loader
+        self.days_ahead = days_ahead
+        self.refresh_interval = refresh_interval
+
+        self._games: Dict[str, Dict] = {}
+        self._by_sport: Dict[str, Set[str]] = defaultdict(set)
+        self._by_date: Dict[str, Set[str]] = defaultdict(set)
+        self._by_team: Dict[str, Set[str]] = defaultdict(set)
+
+        # Snapshot bookkeeping per sport
+        self._loaded_at: Dict[str, float] = {}
+        self._loaded_on: Dict[str, date] = {}
+        self._lock = threading.RLock()
+
+    def get(self, game_id: str) -> Optional[Dict]:
+        """
+        Look up a game by id
+
+        Args:
+            game_id: Unique game identifier ({sport}_{index}_{timestamp})
+
+        Returns:
+            Game dictionary or None if the game is not in the catalog
+        """
+        sport = self._sport_from_game_id(game_id)
+        self._ensure_fresh(sport)
+        return self._games.get(game_id)
+
+    def games_for_sport(self, sport: str) -> List[Dict]:
+        """Get all catalogued games for a sport, ordered by date"""
+        self._ensure_fresh(sport)
+        return self._collect(self._by_sport.get(sport, ()))
+
+    def games_on(self, day: date, sport: Optional[str] = None) -> List[Dict]:
+        """
+        Get games scheduled on a given day
+
+        Args:
+            day: Calendar day
+            sport: Optional sport filter
+
+        Returns:
+            List of game dictionaries ordered by date
+        """
+        self._ensure_all_fresh(sport)
+        game_ids = self._by_date.get(day.isoformat(), set())
+        if sport:
+            game_ids = game_ids & self._by_sport.get(sport, set())
+        return self._collect(game_ids)
+
+    def games_for_team(self, team_name: str, sport: Optional[str] = None) -> List[Dict]:
+        """
+        Get games involving a team (home or away)
+
+        Args:
+            team_name: Team name
+            sport: Optional sport filter
+
+        Returns:
+            List of game dictionaries ordered by date
+        """
+        self._ensure_all_fresh(sport)
+        game_ids = self._by_team.get(team_name, set())
+        if sport:
+            game_ids = game_ids & self._by_sport.get(sport, set())
+        return self._collect(game_ids)
+
+    def refresh(self, sport: str, force: bool = False) -> None:
+        """
+        Reload a sport from the schedule and apply the difference to the indexes
+
+        Args:
+            sport: Sport type
+            force: Reload even if the snapshot is still fresh
+        """
+        with self._lock:
+            if not force and self._is_fresh(sport):
+                return
+
+            try:
+                games = self._loader(sport, self.days_ahead) or []
+            except Exception as e:
+                print(f"Error loading {sport} games into catalog: {e}")
+                return
+
+            incoming = {game["game_id"]: game for game in games if game.get("game_id")}
+            current = set(self._by_sport.get(sport, set()))
+            stale = []
+
+            # Drop games that are no longer scheduled
+            for game_id in current - incoming.keys():
+                self._unindex(self._games.pop(game_id))
+                stale.append(game_id)
+
+            # Add new games and re-index changed ones
+            for game_id, game in incoming.items():
+                existing = self._games.get(game_id)
+                if existing == game:
+                    continue
+                if existing is not None:
+                    self._unindex(existing)
+                    stale.append(game_id)
+                self._games[game_id] = game
+                self._index(game)
+
+            self._loaded_at[sport] = time.monotonic()
+            self._loaded_on[sport] = datetime.now().date()
+
+        if stale:
+            self._invalidate_cached(stale)
+
+    def refresh_all(self, sports: Optional[List[str]] = None, force: bool = False) -> None:
+        """Refresh every supported sport (used to warm the catalog)"""
+        for sport in sports or SUPPORTED_SPORTS:
+            self.refresh(sport, force=force)
+
+    @staticmethod
+    def _invalidate_cached(game_ids: List[str]) -> None:
+        """Drop cached results for games whose details changed or were removed"""
+        cache = get_cache()
+        for game_id in game_ids:
+            cache.invalidate_namespace(f"game:{game_id}")
+
+    def _ensure_fresh(self, sport: str) -> None:
+        """Refresh a sport if its snapshot is missing or stale"""
+        if not self._is_fresh(sport):
+            self.refresh(sport)
+
+    def _ensure_all_fresh(self, sport: Optional[str] = None) -> None:
+        """Refresh one sport, or every supported sport when sport is None"""
+        for name in ([sport] if sport else SUPPORTED_SPORTS):
+            self._ensure_fresh(name)
+
+    def _is_fresh(self, sport: str) -> bool:
+        """Check whether a sport snapshot can still be served"""
+        loaded_at = self._loaded_at.get(sport)
+        if loaded_at is None:
+            return False
+        if self._loaded_on.get(sport) != datetime.now().date():
+            return False
+        return time.monotonic() - loaded_at < self.refresh_interval
+
+    def _index(self, game: Dict) -> None:
+        """Add a game to the secondary indexes"""
+        game_id = game["game_id"]
+        self._by_sport[game.get("sport", self._sport_from_game_id(game_id))].add(game_id)
+        day = self._date_bucket(game)
+        if day:
+            self._by_date[day].add(game_id)
+        for team in (game.get("home_team"), game.get("away_team")):
+            if team:
+                self._by_team[team].add(game_id)
+
+    def _unindex(self, game: Dict) -> None:
+        """Remove a game from the secondary indexes"""
+        game_id = game["game_id"]
+        self._by_sport[game.get("sport", self._sport_from_game_id(game_id))].discard(game_id)
+        day = self._date_bucket(game)
+        if day:
+            self._by_date[day].discard(game_id)
+        for team in (game.get("home_team"), game.get("away_team")):
+            if team:
+                self._by_team[team].discard(game_id)
+
+    def _collect(self, game_ids) -> List[Dict]:
+        """Resolve ids to games ordered by date"""
+        games = [self._games[game_id] for game_id in list(game_ids) if game_id in self._games]
+        return sorted(games, key=lambda game: (game.get("date", ""), game["game_id"]))
+
+    @staticmethod
+    def _date_bucket(game: Dict) -> Optional[str]:
+        """Get the YYYY-MM-DD bucket for a game"""
+        game_date = game.get("date")
+        return game_date[:10] if game_date else None
+
+    @staticmethod
+    def _sport_from_game_id(game_id: str) -> str:
+        """Parse the sport prefix of a game_id"""
+        parts = game_id.split('_')
+        return parts[0] if parts and parts[0] else "nfl"
+
+
+# Global catalog instance
+_catalog_instance: Optional[GameCatalog] = None
+_catalog_lock = threading.Lock()
+
+
+def get_game_catalog() -> GameCatalog:
+    """Get or create the process-wide game catalog"""
+    global _catalog_instance
+    if _catalog_instance is None:
+        with _catalog_lock:
+            if _catalog_instance is None:
+                # Imported here to avoid a circular import with sports_data
+                from app.services import get_services
+                _catalog_instance = GameCatalog(
+                    loader=get_services().data_collector.get_upcoming_games,
+                    days_ahead=settings.GAME_CATALOG_DAYS_AHEAD,
+                    refresh_interval=settings.GAME_CATALOG_REFRESH_SECONDS
+                )
+    return _catalog_instance
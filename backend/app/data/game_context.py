@@ -0,0 +1,244 @@
+"""
+Request-scoped game context that loads each game input at most once
+"""
+from typing import Any, Callable, Dict, Hashable, List, Optional, TYPE_CHECKING
+from datetime import datetime
+import asyncio
+import threading
+from app.data.sports_data import SportsDataCollector
+from app.data.injury_data import InjuryDataCollector
+from app.models.injury_analyzer import PlayerInjury
+from app.services import get_services
+from app.utils.concurrency import run_blocking
+
+if TYPE_CHECKING:
+    # weather_analyzer imports app.data, which imports this module
+    from app.models.weather_analyzer import WeatherAnalyzer
+
+
+# Marks a source that did not load in time during prefetch
+_MISSING = object()
+
+
+class GameContext:
+    """
+    Lazily loads and memoizes everything a request needs to know about a game
+
+    The prediction, player props and simulation code paths all read the game,
+    team stats, injuries, weather and players through the same context, so a
+    request fetches each of them exactly once no matter how many code paths
+    consume it.
+
+    Values are loaded under a per-key lock, so the context can be filled
+    concurrently from the data fetch pool (see prefetch) while other code
+    paths read it: a reader waits for an in-flight load instead of repeating it.
+    """
+
+    def __init__(
+        self,
+        game_id: str,
+        data_collector: Optional[SportsDataCollector] = None,
+        injury_collector: Optional[InjuryDataCollector] = None,
+        weather_analyzer: Optional["WeatherAnalyzer"] = None
+    ):
+        """
+        Initialize the context
+
+        Args:
+            game_id: Unique game identifier
+            data_collector: Collector for games, team stats and players
+            injury_collector: Collector for injury reports
+            weather_analyzer: Weather source for the game location
+                (each defaults to the process-wide instance from get_services)
+        """
+        self.game_id = game_id
+        services = get_services()
+        self.data_collector = data_collector or services.data_collector
+        self.injury_collector = injury_collector or services.injury_collector
+        self.weather_analyzer = weather_analyzer or services.weather_analyzer
+        self._values: Dict[Hashable, Any] = {}
+        self._key_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _load(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the memoized value for key, calling loader on first use"""
+        if key in self._values:
+            return self._values[key]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            if key not in self._values:
+                value = loader()
+                # prefetch may have published a default after timing out; the
+                # first value published wins so every reader sees the same one
+                return self._values.setdefault(key, value)
+        return self._values[key]
+
+    async def prefetch(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Load the independent game inputs concurrently on the data fetch pool
+
+        Team stats, injuries, players and weather are fetched in parallel, so
+        the wait is bounded by the slowest source rather than their sum. A
+        source that fails or exceeds the timeout is replaced by an empty
+        default so the request can continue with partial data.
+
+        Args:
+            timeout: Per-source timeout in seconds
+
+        Returns:
+            Names of the sources that fell back to defaults
+        """
+        if not self.game:
+            return []
+
+        sources = {
+            "home_stats": (("team_stats", self.home_team), lambda: self.home_stats, {}),
+            "away_stats": (("team_stats", self.away_team), lambda: self.away_stats, {}),
+            "home_injuries": (("team_injuries", self.home_team), lambda: self.home_injuries, []),
+            "away_injuries": (("team_injuries", self.away_team), lambda: self.away_injuries, []),
+            "home_players": (("team_players", self.home_team), lambda: self.home_players, []),
+            "away_players": (("team_players", self.away_team), lambda: self.away_players, []),
+            "weather": ("weather", lambda: self.weather, None),
+        }
+
+        results = await asyncio.gather(*(
+            run_blocking(getter, timeout=timeout, fallback=_MISSING, label=f"{name} for {self.game_id}")
+            for name, (_, getter, _) in sources.items()
+        ))
+
+        missing = []
+        for (name, (key, _, default)), result in zip(sources.items(), results):
+            if result is _MISSING:
+                # Readers see the default instead of waiting on the slow load
+                self._values.setdefault(key, default)
+                missing.append(name)
+        return missing
+
+    @property
+    def game(self) -> Optional[Dict]:
+        """Game details, or None if the game does not exist"""
+        return self._load("game", lambda: self.data_collector.get_game_details(self.game_id))
+
+    @property
+    def sport(self) -> str:
+        game = self.game
+        return game.get("sport", "nfl") if game else "nfl"
+
+    @property
+    def home_team(self) -> str:
+        return self.game["home_team"]
+
+    @property
+    def away_team(self) -> str:
+        return self.game["away_team"]
+
+    def team_stats(self, team_name: str) -> Dict:
+        """Team statistics for either team in the game"""
+        return self._load(
+            ("team_stats", team_name),
+            lambda: self.data_collector.get_team_stats(team_name, self.sport)
+        )
+
+    @property
+    def home_stats(self) -> Dict:
+        return self.team_stats(self.home_team)
+
+    @property
+    def away_stats(self) -> Dict:
+        return self.team_stats(self.away_team)
+
+    def team_injuries(self, team_name: str) -> List[PlayerInjury]:
+        """Current injuries for either team in the game"""
+        return self._load(
+            ("team_injuries", team_name),
+            lambda: self.injury_collector.get_team_injuries(team_name, self.sport)
+        )
+
+    @property
+    def home_injuries(self) -> List[PlayerInjury]:
+        return self.team_injuries(self.home_team)
+
+    @property
+    def away_injuries(self) -> List[PlayerInjury]:
+        return self.team_injuries(self.away_team)
+
+    def team_players(self, team_name: str) -> List[Dict]:
+        """Key players for either team in the game"""
+        return self._load(
+            ("team_players", team_name),
+            lambda: self.data_collector.get_team_players(team_name, self.sport)
+        )
+
+    @property
+    def home_players(self) -> List[Dict]:
+        return self.team_players(self.home_team)
+
+    @property
+    def away_players(self) -> List[Dict]:
+        return self.team_players(self.away_team)
+
+    def player_stats(self, player_name: str) -> Dict:
+        """Season statistics for a player"""
+        return self._load(
+            ("player_stats", player_name),
+            lambda: self.data_collector.get_player_stats(player_name, self.sport)
+        )
+
+    @property
+    def weather(self) -> Optional[Dict]:
+        """Weather for the game location and date, or None if unavailable"""
+        return self._load("weather", self._load_weather)
+
+    @property
+    def game_date(self) -> Optional[datetime]:
+        """Parsed game date, or None if the game has no usable date"""
+        game = self.game
+        if not game or "date" not in game:
+            return None
+        try:
+            return datetime.fromisoformat(game["date"].replace("Z", "+00:00"))
+        except ValueError:
+            try:
+                return datetime.fromisoformat(game["date"])
+            except ValueError:
+                return None
+
+    def _load_weather(self) -> Optional[Dict]:
+        """Fetch weather for the game location and date"""
+        game = self.game
+        if not game or "location" not in game:
+            return None
+
+        location = game["location"]
+        game_date = self.game_date
+        weather_data = None
+
+        # Log which location is being used for weather
+        location_str = f"{location.get('city', 'Unknown')}, {location.get('state', '')}"
+        if "lat" in location and "lon" in location:
+            print(f"Fetching weather for game at {location_str} (coordinates: {location['lat']}, {location['lon']})")
+            weather_data = self.weather_analyzer.get_weather_for_game_date(
+                location.get("city", ""),
+                location.get("state"),
+                location.get("country", "US"),
+                game_date,
+                location["lat"],
+                location["lon"]
+            )
+        elif "city" in location:
+            print(f"Fetching weather for game at {location_str}")
+            weather_data = self.weather_analyzer.get_weather_for_game_date(
+                location["city"],
+                location.get("state"),
+                location.get("country", "US"),
+                game_date
+            )
+
+        # Add location info to weather data if not present
+        if weather_data and "location" not in weather_data:
+            weather_data["location"] = location_str
+
+        return weather_data
@@ -2,21 +2,26 @@
 Betting odds collection from bet365, DraftKings, and TheScore Bet
 """
 from typing import Dict, List, Optional
-import requests
-from bs4 import BeautifulSoup
 from app.config import settings
+from app.utils.http_client import HttpClient, get_http_client
 
 
 class OddsCollector:
     """Collects betting odds from multiple platforms"""
     
-    def __init__(self):
+    def __init__(self, http_client: Optional[HttpClient] = None):
+        """
+        Initialize the collector
+        
+        Args:
+            http_client: Pooled HTTP client for the odds APIs (defaults to the process-wide one)
+        """
         # Note: Real odds APIs typically require:
         # - API keys
         # - Legal agreements
-        # - Rate limiting
+        # - Rate limiting (HttpClient bounds concurrent requests per host)
         # - Some platforms may require web scraping (check ToS)
-        pass
+        self.http_client = http_client or get_http_client()
     
     def get_odds_for_game(
         self,
@@ -3,18 +3,27 @@ Sports data collection from various APIs
 """
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
-import requests
 from app.config import settings
+from app.data.game_catalog import get_game_catalog
+from app.utils.http_client import HttpClient, get_http_client
 
 
 class SportsDataCollector:
     """Collects sports data from APIs"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[HttpClient] = None):
+        """
+        Initialize the collector
+        
+        Args:
+            api_key: Sports API key (defaults to settings.SPORTS_API_KEY)
+            http_client: Pooled HTTP client for the external APIs (defaults to the process-wide one)
+        """
         self.api_key = api_key or settings.SPORTS_API_KEY
         # Using TheSportsDB (free, no API key needed) and API-Football as fallback
         self.thesportsdb_base = "https://www.thesportsdb.com/api/v1/json/3"
         self.api_football_base = "https://v3.football.api-sports.io"
+        self.http_client = http_client or get_http_client()
     
     def get_upcoming_games(
         self,
@@ -377,18 +386,10 @@ class SportsDataCollector:
         Returns:
             Game details dictionary
         """
-        # Get the actual games list to ensure consistency
-        # Parse game_id to get sport
-        parts = game_id.split('_')
-        sport = parts[0] if parts else "nfl"
-        
-        # Get all games for this sport
-        games_list = self.get_upcoming_games(sport, days_ahead=14)
-        
-        # Find the game by matching game_id
-        for game in games_list:
-            if game["game_id"] == game_id:
-                return game
+        # Indexed lookup against the same schedule get_upcoming_games serves
+        game = get_game_catalog().get(game_id)
+        if game:
+            return game
         
         # Fallback to old method if not found
         return self._get_mock_game_details(game_id)
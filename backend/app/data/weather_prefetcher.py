@@ -0,0 +1,215 @@
+"""
+Background prefetch of venue forecasts for the upcoming schedule
+"""
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import asyncio
+import time
+from app.config import settings
+from app.cache.redis_cache import get_async_cache
+from app.data.city_coordinates import get_city_coordinates
+from app.data.game_catalog import GameCatalog, SUPPORTED_SPORTS
+from app.models.weather_analyzer import WeatherAnalyzer, round_coordinates
+from app.utils.concurrency import run_blocking
+
+
+# Sports played indoors everywhere
+INDOOR_SPORTS = {"nba", "nhl"}
+
+# Home teams with a fixed roof. Retractable roofs are left out: they are
+# open in good weather, so their forecast still matters.
+DOME_TEAMS = {
+    "nfl": {
+        "Detroit Lions",
+        "Minnesota Vikings",
+        "New Orleans Saints",
+        "Las Vegas Raiders",
+        "Los Angeles Rams",
+        "Los Angeles Chargers",
+    },
+    "mlb": {
+        "Tampa Bay Rays",
+    },
+}
+
+# OpenWeatherMap forecasts cover the next 5 days
+FORECAST_HORIZON = timedelta(days=5)
+
+# Name of the cross-worker lock that lets one worker prefetch per interval
+PREFETCH_LOCK = "weather_prefetch"
+
+
+def is_outdoor(game: Dict) -> bool:
+    """Check whether weather can affect a game"""
+    sport = game.get("sport", "nfl")
+    if sport in INDOOR_SPORTS:
+        return False
+    return game.get("home_team") not in DOME_TEAMS.get(sport, set())
+
+
+def _game_time(game: Dict) -> Optional[datetime]:
+    """Parse a game's date as an aware datetime (naive dates are local time)"""
+    try:
+        game_time = datetime.fromisoformat(game.get("date", "").replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return game_time if game_time.tzinfo else game_time.astimezone()
+
+
+def _venue_coordinates(game: Dict) -> Optional[Tuple[float, float]]:
+    """Rounded coordinates of a game's venue, or None if unknown"""
+    location = game.get("location") or {}
+    if "lat" in location and "lon" in location:
+        return round_coordinates(location["lat"], location["lon"])
+    coordinates = get_city_coordinates(location["city"], location.get("state")) if location.get("city") else None
+    return round_coordinates(*coordinates) if coordinates else None
+
+
+class _RateLimiter:
+    """Spaces calls at least 60 / per_minute seconds apart"""
+
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class WeatherPrefetcher:
+    """
+    Fills the weather cache with the forecast of every upcoming outdoor venue
+
+    Games within the forecast horizon are taken from the game catalog,
+    indoor games are skipped, and venues are deduplicated by their rounded
+    coordinates, so each location's 5-day forecast is fetched once per run
+    no matter how many games it hosts. Fetches run concurrently on the async
+    HTTP client, bounded by a concurrency limit and spaced to stay under
+    the API's per-minute rate limit.
+
+    Run periodically (run_periodically) at an interval shorter than
+    WEATHER_FORECAST_TTL, so game weather lookups always hit the cache.
+    """
+
+    def __init__(
+        self,
+        weather_analyzer: WeatherAnalyzer,
+        catalog: GameCatalog,
+        concurrency: Optional[int] = None,
+        rate_per_minute: Optional[float] = None
+    ):
+        """
+        Initialize the prefetcher
+
+        Args:
+            weather_analyzer: Analyzer whose cache is filled
+            catalog: Source of the upcoming schedule
+            concurrency: Forecasts fetched at once (defaults to settings.WEATHER_PREFETCH_CONCURRENCY)
+            rate_per_minute: Maximum forecast requests per minute
+                (defaults to settings.WEATHER_PREFETCH_RATE_PER_MINUTE)
+        """
+        self.weather_analyzer = weather_analyzer
+        self.catalog = catalog
+        self.concurrency = concurrency or settings.WEATHER_PREFETCH_CONCURRENCY
+        self.rate_per_minute = rate_per_minute or settings.WEATHER_PREFETCH_RATE_PER_MINUTE
+
+    def venues(self, games: List[Dict], now: Optional[datetime] = None) -> Dict[Tuple[float, float], List[str]]:
+        """
+        Outdoor venues with a game inside the forecast horizon
+
+        Args:
+            games: Game dictionaries
+            now: Current time (defaults to now)
+
+        Returns:
+            Game IDs by rounded (lat, lon) of their venue
+        """
+        now = now or datetime.now(timezone.utc)
+        # Games that started recently still use the forecast slot they started in
+        start, end = now - timedelta(hours=3), now + FORECAST_HORIZON
+
+        venues: Dict[Tuple[float, float], List[str]] = {}
+        for game in games:
+            game_time = _game_time(game)
+            if game_time is None or not start <= game_time <= end or not is_outdoor(game):
+                continue
+            coordinates = _venue_coordinates(game)
+            if coordinates:
+                venues.setdefault(coordinates, []).append(game["game_id"])
+        return venues
+
+    async def prefetch(self, sports: Optional[List[str]] = None) -> Dict:
+        """
+        Fetch and cache the forecast of every upcoming outdoor venue once
+
+        Args:
+            sports: Sports to cover (defaults to every supported sport)
+
+        Returns:
+            Dictionary with the number of games, venues, fetched and failed
+            forecasts and the elapsed seconds
+        """
+        start = time.perf_counter()
+        sports = [sport for sport in (sports or SUPPORTED_SPORTS) if sport not in INDOOR_SPORTS]
+
+        games = []
+        for sport in sports:
+            # The catalog may need to load the schedule, which blocks
+            games.extend(await run_blocking(self.catalog.games_for_sport, sport, fallback=[], label=f"{sport} schedule"))
+        venues = self.venues(games)
+
+        limiter = _RateLimiter(self.rate_per_minute)
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def fetch(lat: float, lon: float) -> bool:
+            async with semaphore:
+                await limiter.wait()
+                return await self.weather_analyzer.refresh_forecast_async(lat, lon)
+
+        results = await asyncio.gather(*(fetch(lat, lon) for lat, lon in venues))
+        fetched = sum(1 for ok in results if ok)
+        return {
+            "games": sum(len(game_ids) for game_ids in venues.values()),
+            "venues": len(venues),
+            "fetched": fetched,
+            "failed": len(venues) - fetched,
+            "seconds": round(time.perf_counter() - start, 2)
+        }
+
+    async def run_periodically(self, interval: float, after: Optional[asyncio.Future] = None) -> None:
+        """
+        Prefetch every interval seconds until cancelled
+
+        Each run takes a cross-worker lock that expires shortly before the
+        next run, so a deployment with many workers prefetches once per
+        interval instead of once per worker.
+
+        Args:
+            interval: Seconds between runs
+            after: Task to wait for before the first run (e.g. the startup warm-up)
+        """
+        if not self.weather_analyzer.api_key:
+            print("Weather prefetch disabled: no WEATHER_API_KEY")
+            return
+        if after is not None:
+            await asyncio.wait([after])
+
+        while True:
+            try:
+                cache = get_async_cache()
+                if not await cache.is_available():
+                    print("Weather prefetch skipped: cache unavailable")
+                elif await cache.acquire_lock(PREFETCH_LOCK, timeout=max(interval * 0.9, 1)):
+                    # The lock is left to expire, marking this interval as done
+                    print(f"Weather prefetch: {await self.prefetch()}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"Weather prefetch failed: {e}")
+            await asyncio.sleep(interval)
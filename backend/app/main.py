@@ -1,36 +1,100 @@
 """
 Main FastAPI application for Sports Analytics & Betting Predictions
 """
+from contextlib import asynccontextmanager
+import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.routers import games, predictions, odds, bets
+from fastapi.responses import JSONResponse
 from app.config import settings
+from app.services import get_services
+from app.startup import get_startup_state, log_import_times, timed_import, warm_up
 
-app = FastAPI(
-    title="Sports Analytics API",
-    description="Professional sports betting analytics with weather integration",
-    version="1.0.0"
-)
+# Routers are imported one by one so slow imports show up in the startup profile
+games = timed_import("app.routers.games")
+predictions = timed_import("app.routers.predictions")
+odds = timed_import("app.routers.odds")
+bets = timed_import("app.routers.bets")
 
-# Try to initialize database (optional)
+# ML predictions router (optional)
 try:
+    ml_predictions = timed_import("app.routers.ml_predictions")
+except Exception as e:
+    ml_predictions = None
+    print(f"ML predictions router skipped: {e}")
+
+
+def _init_database():
+    """Create database tables (optional)"""
     from app.database import init_db
     init_db()
-except Exception as e:
-    print(f"Database initialization skipped: {e}")
 
-# Try to initialize Redis cache (optional)
-try:
+
+def _init_cache():
+    """Connect the Redis cache (optional)"""
     from app.cache.redis_cache import get_cache
     cache = get_cache()
-    if cache.enabled:
-        try:
-            from app.monitoring.prometheus_metrics import set_redis_status
-            set_redis_status(True)
-        except:
-            pass
-except Exception as e:
-    print(f"Redis cache initialization skipped: {e}")
+    try:
+        from app.monitoring.prometheus_metrics import set_redis_status
+        set_redis_status(cache.enabled)
+    except Exception:
+        pass
+    return "connected" if cache.enabled else "disabled"
+
+
+def _warm_game_catalog():
+    """Load the upcoming schedule into the in-memory game index"""
+    get_services().game_catalog.refresh_all()
+
+
+def _warmup_phases():
+    """Warm-up steps run in the background after the server starts accepting connections"""
+    phases = [
+        ("database", _init_database, ()),
+        ("cache", _init_cache, ()),
+        ("game_catalog", _warm_game_catalog, ()),
+    ]
+    if ml_predictions is not None:
+        # Load trained model artifacts before serving requests (serving never trains)
+        phases.append(("ml_models", get_services().ml_predictor.warm_up, (settings.MODEL_WARMUP_SPORTS,)))
+    return phases
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start warm-up and background jobs, and release shared clients on shutdown"""
+    log_import_times()
+    warmup_task = asyncio.create_task(warm_up(_warmup_phases()))
+    tasks = [warmup_task]
+    if settings.WEATHER_PREFETCH_INTERVAL > 0:
+        # Keep slate venue forecasts cached, starting once the schedule is loaded
+        prefetcher = get_services().weather_prefetcher
+        tasks.append(asyncio.create_task(
+            prefetcher.run_periodically(settings.WEATHER_PREFETCH_INTERVAL, after=warmup_task)
+        ))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        get_services().close()
+        from app.cache.redis_cache import close_async_cache
+        from app.utils.http_client import close_async_http_client
+        await close_async_cache()
+        await close_async_http_client()
+
+
+app = FastAPI(
+    title="Sports Analytics API",
+    description="Professional sports betting analytics with weather integration",
+    version="1.0.0",
+    lifespan=lifespan
+)
 
 # CORS middleware
 app.add_middleware(
@@ -55,11 +119,8 @@ app.include_router(odds.router, prefix="/api/odds", tags=["odds"])
 app.include_router(bets.router, prefix="/api/bets", tags=["bets"])
 
 # ML predictions router (optional)
-try:
-    from app.routers import ml_predictions
+if ml_predictions is not None:
     app.include_router(ml_predictions.router, prefix="/api/ml-predictions", tags=["ml-predictions"])
-except Exception as e:
-    print(f"ML predictions router skipped: {e}")
 
 # Prometheus metrics endpoint (optional)
 try:
@@ -88,5 +149,9 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy"}
+    """Readiness probe: 503 until the warm-up phase has finished"""
+    state = get_startup_state()
+    if not state.ready:
+        return JSONResponse(status_code=503, content={"status": "starting", "startup": state.to_dict()})
+    return {"status": "healthy", "startup": state.to_dict()}
 
@@ -1,5 +1,9 @@
 from .betting_models import BettingAnalyzer, KellyCriterion
 from .prediction_models import GamePredictor, PlayerPropPredictor
+from .parlay_pricing import ParlayPricer
+from .parlay_optimizer import CandidateLeg, ParlayOptimizer
+from .parlay_correlation import CorrelatedParlayPricer
+from .simulation_engine import MonteCarloSimulator, SeasonSimulator
 from .weather_analyzer import WeatherAnalyzer
 
 __all__ = [
@@ -7,6 +11,12 @@ __all__ = [
     "KellyCriterion",
     "GamePredictor",
     "PlayerPropPredictor",
+    "ParlayPricer",
+    "CandidateLeg",
+    "ParlayOptimizer",
+    "CorrelatedParlayPricer",
+    "MonteCarloSimulator",
+    "SeasonSimulator",
     "WeatherAnalyzer"
 ]
 
@@ -3,40 +3,98 @@ Advanced ML models for sports predictions using scikit-learn and XGBoost
 """
 from typing import Dict, List, Optional, Tuple
 import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-import xgboost as xgb
-import pickle
-import os
-from datetime import datetime
+import threading
 import warnings
+from app.models.model_registry import ModelRegistry
+from app.models.compiled_trees import CompiledTreeEnsemble
+from app.config import settings
 warnings.filterwarnings('ignore')
 
 
+# Model input layout; _feature_row produces values in this order
+FEATURE_NAMES = [
+    "home_win_rate", "home_points_per_game", "home_points_allowed", "home_recent_form",
+    "home_home_wins", "home_home_losses",
+    "away_win_rate", "away_points_per_game", "away_points_allowed", "away_recent_form",
+    "away_away_wins", "away_away_losses",
+    "win_rate_diff", "home_offense_vs_away_defense", "away_offense_vs_home_defense", "recent_form_diff",
+    "temperature", "wind_speed", "precipitation", "is_cold", "is_windy", "has_precipitation",
+    "home_key_players_out", "home_total_injuries", "away_key_players_out", "away_total_injuries",
+    "home_advantage",
+]
+
+# Models averaged by model_type="ensemble"
+ENSEMBLE_MEMBERS = ['random_forest', 'gradient_boosting', 'xgboost']
+
+# Largest probability difference allowed between compiled and library inference
+# (XGBoost sums leaves in float32)
+COMPILED_PARITY_TOLERANCE = 1e-5
+
+# Registry artifact holding the compiled ensemble as plain arrays
+COMPILED_ARTIFACT = "compiled"
+
+
+def compile_ensemble(models: Dict, scaler=None) -> Optional[CompiledTreeEnsemble]:
+    """
+    Compile fitted ensemble members and check them against the libraries
+
+    Args:
+        models: Fitted tree models by model type
+        scaler: Scaler shared by the models
+
+    Returns:
+        The compiled ensemble, or None if a model cannot be compiled or the
+        compiled predictions differ from the library ones on a sample of inputs
+    """
+    try:
+        compiled = CompiledTreeEnsemble(models, scaler)
+        # Inputs spread around the training distribution
+        rng = np.random.default_rng(0)
+        sample = rng.standard_normal((256, len(FEATURE_NAMES))) * 2
+        if scaler is not None:
+            sample = scaler.mean_ + sample * scaler.scale_
+        error = compiled.parity_error(models, sample, scaler)
+    except Exception as e:
+        print(f"Could not compile models: {e}")
+        return None
+    
+    if error > COMPILED_PARITY_TOLERANCE:
+        print(f"Compiled models differ from the library predictions by {error:.2e}; not using them")
+        return None
+    return compiled
+
+
 class AdvancedMLPredictor:
     """
     Advanced ML-based predictor using ensemble methods
+    
+    Serving only loads the current ModelRegistry versions written by the
+    offline training pipeline (app.models.model_trainer, run via
+    train_models.py); it never trains.
+    A sport without trained artifacts uses the heuristic fallback.
+    
+    With the compiled backend only the memory-mapped compiled tree arrays
+    are loaded up front; the sklearn/XGBoost models are loaded on first use
+    of the library path (rows with missing values, the logistic model).
     """
     
-    def __init__(self, model_dir: str = "models"):
-        self.model_dir = model_dir
-        os.makedirs(model_dir, exist_ok=True)
+    def __init__(self, model_dir: Optional[str] = None):
+        self.model_dir = model_dir or settings.MODEL_DIR
+        self.registry = ModelRegistry(self.model_dir)
         
-        # Initialize models
+        # Loaded models
         self.models = {}
         self.scalers = {}
         self.feature_names = {}
-        
-        # Model types
-        self.model_types = {
-            'random_forest': RandomForestClassifier(n_estimators=100, random_state=42, max_depth=10),
-            'gradient_boosting': GradientBoostingClassifier(n_estimators=100, random_state=42, max_depth=5),
-            'xgboost': xgb.XGBClassifier(n_estimators=100, random_state=42, max_depth=5, learning_rate=0.1),
-            'logistic': LogisticRegression(random_state=42, max_iter=1000)
-        }
+        self.model_versions: Dict[str, str] = {}
+        # Model types of each sport's loaded version
+        self.available_models: Dict[str, List[str]] = {}
+        self._load_attempted = set()
+        self._load_lock = threading.Lock()
+        
+        # Compiled tree backends by sport (see _compile)
+        self.inference_backend = settings.ML_INFERENCE_BACKEND
+        self.compiled: Dict[str, CompiledTreeEnsemble] = {}
     
     def _extract_features(
         self,
@@ -55,8 +113,32 @@ class AdvancedMLPredictor:
             injury_data: Optional injury data
         
         Returns:
-            Feature vector as numpy array
+            Feature vector as numpy array of shape (1, len(FEATURE_NAMES))
         """
+        return np.array(
+            self._feature_row(home_stats, away_stats, weather_data, injury_data), dtype=np.float64
+        ).reshape(1, -1)
+    
+    def _feature_matrix(self, games: List[Dict]) -> np.ndarray:
+        """Build one (games x features) matrix for a batch of games"""
+        return np.array([
+            self._feature_row(
+                game["home_stats"],
+                game["away_stats"],
+                game.get("weather_data"),
+                game.get("injury_data")
+            )
+            for game in games
+        ], dtype=np.float64).reshape(len(games), len(FEATURE_NAMES))
+    
+    def _feature_row(
+        self,
+        home_stats: Dict,
+        away_stats: Dict,
+        weather_data: Optional[Dict] = None,
+        injury_data: Optional[Dict] = None
+    ) -> List[float]:
+        """Feature values for one game, in FEATURE_NAMES order"""
         features = []
         
         # Team strength features
@@ -105,14 +187,14 @@ class AdvancedMLPredictor:
         
         # Injury features (if available)
         if injury_data:
-            home_injuries = injury_data.get("home_injuries", {})
-            away_injuries = injury_data.get("away_injuries", {})
+            home_key_out, home_total = self._injury_counts(injury_data.get("home_injuries"))
+            away_key_out, away_total = self._injury_counts(injury_data.get("away_injuries"))
             
             features.extend([
-                home_injuries.get("key_players_out", 0) / 5.0,  # Normalized
-                home_injuries.get("total_injuries", 0) / 10.0,  # Normalized
-                away_injuries.get("key_players_out", 0) / 5.0,
-                away_injuries.get("total_injuries", 0) / 10.0,
+                home_key_out / 5.0,  # Normalized
+                home_total / 10.0,  # Normalized
+                away_key_out / 5.0,
+                away_total / 10.0,
             ])
         else:
             features.extend([0.0, 0.0, 0.0, 0.0])
@@ -120,7 +202,32 @@ class AdvancedMLPredictor:
         # Home advantage
         features.append(0.03)  # Standard home advantage
         
-        return np.array(features).reshape(1, -1)
+        return features
+    
+    @staticmethod
+    def _injury_counts(injuries) -> Tuple[int, int]:
+        """
+        Count (key players out, total injuries) for one team
+        
+        Accepts either a summary dict with key_players_out/total_injuries or
+        the list of PlayerInjury reports from InjuryDataCollector, where out
+        and doubtful players count as out.
+        """
+        if not injuries:
+            return 0, 0
+        if isinstance(injuries, dict):
+            return injuries.get("key_players_out", 0), injuries.get("total_injuries", 0)
+        
+        key_out = 0
+        for injury in injuries:
+            status = injury.get("status") if isinstance(injury, dict) else getattr(injury, "status", None)
+            status = getattr(status, "code", status)
+            if isinstance(status, (list, tuple)):
+                # Serialized InjuryStatus values are (code, impact) pairs
+                status = status[0]
+            if status in ("out", "doubtful"):
+                key_out += 1
+        return key_out, len(injuries)
     
     def predict_game_ml(
         self,
@@ -149,117 +256,97 @@ class AdvancedMLPredictor:
         Returns:
             Prediction dictionary with probabilities and confidence
         """
-        # Extract features
-        features = self._extract_features(home_stats, away_stats, weather_data, injury_data)
-        
-        # Load or create model for this sport
-        model_key = f"{sport}_{model_type}"
-        
-        if model_key not in self.models:
-            # Train a model if it doesn't exist (using synthetic data for now)
-            self._train_model(sport, model_type)
-        
-        # Get predictions
-        if model_type == "ensemble":
-            # Use ensemble of all models
-            predictions = []
-            for mt in ['random_forest', 'gradient_boosting', 'xgboost']:
-                mt_key = f"{sport}_{mt}"
-                if mt_key in self.models:
-                    model = self.models[mt_key]
-                    scaler = self.scalers.get(mt_key)
-                    
-                    if scaler:
-                        features_scaled = scaler.transform(features)
-                    else:
-                        features_scaled = features
-                    
-                    prob = model.predict_proba(features_scaled)[0]
-                    predictions.append(prob[1])  # Probability of home win
-            
-            if predictions:
-                home_win_prob = np.mean(predictions)
-            else:
-                # Fallback to simple calculation
-                home_win_prob = self._fallback_prediction(home_stats, away_stats)
-        else:
-            model = self.models[model_key]
-            scaler = self.scalers.get(model_key)
-            
-            if scaler:
-                features_scaled = scaler.transform(features)
-            else:
-                features_scaled = features
-            
-            prob = model.predict_proba(features_scaled)[0]
-            home_win_prob = prob[1]  # Probability of home win
-        
-        # Calculate confidence based on prediction strength
-        confidence = abs(home_win_prob - 0.5) * 2  # Convert to 0-1 scale
-        
-        # Determine winner
-        predicted_winner = home_team if home_win_prob > 0.5 else away_team
-        
-        return {
-            "predicted_winner": predicted_winner,
-            "home_win_probability": float(home_win_prob),
-            "away_win_probability": float(1 - home_win_prob),
-            "confidence": float(confidence),
-            "model_type": model_type,
-            "features_used": len(features[0])
-        }
+        return self.predict_games_ml([{
+            "home_team": home_team,
+            "away_team": away_team,
+            "home_stats": home_stats,
+            "away_stats": away_stats,
+            "weather_data": weather_data,
+            "injury_data": injury_data
+        }], sport=sport, model_type=model_type)[0]
     
-    def _train_model(self, sport: str, model_type: str):
-        """
-        Train a model for a specific sport (using synthetic data)
-        In production, this would use historical game data
+    def predict_games_ml(
+        self,
+        games: List[Dict],
+        sport: str = "nfl",
+        model_type: str = "ensemble"
+    ) -> List[Dict]:
         """
-        # Generate synthetic training data
-        # In production, load from database
-        n_samples = 1000
-        n_features = 28  # Match feature count
-        
-        X = np.random.rand(n_samples, n_features)
-        # Create realistic target distribution
-        y = (X[:, 0] + X[:, 1] - X[:, 6] - X[:, 7] + np.random.rand(n_samples) * 0.2 > 0).astype(int)
-        
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-        
-        # Scale features
-        scaler = StandardScaler()
-        X_train_scaled = scaler.fit_transform(X_train)
-        X_test_scaled = scaler.transform(X_test)
-        
-        # Train model
-        if model_type == "ensemble":
-            # Train all models
-            for mt in ['random_forest', 'gradient_boosting', 'xgboost']:
-                self._train_single_model(sport, mt, X_train_scaled, y_train, scaler)
-        else:
-            self._train_single_model(sport, model_type, X_train_scaled, y_train, scaler)
-    
-    def _train_single_model(self, sport: str, model_type: str, X_train: np.ndarray, y_train: np.ndarray, scaler: StandardScaler):
-        """Train a single model"""
-        model_key = f"{sport}_{model_type}"
+        Predict many games of one sport with a single call per model
         
-        if model_type not in self.model_types:
-            return
+        All games go into one feature matrix, which each scaler transforms
+        once and each model scores with one predict_proba call, so the model
+        call overhead is paid per model rather than per game.
         
-        model = self.model_types[model_type]
-        model.fit(X_train, y_train)
+        Args:
+            games: Game dictionaries with home_team, away_team, home_stats,
+                away_stats and optional weather_data and injury_data
+            sport: Sport type
+            model_type: Type of model to use ('random_forest', 'gradient_boosting', 'xgboost', 'logistic', 'ensemble')
         
-        self.models[model_key] = model
-        self.scalers[model_key] = scaler
+        Returns:
+            Prediction dictionaries in the order of games
+        """
+        if not games:
+            return []
         
-        # Save model
-        model_path = os.path.join(self.model_dir, f"{model_key}.pkl")
-        scaler_path = os.path.join(self.model_dir, f"{model_key}_scaler.pkl")
+        # Extract features
+        features = self._feature_matrix(games)
+        
+        # Load this sport's trained models on first use
+        self._ensure_loaded(sport)
+        member_types = ENSEMBLE_MEMBERS if model_type == "ensemble" else [model_type]
+        
+        compiled = self.compiled.get(sport)
+        predictions = []
+        if (
+            compiled is not None
+            and all(mt in compiled.model_types for mt in member_types)
+            and not np.isnan(features).any()
+        ):
+            # One pass through every tree of every member, scaler inlined
+            member_probs = compiled.predict_proba(features)
+            predictions = [member_probs[compiled.model_types.index(mt)] for mt in member_types]
+        else:
+            self._ensure_library_models(sport, member_types)
+            # Get predictions, scaling the matrix once per distinct scaler
+            scaled_by_scaler = {}
+            for mt in member_types:
+                mt_key = f"{sport}_{mt}"
+                if mt_key not in self.models:
+                    continue
+                scaler = self.scalers.get(mt_key)
+                
+                if scaler is None:
+                    features_scaled = features
+                else:
+                    if id(scaler) not in scaled_by_scaler:
+                        scaled_by_scaler[id(scaler)] = scaler.transform(features)
+                    features_scaled = scaled_by_scaler[id(scaler)]
+                
+                predictions.append(self.models[mt_key].predict_proba(features_scaled)[:, 1])  # Probability of home win
+        
+        if predictions:
+            home_win_probs = np.mean(predictions, axis=0)
+        else:
+            # Fallback to simple calculation
+            home_win_probs = np.array([
+                self._fallback_prediction(game["home_stats"], game["away_stats"]) for game in games
+            ])
         
-        with open(model_path, 'wb') as f:
-            pickle.dump(model, f)
-        with open(scaler_path, 'wb') as f:
-            pickle.dump(scaler, f)
+        results = []
+        for game, home_win_prob in zip(games, home_win_probs.tolist()):
+            results.append({
+                "predicted_winner": game["home_team"] if home_win_prob > 0.5 else game["away_team"],
+                "home_win_probability": float(home_win_prob),
+                "away_win_probability": float(1 - home_win_prob),
+                # Calculate confidence based on prediction strength
+                "confidence": float(abs(home_win_prob - 0.5) * 2),  # Convert to 0-1 scale
+                "model_type": model_type,
+                "model_version": self.model_versions.get(sport) if predictions else None,
+                "features_used": features.shape[1]
+            })
+        return results
     
     def _fallback_prediction(self, home_stats: Dict, away_stats: Dict) -> float:
         """Fallback prediction using simple heuristics"""
@@ -283,22 +370,142 @@ class AdvancedMLPredictor:
         return home_strength / total if total > 0 else 0.5
     
     def load_model(self, sport: str, model_type: str) -> bool:
-        """Load a pre-trained model from disk"""
-        model_key = f"{sport}_{model_type}"
-        model_path = os.path.join(self.model_dir, f"{model_key}.pkl")
-        scaler_path = os.path.join(self.model_dir, f"{model_key}_scaler.pkl")
+        """Load a pre-trained model from the sport's current registry version"""
+        return model_type in self.load_models(sport, [model_type])
+    
+    def load_models(self, sport: str, model_types: Optional[List[str]] = None) -> List[str]:
+        """
+        Load the current registry version for a sport (written by ModelTrainer)
+        
+        Args:
+            sport: Sport type
+            model_types: Models to load (defaults to every model in the version)
         
-        if os.path.exists(model_path) and os.path.exists(scaler_path):
+        Returns:
+            Model types that were loaded
+        """
+        try:
+            version = self.registry.current_version(sport)
+            if version is None:
+                print(f"No trained {sport} models in {self.model_dir}; using heuristic fallback")
+                return []
+            manifest = self.registry.manifest(sport, version)
+            if manifest.get("feature_names") != FEATURE_NAMES:
+                print(f"{sport} models {version} were trained on different features; not loading them")
+                return []
+            
+            model_types = [mt for mt in model_types or manifest.get("model_types", []) if mt in manifest["artifacts"]]
+            use_artifact = self.inference_backend == "compiled" and COMPILED_ARTIFACT in manifest["artifacts"]
+            if use_artifact:
+                # Memory-mapped, so every worker process shares one copy of the
+                # arrays; library models are only loaded if the fallback path
+                # needs them (see _ensure_library_models)
+                artifacts, _ = self.registry.load(sport, version, [COMPILED_ARTIFACT])
+                # Parity was checked when the trainer wrote the artifact
+                compiled = CompiledTreeEnsemble.from_arrays(artifacts[COMPILED_ARTIFACT])
+            else:
+                self._load_library_models(sport, version, model_types)
+        except Exception as e:
+            print(f"Error loading {sport} models: {e}")
+            return []
+        
+        if model_types:
+            self.model_versions[sport] = version
+            self.available_models[sport] = model_types
+            if use_artifact:
+                self.compiled[sport] = compiled
+            else:
+                self._compile(sport)
+        return model_types
+    
+    def _load_library_models(self, sport: str, version: str, model_types: List[str]) -> None:
+        """Load sklearn/XGBoost models and their scaler from a registry version"""
+        artifacts, _ = self.registry.load(sport, version, model_types + ["scaler"])
+        for model_type in model_types:
+            model_key = f"{sport}_{model_type}"
+            # Models of one version share a scaler, so batches are scaled once
+            self.scalers[model_key] = artifacts["scaler"]
+            self.models[model_key] = artifacts[model_type]
+    
+    def _ensure_library_models(self, sport: str, model_types: List[str]) -> None:
+        """
+        Load library models for the fallback path (rows with missing values,
+        models that are not compiled) on first use
+        """
+        def missing() -> List[str]:
+            return [
+                mt for mt in model_types
+                if mt in self.available_models.get(sport, ()) and f"{sport}_{mt}" not in self.models
+            ]
+        
+        if not missing():
+            return
+        with self._load_lock:
+            model_types = missing()
+            if not model_types:
+                return
             try:
-                with open(model_path, 'rb') as f:
-                    self.models[model_key] = pickle.load(f)
-                with open(scaler_path, 'rb') as f:
-                    self.scalers[model_key] = pickle.load(f)
-                return True
+                self._load_library_models(sport, self.model_versions[sport], model_types)
             except Exception as e:
-                print(f"Error loading model {model_key}: {e}")
-                return False
-        return False
+                print(f"Error loading {sport} models {model_types}: {e}")
+                # Do not retry on every request
+                self.available_models[sport] = [mt for mt in self.available_models[sport] if mt not in model_types]
+    
+    def _compile(self, sport: str) -> None:
+        """
+        Build the compiled tree backend from a sport's loaded ensemble members
+        
+        Used for versions trained before the compiled artifact existed. The
+        compiled ensemble is only used if it reproduces the library
+        predictions on a sample of inputs; otherwise predictions stay on
+        the sklearn/XGBoost path.
+        """
+        self.compiled.pop(sport, None)
+        if self.inference_backend != "compiled":
+            return
+        
+        models = {mt: self.models[f"{sport}_{mt}"] for mt in ENSEMBLE_MEMBERS if f"{sport}_{mt}" in self.models}
+        scalers = {id(self.scalers.get(f"{sport}_{mt}")) for mt in models}
+        if not models or len(scalers) != 1:
+            return
+        scaler = self.scalers.get(f"{sport}_{next(iter(models))}")
+        
+        compiled = compile_ensemble(models, scaler)
+        if compiled is not None:
+            self.compiled[sport] = compiled
+    
+    def warm_up(self, sports: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Load every sport's models and run one prediction through them
+        
+        Call at startup so the first request does not pay for unpickling
+        and first-call model initialization.
+        
+        Args:
+            sports: Sports to load
+        
+        Returns:
+            Loaded version per sport (None where the heuristic fallback will be used)
+        """
+        for sport in sports:
+            self._ensure_loaded(sport)
+            if self.model_versions.get(sport):
+                self.predict_games_ml([{
+                    "home_team": "home",
+                    "away_team": "away",
+                    "home_stats": {},
+                    "away_stats": {}
+                }], sport=sport)
+        return {sport: self.model_versions.get(sport) for sport in sports}
+    
+    def _ensure_loaded(self, sport: str) -> None:
+        """Load a sport's artifacts on first use (never trains)"""
+        if sport in self._load_attempted:
+            return
+        with self._load_lock:
+            if sport not in self._load_attempted:
+                self.load_models(sport)
+                self._load_attempted.add(sport)
 
 
 class PlayerPropMLPredictor:
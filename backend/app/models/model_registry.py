@@ -0,0 +1,261 @@
+"""
+Versioned, content-addressed store for trained model artifacts
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+import hashlib
+import json
+import os
+import shutil
+import uuid
+import joblib
+from app.config import settings
+
+
+# Per-sport file recording the current version and the promotion history
+STATE_FILE = "registry.json"
+MANIFEST_FILE = "manifest.json"
+ARTIFACT_SUFFIX = ".joblib"
+
+
+def _file_sha256(path: str) -> str:
+    """Hash a file in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_json_atomic(path: str, data: Dict) -> None:
+    """Write JSON to a temp file and rename it over path, so readers never see a partial file"""
+    tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+class ModelRegistry:
+    """
+    Stores each trained version under {root}/{sport}/{version}/
+
+    A version holds one uncompressed joblib file per artifact (models,
+    scaler) and a manifest listing the feature names, each file's SHA-256
+    and the training metadata. The version id is derived from the artifact
+    hashes, so registering identical artifacts twice yields the same version.
+
+    {root}/{sport}/registry.json names the current version and the order in
+    which versions were promoted. It is replaced atomically, so promote and
+    rollback are instant and readers see either the old or the new state.
+
+    Artifacts are loaded with joblib memory mapping: numpy arrays stored in
+    the files are mapped read-only instead of copied onto the heap, so
+    every worker process shares the same page-cache copy of them. Only
+    plain arrays stay mapped (such as the "compiled" tree arrays written by
+    ModelTrainer); sklearn and XGBoost models copy their nodes on unpickle.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Initialize the registry
+
+        Args:
+            root: Root directory (defaults to settings.MODEL_DIR)
+        """
+        self.root = root or settings.MODEL_DIR
+
+    def register(
+        self,
+        sport: str,
+        artifacts: Dict[str, Any],
+        feature_names: List[str],
+        metadata: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Store a new version (without promoting it)
+
+        Args:
+            sport: Sport type
+            artifacts: Objects to store, by name (e.g. model types and "scaler")
+            feature_names: Feature layout the models expect
+            metadata: Extra manifest fields (metrics, training parameters)
+
+        Returns:
+            The version's manifest
+        """
+        sport_dir = os.path.join(self.root, sport)
+        tmp_dir = os.path.join(sport_dir, f".{uuid.uuid4().hex}.tmp")
+        os.makedirs(tmp_dir)
+
+        try:
+            files = {}
+            for name, artifact in artifacts.items():
+                path = os.path.join(tmp_dir, f"{name}{ARTIFACT_SUFFIX}")
+                # No compression: compressed files cannot be memory mapped
+                joblib.dump(artifact, path)
+                files[name] = {"sha256": _file_sha256(path), "bytes": os.path.getsize(path)}
+
+            content = hashlib.sha256()
+            for name in sorted(files):
+                content.update(f"{name}:{files[name]['sha256']}\n".encode())
+            content.update(json.dumps(feature_names).encode())
+            version = content.hexdigest()[:16]
+
+            manifest = {
+                **(metadata or {}),
+                "sport": sport,
+                "version": version,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "feature_names": list(feature_names),
+                "artifacts": files
+            }
+            with open(os.path.join(tmp_dir, MANIFEST_FILE), 'w') as f:
+                json.dump(manifest, f, indent=2)
+
+            version_dir = os.path.join(sport_dir, version)
+            if os.path.isdir(version_dir):
+                # Identical artifacts are already registered
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                return self.manifest(sport, version)
+            os.rename(tmp_dir, version_dir)
+            return manifest
+        except Exception:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+
+    def promote(self, sport: str, version: str, verify: bool = True) -> None:
+        """
+        Make a version the current one
+
+        Args:
+            sport: Sport type
+            version: Registered version
+            verify: Check the artifact hashes against the manifest first
+
+        Raises:
+            ValueError: If the version is unknown or fails verification
+        """
+        if not os.path.isdir(self._version_dir(sport, version)):
+            raise ValueError(f"Unknown {sport} model version: {version}")
+        if verify and not self.verify(sport, version):
+            raise ValueError(f"{sport} model version {version} does not match its manifest")
+
+        state = self._read_state(sport)
+        if state.get("current") != version:
+            state["history"] = state.get("history", []) + [version]
+            state["current"] = version
+            state["updated_at"] = datetime.now(timezone.utc).isoformat()
+            _write_json_atomic(self._state_path(sport), state)
+
+    def rollback(self, sport: str) -> str:
+        """
+        Make the previously promoted version current again
+
+        Returns:
+            The version that is now current
+
+        Raises:
+            ValueError: If there is no earlier version to roll back to
+        """
+        state = self._read_state(sport)
+        history = state.get("history", [])
+        if len(history) < 2:
+            raise ValueError(f"No earlier {sport} model version to roll back to")
+
+        state["history"] = history[:-1]
+        state["current"] = history[-2]
+        state["updated_at"] = datetime.now(timezone.utc).isoformat()
+        _write_json_atomic(self._state_path(sport), state)
+        return state["current"]
+
+    def current_version(self, sport: str) -> Optional[str]:
+        """Version currently promoted for a sport, or None"""
+        return self._read_state(sport).get("current")
+
+    def manifest(self, sport: str, version: str) -> Dict:
+        """Read a version's manifest"""
+        with open(os.path.join(self._version_dir(sport, version), MANIFEST_FILE)) as f:
+            return json.load(f)
+
+    def versions(self, sport: str) -> List[Dict]:
+        """
+        List registered versions for a sport, newest first
+
+        Returns:
+            Manifests with a "current" flag added
+        """
+        sport_dir = os.path.join(self.root, sport)
+        if not os.path.isdir(sport_dir):
+            return []
+
+        current = self.current_version(sport)
+        manifests = []
+        for entry in os.listdir(sport_dir):
+            if os.path.isfile(os.path.join(sport_dir, entry, MANIFEST_FILE)):
+                manifest = self.manifest(sport, entry)
+                manifest["current"] = entry == current
+                manifests.append(manifest)
+        return sorted(manifests, key=lambda m: m.get("created_at", ""), reverse=True)
+
+    def verify(self, sport: str, version: str) -> bool:
+        """Check every artifact file against the hash recorded in the manifest"""
+        try:
+            manifest = self.manifest(sport, version)
+            version_dir = self._version_dir(sport, version)
+            return all(
+                _file_sha256(os.path.join(version_dir, f"{name}{ARTIFACT_SUFFIX}")) == info["sha256"]
+                for name, info in manifest["artifacts"].items()
+            )
+        except (OSError, KeyError, ValueError) as e:
+            print(f"Could not verify {sport} model version {version}: {e}")
+            return False
+
+    def load(
+        self,
+        sport: str,
+        version: Optional[str] = None,
+        names: Optional[List[str]] = None,
+        mmap: bool = True
+    ) -> Tuple[Dict[str, Any], Dict]:
+        """
+        Load a version's artifacts
+
+        Args:
+            sport: Sport type
+            version: Version to load (defaults to the current one)
+            names: Artifacts to load (defaults to all of them)
+            mmap: Memory-map numpy arrays read-only instead of copying them
+
+        Returns:
+            (artifacts by name, manifest)
+
+        Raises:
+            LookupError: If no version is given and none has been promoted
+        """
+        version = version or self.current_version(sport)
+        if version is None:
+            raise LookupError(f"No {sport} model version has been promoted")
+
+        manifest = self.manifest(sport, version)
+        version_dir = self._version_dir(sport, version)
+        artifacts = {}
+        for name in names or manifest["artifacts"]:
+            artifacts[name] = joblib.load(
+                os.path.join(version_dir, f"{name}{ARTIFACT_SUFFIX}"),
+                mmap_mode="r" if mmap else None
+            )
+        return artifacts, manifest
+
+    def _version_dir(self, sport: str, version: str) -> str:
+        return os.path.join(self.root, sport, version)
+
+    def _state_path(self, sport: str) -> str:
+        return os.path.join(self.root, sport, STATE_FILE)
+
+    def _read_state(self, sport: str) -> Dict:
+        """Read the sport's registry state ({} if nothing has been promoted)"""
+        try:
+            with open(self._state_path(sport)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
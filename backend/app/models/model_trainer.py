@@ -0,0 +1,242 @@
+"""
+Offline training pipeline for the game outcome ML models
+"""
+from typing import Dict, List, Optional, Tuple
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+import os
+import time
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import accuracy_score, log_loss, roc_auc_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+import xgboost as xgb
+from app.models.advanced_ml_models import COMPILED_ARTIFACT, ENSEMBLE_MEMBERS, FEATURE_NAMES, compile_ensemble
+from app.models.model_registry import ModelRegistry
+from app.config import settings
+
+
+# Every model type the predictor can serve
+MODEL_TYPES = ENSEMBLE_MEMBERS + ['logistic']
+
+
+def _build_model(model_type: str, n_jobs: int = 1):
+    """
+    Create an unfitted estimator for a model type
+
+    Args:
+        model_type: One of MODEL_TYPES
+        n_jobs: Threads used to build trees (random forest and XGBoost only)
+    """
+    if model_type == 'random_forest':
+        return RandomForestClassifier(n_estimators=100, random_state=42, max_depth=10, n_jobs=n_jobs)
+    if model_type == 'gradient_boosting':
+        return GradientBoostingClassifier(n_estimators=100, random_state=42, max_depth=5)
+    if model_type == 'xgboost':
+        return xgb.XGBClassifier(n_estimators=100, random_state=42, max_depth=5, learning_rate=0.1, n_jobs=n_jobs)
+    if model_type == 'logistic':
+        return LogisticRegression(random_state=42, max_iter=1000)
+    raise ValueError(f"Unknown model type: {model_type}")
+
+
+def _fit_model(
+    model_type: str,
+    X_train: np.ndarray,
+    y_train: np.ndarray,
+    X_test: np.ndarray,
+    y_test: np.ndarray,
+    n_jobs: int
+) -> Tuple[object, Dict[str, float]]:
+    """Fit and evaluate one model (runs in a training worker process)"""
+    start = time.perf_counter()
+    model = _build_model(model_type, n_jobs)
+    model.fit(X_train, y_train)
+    metrics = ModelTrainer._evaluate(model, X_test, y_test)
+    metrics["fit_seconds"] = round(time.perf_counter() - start, 2)
+    return model, metrics
+
+
+class ModelTrainer:
+    """
+    Trains, validates and publishes versioned model artifacts
+
+    Each run registers the models and their shared scaler as a new version
+    in the ModelRegistry, with the metrics and training parameters in its
+    manifest. The version is only promoted (served) if every model passes
+    validation. AdvancedMLPredictor only ever loads these artifacts.
+
+    Every (sport, model) fit is an independent task on a process pool, so
+    training several sports at once keeps all workers busy; random forest
+    and XGBoost can additionally build trees on n_jobs threads each. Keep
+    max_workers * n_jobs at or below the number of cores.
+    """
+
+    def __init__(
+        self,
+        model_dir: Optional[str] = None,
+        min_accuracy: Optional[float] = None,
+        max_workers: Optional[int] = None,
+        n_jobs: Optional[int] = None
+    ):
+        """
+        Initialize the trainer
+
+        Args:
+            model_dir: Model registry root (defaults to settings.MODEL_DIR)
+            min_accuracy: Minimum held-out accuracy every model must reach to be published
+            max_workers: Training processes (defaults to settings.MODEL_TRAIN_WORKERS, 0 = one per core)
+            n_jobs: Tree-building threads per random forest / XGBoost model
+                (defaults to settings.MODEL_TRAIN_N_JOBS)
+        """
+        self.registry = ModelRegistry(model_dir)
+        self.min_accuracy = settings.MODEL_MIN_ACCURACY if min_accuracy is None else min_accuracy
+        self.max_workers = settings.MODEL_TRAIN_WORKERS if max_workers is None else max_workers
+        self.n_jobs = settings.MODEL_TRAIN_N_JOBS if n_jobs is None else n_jobs
+
+    def load_training_data(self, sport: str, n_samples: int = 1000, seed: int = 42) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Load the training set for a sport (synthetic for now)
+        In production, this would load historical games from the database
+        """
+        rng = np.random.default_rng(seed)
+        X = rng.random((n_samples, len(FEATURE_NAMES)))
+        # Create realistic target distribution
+        y = (X[:, 0] + X[:, 1] - X[:, 6] - X[:, 7] + rng.random(n_samples) * 0.2 > 0).astype(int)
+        return X, y
+
+    def train(
+        self,
+        sport: str,
+        model_types: Optional[List[str]] = None,
+        n_samples: int = 1000,
+        seed: int = 42,
+        publish: bool = True
+    ) -> Dict:
+        """
+        Train and validate all models for a sport and write a new artifact version
+
+        Args:
+            sport: Sport type
+            model_types: Models to train (defaults to every servable type)
+            n_samples: Training set size
+            seed: Random seed for data generation and the train/test split
+            publish: Make the version current if validation passes
+
+        Returns:
+            Dictionary with the version, its directory, per-model metrics
+            and whether it was published
+        """
+        return self.train_all([sport], model_types, n_samples, seed, publish)[0]
+
+    def train_all(
+        self,
+        sports: List[str],
+        model_types: Optional[List[str]] = None,
+        n_samples: int = 1000,
+        seed: int = 42,
+        publish: bool = True
+    ) -> List[Dict]:
+        """
+        Train several sports at once on one process pool
+
+        Args:
+            sports: Sports to train
+            model_types: Models to train per sport (defaults to every servable type)
+            n_samples: Training set size per sport
+            seed: Random seed for data generation and the train/test split
+            publish: Make each version current if its validation passes
+
+        Returns:
+            One result dictionary per sport, as returned by train
+        """
+        model_types = model_types or MODEL_TYPES
+        num_tasks = len(sports) * len(model_types)
+        max_workers = min(self.max_workers or os.cpu_count() or 1, num_tasks)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            jobs = {}
+            for sport in sports:
+                X, y = self.load_training_data(sport, n_samples, seed)
+
+                # Split data
+                X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=seed)
+
+                # Scale features (one scaler shared by every model of the version)
+                scaler = StandardScaler()
+                X_train_scaled = scaler.fit_transform(X_train)
+                X_test_scaled = scaler.transform(X_test)
+
+                futures = {
+                    model_type: pool.submit(
+                        _fit_model, model_type, X_train_scaled, y_train, X_test_scaled, y_test, self.n_jobs
+                    )
+                    for model_type in model_types
+                }
+                jobs[sport] = (scaler, futures)
+
+            return [
+                self._finish(sport, scaler, futures, n_samples, seed, publish)
+                for sport, (scaler, futures) in jobs.items()
+            ]
+
+    def _finish(
+        self,
+        sport: str,
+        scaler: StandardScaler,
+        futures: Dict[str, Future],
+        n_samples: int,
+        seed: int,
+        publish: bool
+    ) -> Dict:
+        """Collect a sport's fitted models, then write and optionally publish the version"""
+        models, metrics = {}, {}
+        for model_type, future in futures.items():
+            models[model_type], metrics[model_type] = future.result()
+            print(f"Trained {sport} {model_type}: {metrics[model_type]}")
+
+        passed = all(m["accuracy"] >= self.min_accuracy for m in metrics.values())
+        artifacts = {**models, "scaler": scaler}
+        
+        # Flattened trees as plain arrays, which serving memory-maps so every
+        # worker shares one copy (library models are copied on unpickle)
+        members = {mt: models[mt] for mt in ENSEMBLE_MEMBERS if mt in models}
+        compiled = compile_ensemble(members, scaler) if members else None
+        if compiled is not None:
+            artifacts[COMPILED_ARTIFACT] = compiled.to_arrays()
+        
+        manifest = self.registry.register(sport, artifacts, FEATURE_NAMES, {
+            "trained_at": datetime.now(timezone.utc).isoformat(),
+            "model_types": list(models),
+            "compiled_model_types": compiled.model_types if compiled is not None else [],
+            "n_samples": n_samples,
+            "seed": seed,
+            "metrics": metrics,
+            "validation_passed": passed
+        })
+        version = manifest["version"]
+
+        published = publish and passed
+        if published:
+            self.registry.promote(sport, version)
+        elif not passed:
+            print(f"{sport} version {version} failed validation (min accuracy {self.min_accuracy}); not published")
+
+        return {
+            "sport": sport,
+            "version": version,
+            "metrics": metrics,
+            "validation_passed": passed,
+            "published": published
+        }
+
+    @staticmethod
+    def _evaluate(model, X_test: np.ndarray, y_test: np.ndarray) -> Dict[str, float]:
+        """Held-out accuracy, log loss and ROC AUC"""
+        probs = model.predict_proba(X_test)[:, 1]
+        return {
+            "accuracy": round(float(accuracy_score(y_test, probs > 0.5)), 4),
+            "log_loss": round(float(log_loss(y_test, probs, labels=[0, 1])), 4),
+            "roc_auc": round(float(roc_auc_score(y_test, probs)), 4) if len(set(y_test)) > 1 else None
+        }
@@ -0,0 +1,220 @@
+"""
+Correlation-aware parlay pricing from a joint simulation of same-game legs
+"""
+from typing import Dict, Optional, Sequence
+from statistics import NormalDist
+import numpy as np
+from app.models.parlay_pricing import ParlayPricer
+
+
+# Stat family of each prop type; correlations are defined between families
+PROP_GROUPS = {
+    "moneyline": "team",
+    "passing_yards": "passing",
+    "passing_touchdowns": "passing",
+    "receiving_yards": "receiving",
+    "receptions": "receiving",
+    "rushing_yards": "rushing",
+    "yards": "receiving",
+    "touchdowns": "scoring",
+    "points": "scoring",
+    "shots": "scoring",
+    "assists": "playmaking",
+    "rebounds": "rebounds",
+    "hits": "hitting",
+    "strikeouts": "pitching",
+    "saves": "goaltending",
+}
+
+# Two props of the same player: same stat family vs different families
+SAME_PLAYER_CORRELATION = {True: 0.75, False: 0.4}
+
+# Teammates' stat outcomes, keyed by the (unordered) pair of stat families
+TEAMMATE_CORRELATIONS = {
+    frozenset(("passing", "receiving")): 0.45,
+    frozenset(("passing", "rushing")): -0.15,
+    frozenset(("receiving",)): -0.05,
+    frozenset(("receiving", "rushing")): -0.1,
+    frozenset(("playmaking", "scoring")): 0.25,
+    frozenset(("scoring",)): -0.05,
+    frozenset(("hitting",)): 0.15,
+    frozenset(("team", "passing")): 0.2,
+    frozenset(("team", "receiving")): 0.15,
+    frozenset(("team", "rushing")): 0.3,
+    frozenset(("team", "scoring")): 0.3,
+    frozenset(("team", "playmaking")): 0.2,
+    frozenset(("team", "hitting")): 0.25,
+    frozenset(("team", "pitching")): 0.25,
+    frozenset(("team", "goaltending")): 0.2,
+}
+
+# Opponents' stat outcomes, keyed the same way
+OPPONENT_CORRELATIONS = {
+    frozenset(("team",)): -1.0,
+    frozenset(("team", "passing")): -0.1,
+    frozenset(("team", "receiving")): -0.1,
+    frozenset(("team", "rushing")): -0.25,
+    frozenset(("team", "scoring")): -0.25,
+    frozenset(("team", "hitting")): -0.25,
+    frozenset(("team", "pitching")): -0.2,
+    frozenset(("team", "goaltending")): -0.15,
+    frozenset(("passing",)): 0.2,
+    frozenset(("passing", "receiving")): 0.15,
+    frozenset(("pitching", "hitting")): -0.3,
+    frozenset(("goaltending", "scoring")): 0.3,
+}
+
+# Any other pair of props in the same game shares the game's pace
+DEFAULT_GAME_CORRELATION = 0.05
+
+
+class CorrelatedParlayPricer:
+    """
+    Prices parlays whose legs may come from the same game
+
+    Each leg's underlying stat is a standard normal latent variable; stats
+    in the same game are correlated according to the rule tables above and
+    different games are independent. A leg hits when its latent crosses the
+    quantile implied by its win probability, so every leg keeps its own
+    marginal probability (a Gaussian copula) while the joint outcome picks
+    up the same-game correlation. All legs are simulated together as one
+    (simulations x legs) array.
+    """
+
+    def __init__(self, num_simulations: int = 20_000):
+        """
+        Initialize the pricer
+
+        Args:
+            num_simulations: Default number of simulated games per parlay
+        """
+        self.num_simulations = num_simulations
+
+    @staticmethod
+    def _same_game(leg_a, leg_b) -> bool:
+        """Check whether two legs are in the same game (same team if no game_id is given)"""
+        game_a = getattr(leg_a, "game_id", None)
+        game_b = getattr(leg_b, "game_id", None)
+        if game_a and game_b:
+            return game_a == game_b
+        return leg_a.team == leg_b.team
+
+    @classmethod
+    def stat_correlation(cls, leg_a, leg_b) -> float:
+        """
+        Correlation between the underlying stats of two legs
+
+        Args:
+            leg_a: First leg (player_name, team, prop_type and optional game_id)
+            leg_b: Second leg
+
+        Returns:
+            Correlation in [-1, 1], 0 for legs in different games
+        """
+        if not cls._same_game(leg_a, leg_b):
+            return 0.0
+
+        group_a = PROP_GROUPS.get(leg_a.prop_type, leg_a.prop_type)
+        group_b = PROP_GROUPS.get(leg_b.prop_type, leg_b.prop_type)
+        pair = frozenset((group_a, group_b))
+
+        if leg_a.team == leg_b.team:
+            if leg_a.player_name == leg_b.player_name:
+                if leg_a.prop_type == leg_b.prop_type:
+                    # Same market at another line or platform
+                    return 1.0
+                return SAME_PLAYER_CORRELATION[group_a == group_b]
+            return TEAMMATE_CORRELATIONS.get(pair, DEFAULT_GAME_CORRELATION)
+        return OPPONENT_CORRELATIONS.get(pair, DEFAULT_GAME_CORRELATION)
+
+    @classmethod
+    def correlation_matrix(cls, legs: Sequence) -> np.ndarray:
+        """
+        Correlation between the hit events' latent variables
+
+        An under leg hits when its stat is low, so its latent is the negated
+        stat and its correlations flip sign.
+        """
+        n = len(legs)
+        direction = np.array([-1.0 if leg.selection == "under" else 1.0 for leg in legs])
+        correlation = np.eye(n)
+        for i in range(n):
+            for j in range(i + 1, n):
+                correlation[i, j] = correlation[j, i] = cls.stat_correlation(legs[i], legs[j])
+        # Adding 0.0 turns the -0.0 entries of flipped independent pairs into 0.0
+        return correlation * np.outer(direction, direction) + 0.0
+
+    @staticmethod
+    def _factor(correlation: np.ndarray) -> np.ndarray:
+        """
+        Matrix square root used to correlate independent normals
+
+        Rule-built matrices are not always positive definite (e.g. both
+        moneylines of a game), so fall back to clipping negative eigenvalues.
+        """
+        try:
+            return np.linalg.cholesky(correlation)
+        except np.linalg.LinAlgError:
+            eigenvalues, eigenvectors = np.linalg.eigh(correlation)
+            factor = eigenvectors * np.sqrt(np.clip(eigenvalues, 0, None))
+            # Rescale rows so every latent keeps unit variance
+            return factor / np.linalg.norm(factor, axis=1, keepdims=True)
+
+    def price(
+        self,
+        legs: Sequence,
+        num_simulations: Optional[int] = None,
+        seed: Optional[int] = None
+    ) -> Dict:
+        """
+        Price a parlay by simulating all of its legs jointly
+
+        Args:
+            legs: Legs with player_name, team, prop_type, selection, odds,
+                win_probability and optionally game_id
+            num_simulations: Simulated games (defaults to the pricer's setting)
+            seed: Random seed for reproducible results
+
+        Returns:
+            Dictionary with the joint combined_probability, the
+            independent_probability for comparison, its standard_error,
+            exact and at_least hit distributions, round_robin_returns
+            (expected return per unit stake of every k-leg combination, by k)
+            and the leg correlation matrix
+        """
+        num_simulations = num_simulations or self.num_simulations
+        probabilities = np.array([leg.win_probability for leg in legs], dtype=np.float64)
+        odds = np.array([leg.odds for leg in legs], dtype=np.float64)
+        n = len(legs)
+
+        correlation = self.correlation_matrix(legs)
+        factor = self._factor(correlation)
+        thresholds = np.array([NormalDist().inv_cdf(1 - p) for p in probabilities])
+
+        # Antithetic pairs keep each leg's simulated hit rate close to its probability
+        rng = np.random.default_rng(seed)
+        normals = rng.standard_normal(((num_simulations + 1) // 2, n), dtype=np.float32)
+        normals = np.vstack([normals, -normals])[:num_simulations]
+        hits = normals @ factor.T.astype(np.float32) > thresholds
+
+        # Collapse the simulations to the distinct hit patterns and their frequencies
+        bits = np.arange(n)
+        patterns, counts = np.unique(hits.astype(np.int64) @ (1 << bits), return_counts=True)
+        pattern_hits = (patterns[:, None] >> bits) & 1
+        weights = counts / num_simulations
+
+        exact = np.bincount(pattern_hits.sum(axis=1), weights=weights, minlength=n + 1)
+        combined = float(exact[n])
+        # e_k(odds * hits) is the payout of every k-leg ticket in one simulated game
+        round_robin_returns = weights @ ParlayPricer.elementary_symmetric(pattern_hits * odds)
+
+        return {
+            "combined_probability": combined,
+            "independent_probability": float(np.prod(probabilities)),
+            "standard_error": float(np.sqrt(combined * (1 - combined) / num_simulations)),
+            "exact": exact,
+            "at_least": ParlayPricer.at_least(exact),
+            "round_robin_returns": round_robin_returns,
+            "correlation": correlation,
+            "num_simulations": num_simulations
+        }
@@ -0,0 +1,178 @@
+"""
+Parlay search over a slate of priced legs
+"""
+from typing import Dict, List, Optional
+from dataclasses import dataclass, asdict
+import numpy as np
+from app.models.parlay_pricing import ParlayPricer
+
+
+OBJECTIVES = ("ev", "kelly")
+
+
+@dataclass
+class CandidateLeg:
+    """A priced bet that can be used as a parlay leg"""
+    game_id: str
+    market: str  # Legs on the same market are mutually exclusive
+    player_name: str  # Team name for moneylines
+    team: str
+    prop_type: str  # "moneyline" or a player prop type
+    prop_value: float  # Line for props, 0 for moneylines
+    selection: str  # "over", "under" or "win"
+    odds: float  # Decimal odds
+    win_probability: float
+    platform: str
+    position: Optional[str] = None
+
+    @property
+    def edge(self) -> float:
+        """Expected profit per unit staked on this leg alone"""
+        return self.win_probability * self.odds - 1
+
+
+class ParlayOptimizer:
+    """
+    Finds the best parlays among a slate's candidate legs
+
+    Legs without a positive edge are pruned up front: with independent legs
+    a parlay's return multiplier is the product of each leg's p * odds, so a
+    leg with p * odds <= 1 can never improve EV. The remaining legs are
+    searched with a beam search whose expansions are scored as NumPy arrays
+    (beam x legs), so several hundred legs take milliseconds.
+    """
+
+    def __init__(self, beam_width: int = 256):
+        """
+        Initialize the optimizer
+
+        Args:
+            beam_width: Partial parlays kept at each depth
+        """
+        self.beam_width = beam_width
+
+    @staticmethod
+    def best_priced(legs: List[CandidateLeg]) -> List[CandidateLeg]:
+        """Keep the highest-edge price for each market and selection (line shopping)"""
+        best: Dict[tuple, CandidateLeg] = {}
+        for leg in legs:
+            key = (leg.market, leg.selection)
+            if key not in best or leg.edge > best[key].edge:
+                best[key] = leg
+        return list(best.values())
+
+    def optimize(
+        self,
+        legs: List[CandidateLeg],
+        num_legs: int = 3,
+        max_legs: int = 5,
+        top_k: int = 5,
+        objective: str = "ev"
+    ) -> List[Dict]:
+        """
+        Search for the top parlays
+
+        Args:
+            legs: Candidate legs (any platforms; the best price per selection is used)
+            num_legs: Minimum legs per parlay
+            max_legs: Maximum legs per parlay
+            top_k: Number of parlays to return
+            objective: "ev" (expected value) or "kelly" (Kelly growth rate)
+
+        Returns:
+            Parlays ordered best first, each with its legs and pricing
+        """
+        if objective not in OBJECTIVES:
+            raise ValueError(f"Unknown objective: {objective}")
+
+        legs = [leg for leg in self.best_priced(legs) if leg.edge > 0 and 0 < leg.win_probability < 1]
+        legs.sort(key=lambda leg: leg.edge, reverse=True)
+        if len(legs) < num_legs:
+            return []
+
+        log_p = np.log([leg.win_probability for leg in legs])
+        log_o = np.log([leg.odds for leg in legs])
+        market_ids = {market: i for i, market in enumerate({leg.market for leg in legs})}
+        markets = np.array([market_ids[leg.market] for leg in legs])
+        num_candidates = len(legs)
+
+        # Depth 1: the best single legs
+        first = np.argsort(-self._score(log_p, log_o, objective))[:self.beam_width]
+        beam = first[:, None]
+        beam_log_p, beam_log_o = log_p[first], log_o[first]
+
+        found_combos, found_scores = [], []
+        for depth in range(1, max_legs):
+            # Extend with a later leg (indices stay increasing, so each set is built once)
+            # that does not share a market with any leg already chosen
+            allowed = np.arange(num_candidates)[None, :] > beam[:, -1:]
+            conflict = (markets[beam][:, :, None] == markets[None, None, :]).any(axis=1)
+            allowed &= ~conflict
+
+            child_log_p = beam_log_p[:, None] + log_p[None, :]
+            child_log_o = beam_log_o[:, None] + log_o[None, :]
+            scores = np.where(allowed, self._score(child_log_p, child_log_o, objective), -np.inf)
+
+            flat = scores.ravel()
+            keep = min(self.beam_width, int(np.isfinite(flat).sum()))
+            if keep == 0:
+                break
+            top = np.argpartition(-flat, keep - 1)[:keep]
+            parents, children = np.divmod(top, num_candidates)
+
+            beam = np.hstack([beam[parents], children[:, None]])
+            beam_log_p = child_log_p[parents, children]
+            beam_log_o = child_log_o[parents, children]
+
+            if depth + 1 >= num_legs:
+                found_combos.extend(beam.tolist())
+                found_scores.extend(flat[top].tolist())
+
+        ranked = sorted(zip(found_scores, found_combos), key=lambda item: item[0], reverse=True)[:top_k]
+        return self._describe([[legs[i] for i in combo] for _, combo in ranked])
+
+    @staticmethod
+    def _score(log_p: np.ndarray, log_o: np.ndarray, objective: str) -> np.ndarray:
+        """Score parlays from summed log probabilities and log odds"""
+        if objective == "ev":
+            # Monotonic in EV = p * odds - 1
+            return log_p + log_o
+        return ParlayOptimizer._kelly_growth(np.exp(log_p), np.exp(log_o))
+
+    @staticmethod
+    def _kelly_growth(prob: np.ndarray, odds: np.ndarray) -> np.ndarray:
+        """Expected log growth of a bankroll staking the full Kelly fraction"""
+        net = np.maximum(odds - 1, 1e-12)
+        fraction = np.clip((prob * odds - 1) / net, 0, 1 - 1e-12)
+        return prob * np.log1p(fraction * net) + (1 - prob) * np.log1p(-fraction)
+
+    def _describe(self, parlays: List[List[CandidateLeg]]) -> List[Dict]:
+        """Price the selected parlays and convert them to response dictionaries"""
+        if not parlays:
+            return []
+
+        priced = ParlayPricer.price_batch(
+            [[leg.win_probability for leg in parlay] for parlay in parlays],
+            [[leg.odds for leg in parlay] for parlay in parlays]
+        )
+        kelly = np.clip(
+            (priced["combined_probability"] * priced["parlay_odds"] - 1) / (priced["parlay_odds"] - 1), 0, 1
+        )
+        growth = self._kelly_growth(priced["combined_probability"], priced["parlay_odds"])
+
+        results = []
+        for i, parlay in enumerate(parlays):
+            results.append({
+                "legs": [
+                    {key: value for key, value in asdict(leg).items() if key != "market"}
+                    for leg in parlay
+                ],
+                "num_legs": len(parlay),
+                "parlay_odds": round(float(priced["parlay_odds"][i]), 2),
+                "combined_probability": round(float(priced["combined_probability"][i]), 4),
+                "expected_value": round(float(priced["expected_value"][i]), 4),
+                "ev_percentage": round(float(priced["expected_value"][i]) * 100, 2),
+                "kelly_percentage": round(float(kelly[i]) * 100, 2),
+                "kelly_growth": round(float(growth[i]), 6)
+            })
+        return results
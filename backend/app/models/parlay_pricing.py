@@ -0,0 +1,175 @@
+"""
+Exact parlay leg-hit distributions (Poisson-binomial) and round-robin pricing
+"""
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+import math
+import numpy as np
+
+
+ArrayLike = Union[Sequence[float], Sequence[Sequence[float]], np.ndarray]
+
+
+def _is_single(values: ArrayLike) -> bool:
+    """Check whether values describe one parlay rather than a batch"""
+    if isinstance(values, np.ndarray):
+        return values.ndim == 1
+    return not (len(values) and isinstance(values[0], (list, tuple, np.ndarray)))
+
+
+def _as_batch(values: ArrayLike, fill: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert one parlay or a list of parlays to a (parlays x legs) array
+
+    Ragged parlays are right-padded with fill, chosen so padding does not
+    change the result (probability 0 for hits, odds 1 for payouts).
+
+    Returns:
+        (batch array, number of real legs per parlay)
+    """
+    if isinstance(values, np.ndarray) or _is_single(values):
+        batch = np.atleast_2d(np.asarray(values, dtype=np.float64))
+        return batch, np.full(len(batch), batch.shape[1])
+
+    width = max((len(row) for row in values), default=0)
+    batch = np.full((len(values), width), fill, dtype=np.float64)
+    for i, row in enumerate(values):
+        batch[i, :len(row)] = row
+    return batch, np.array([len(row) for row in values])
+
+
+class ParlayPricer:
+    """
+    Prices parlays whose legs are independent events
+
+    The number of legs that hit follows a Poisson-binomial distribution,
+    computed exactly with an O(n^2) dynamic program that is vectorized over
+    a batch of parlays, so thousands of parlays cost n array updates.
+    """
+
+    @staticmethod
+    def hit_distribution(probabilities: ArrayLike) -> np.ndarray:
+        """
+        Probability of exactly k legs hitting, for k = 0..n
+
+        Args:
+            probabilities: Leg win probabilities for one parlay, or a list
+                (or 2-D array) of them for a batch
+
+        Returns:
+            Array of shape (n + 1,) for one parlay or (parlays, n + 1) for a batch
+        """
+        probs, _ = _as_batch(probabilities, fill=0.0)
+        num_parlays, num_legs = probs.shape
+
+        # dist[:, k] = P(k hits among the legs processed so far)
+        dist = np.zeros((num_parlays, num_legs + 1))
+        dist[:, 0] = 1.0
+        for j in range(num_legs):
+            p = probs[:, j:j + 1]
+            shifted = dist[:, :j + 1] * p
+            dist[:, :j + 2] *= 1 - p
+            dist[:, 1:j + 2] += shifted
+
+        return dist[0] if _is_single(probabilities) else dist
+
+    @staticmethod
+    def at_least(distribution: np.ndarray) -> np.ndarray:
+        """Convert P(exactly k) into P(at least k) along the last axis"""
+        return np.flip(np.cumsum(np.flip(distribution, axis=-1), axis=-1), axis=-1)
+
+    @staticmethod
+    def elementary_symmetric(values: ArrayLike) -> np.ndarray:
+        """
+        Elementary symmetric polynomials e_0..e_n of each row of values
+
+        e_k is the sum over all k-leg combinations of the product of their
+        values, which is what round-robin payouts add up.
+        """
+        batch, _ = _as_batch(values, fill=0.0)
+        num_rows, n = batch.shape
+        e = np.zeros((num_rows, n + 1))
+        e[:, 0] = 1.0
+        for j in range(n):
+            x = batch[:, j:j + 1]
+            e[:, 1:j + 2] += e[:, :j + 1] * x
+        return e
+
+    @classmethod
+    def round_robin(
+        cls,
+        probabilities: Sequence[float],
+        odds: Sequence[float],
+        stake: float = 1.0,
+        sizes: Optional[Sequence[int]] = None,
+        expected_returns: Optional[np.ndarray] = None
+    ) -> List[Dict]:
+        """
+        Price round-robin tickets ("by k's") built from the parlay's legs
+
+        A by-k round robin places one stake on every k-leg combination. With
+        independent legs its expected return is stake * e_k(odds * p) and its
+        maximum return is stake * e_k(odds).
+
+        Args:
+            probabilities: Leg win probabilities
+            odds: Leg decimal odds
+            stake: Stake per combination
+            sizes: Combination sizes to price (defaults to 2..n-1)
+            expected_returns: Expected return per unit stake of each size k
+                (indexed by k) when the legs are not independent, e.g. from
+                CorrelatedParlayPricer; defaults to e_k(odds * p)
+
+        Returns:
+            One dictionary per size with ticket count, cost, expected and max return
+        """
+        n = len(probabilities)
+        sizes = [k for k in (sizes or range(2, n)) if 1 <= k <= n]
+        if expected_returns is None:
+            weights = np.asarray(odds, dtype=np.float64) * np.asarray(probabilities, dtype=np.float64)
+            expected = cls.elementary_symmetric(weights)[0]
+        else:
+            expected = np.asarray(expected_returns, dtype=np.float64)
+        maximum = cls.elementary_symmetric(odds)[0]
+
+        results = []
+        for k in sizes:
+            tickets = math.comb(n, k)
+            cost = stake * tickets
+            expected_return = stake * float(expected[k])
+            results.append({
+                "size": k,
+                "tickets": tickets,
+                "total_stake": cost,
+                "expected_return": expected_return,
+                "expected_value": expected_return - cost,
+                "ev_percentage": (expected_return - cost) / cost * 100 if cost else 0.0,
+                "max_return": stake * float(maximum[k])
+            })
+        return results
+
+    @classmethod
+    def price_batch(cls, probabilities: ArrayLike, odds: ArrayLike) -> Dict[str, np.ndarray]:
+        """
+        Price many parlays at once
+
+        Args:
+            probabilities: List of per-parlay leg probabilities (may be ragged)
+            odds: Matching list of per-parlay leg decimal odds
+
+        Returns:
+            Dictionary of arrays: parlay_odds, combined_probability,
+            expected_value (per unit staked), exact and at_least hit distributions
+        """
+        probs, lengths = _as_batch(probabilities, fill=0.0)
+        prices, _ = _as_batch(odds, fill=1.0)
+        exact = cls.hit_distribution(probs)
+        parlay_odds = prices.prod(axis=1)
+        # "All legs hit" sits at a different column for each parlay length
+        combined = exact[np.arange(len(exact)), lengths]
+        return {
+            "parlay_odds": parlay_odds,
+            "combined_probability": combined,
+            "expected_value": combined * parlay_odds - 1,
+            "exact": exact,
+            "at_least": cls.at_least(exact)
+        }
@@ -108,13 +108,85 @@ class GamePredictor:
             key_factors=key_factors
         )
     
+    def predict_games(
+        self,
+        games: List[Dict],
+        team_stats: Dict[str, Dict],
+        weather_by_game: Optional[Dict[str, Dict]] = None
+    ) -> List[GamePrediction]:
+        """
+        Predict a slate of games at once
+        
+        Team strengths are computed once per team as an array, and the
+        home/away probabilities for every game come from one vectorized
+        expression, so the cost grows with the number of teams rather than
+        repeating the per-game work. Results match predict_game.
+        
+        Args:
+            games: Game dictionaries with game_id, home_team and away_team
+            team_stats: Statistics keyed by team name (missing teams use defaults)
+            weather_by_game: Optional weather conditions keyed by game_id
+        
+        Returns:
+            GamePrediction objects in the order of games
+        """
+        if not games:
+            return []
+        weather_by_game = weather_by_game or {}
+        
+        teams = sorted({game["home_team"] for game in games} | {game["away_team"] for game in games})
+        team_index = {team: i for i, team in enumerate(teams)}
+        strengths = self._team_strengths([team_stats.get(team, {}) for team in teams])
+        
+        home_strength = strengths[[team_index[game["home_team"]] for game in games]] + self.home_advantage
+        away_strength = strengths[[team_index[game["away_team"]] for game in games]]
+        total_strength = home_strength + away_strength
+        home_probs = np.divide(
+            home_strength, total_strength, out=np.full(len(games), 0.5), where=total_strength > 0
+        )
+        
+        predictions = []
+        for game, home_prob in zip(games, home_probs.tolist()):
+            home_team, away_team = game["home_team"], game["away_team"]
+            away_prob = 1 - home_prob
+            weather_data = weather_by_game.get(game["game_id"])
+            
+            weather_impact = None
+            if weather_data:
+                weather_impact = self._apply_weather_adjustment(
+                    home_prob, away_prob, weather_data, home_team, away_team
+                )
+                home_prob = weather_impact.get("adjusted_home_prob", home_prob)
+                away_prob = weather_impact.get("adjusted_away_prob", away_prob)
+            
+            predictions.append(GamePrediction(
+                game_id=game["game_id"],
+                home_team=home_team,
+                away_team=away_team,
+                predicted_winner=home_team if home_prob > away_prob else away_team,
+                home_win_probability=home_prob,
+                away_win_probability=away_prob,
+                confidence=abs(home_prob - away_prob),
+                weather_impact=weather_impact,
+                key_factors=self._identify_key_factors(
+                    team_stats.get(home_team, {}), team_stats.get(away_team, {}), weather_data
+                )
+            ))
+        
+        return predictions
+    
     def _calculate_team_strength(self, stats: Dict) -> float:
         """Calculate overall team strength from statistics"""
+        return float(self._team_strengths([stats])[0])
+    
+    @staticmethod
+    def _team_strengths(stats_list: List[Dict]) -> np.ndarray:
+        """Calculate team strengths for many teams as an array"""
         # Weighted combination of key metrics
-        win_rate = stats.get("win_rate", 0.5)
-        points_per_game = stats.get("points_per_game", 0)
-        points_allowed = stats.get("points_allowed_per_game", 0)
-        recent_form = stats.get("recent_form", 0.5)  # Last 5-10 games
+        win_rate = np.array([stats.get("win_rate", 0.5) for stats in stats_list], dtype=np.float64)
+        points_per_game = np.array([stats.get("points_per_game", 0) for stats in stats_list], dtype=np.float64)
+        points_allowed = np.array([stats.get("points_allowed_per_game", 0) for stats in stats_list], dtype=np.float64)
+        recent_form = np.array([stats.get("recent_form", 0.5) for stats in stats_list], dtype=np.float64)  # Last 5-10 games
         
         # Normalize and combine
         strength = (
@@ -124,7 +196,7 @@ class GamePredictor:
             recent_form * 0.1
         )
         
-        return max(0.1, min(0.9, strength))  # Clamp between 0.1 and 0.9
+        return np.clip(strength, 0.1, 0.9)  # Clamp between 0.1 and 0.9
     
     def _apply_weather_adjustment(
         self,
@@ -0,0 +1,387 @@
+"""
+Vectorized Monte Carlo simulation engine
+"""
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime
+import importlib
+import math
+import numpy as np
+from app.models.prediction_models import GamePredictor
+
+
+# Percentiles reported for simulated score differences
+MARGIN_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Percentiles reported for simulated season wins
+WINS_PERCENTILES = (10, 25, 50, 75, 90)
+
+# Schedule tuples (away_team, home_team, date, time, city, state) per sport
+SCHEDULE_SOURCES = {
+    "nfl": ("app.data.nfl_schedule", "NFL_SCHEDULE_DEC_2025"),
+    "nba": ("app.data.nba_schedule", "NBA_SCHEDULE_DEC_2025"),
+    "mlb": ("app.data.mlb_schedule", "MLB_SCHEDULE_DEC_2025"),
+    "nhl": ("app.data.nhl_schedule", "NHL_SCHEDULE_DEC_2025"),
+}
+
+# Playoff field size and games per playoff series
+PLAYOFF_TEAMS = {"nfl": 14, "nba": 16, "mlb": 12, "nhl": 16}
+SERIES_LENGTH = {"nfl": 1, "nba": 7, "mlb": 7, "nhl": 7}
+
+
+class MonteCarloSimulator:
+    """
+    Simulates game outcomes with NumPy array operations
+
+    Every simulation is drawn at once from a seeded np.random.Generator
+    instead of one Python-level RNG call per iteration, so a million runs
+    cost a few vectorized passes over float32 arrays.
+    """
+
+    def __init__(self, margin_mean: float = 7.0, margin_std: float = 10.0):
+        """
+        Initialize the simulator
+
+        Args:
+            margin_mean: Mean winning margin in points
+            margin_std: Standard deviation of the margin in points
+        """
+        self.margin_mean = margin_mean
+        self.margin_std = margin_std
+
+    def simulate_game(
+        self,
+        home_win_prob: float,
+        num_simulations: int = 10000,
+        seed: Optional[int] = None
+    ) -> Dict:
+        """
+        Simulate a game many times
+
+        Each run picks a winner with probability home_win_prob, then draws
+        the score difference (home minus away) from a normal distribution
+        centered on +margin_mean for a home win and -margin_mean for an away win.
+
+        Args:
+            home_win_prob: Probability that the home team wins
+            num_simulations: Number of simulated games
+            seed: Seed for reproducible results (None draws fresh entropy)
+
+        Returns:
+            Dictionary with win counts and score difference statistics
+        """
+        rng = np.random.default_rng(seed)
+
+        home_won = rng.random(num_simulations) < home_win_prob
+        home_wins = int(np.count_nonzero(home_won))
+
+        # margin = +/-mean + std * z, built in place on a float32 buffer
+        margins = rng.standard_normal(num_simulations, dtype=np.float32)
+        margins *= self.margin_std
+        np.add(margins, self.margin_mean, out=margins, where=home_won)
+        np.subtract(margins, self.margin_mean, out=margins, where=~home_won)
+
+        mean = float(margins.mean(dtype=np.float64))
+        std = float(margins.std(dtype=np.float64))
+        percentiles = np.percentile(margins, MARGIN_PERCENTILES)
+
+        return {
+            "num_simulations": num_simulations,
+            "home_wins": home_wins,
+            "away_wins": num_simulations - home_wins,
+            "margin_mean": mean,
+            "margin_std": std,
+            "margin_percentiles": {
+                f"p{p}": float(value) for p, value in zip(MARGIN_PERCENTILES, percentiles)
+            }
+        }
+
+
+class SeasonSimulator:
+    """
+    Simulates the rest of a league season for every team at once
+
+    Remaining games come from the *_schedule modules and each game's home
+    win probability from GamePredictor. A run is a (simulations x games)
+    boolean matrix of home wins; one matrix product with the schedule's
+    team incidence matrix turns it into (simulations x teams) win totals.
+    Standings seed a single-elimination bracket (best-of-N series where
+    the sport plays them) that is also resolved with array operations.
+    """
+
+    def __init__(
+        self,
+        predictor: Optional[GamePredictor] = None,
+        data_collector=None,
+        batch_size: int = 20000
+    ):
+        """
+        Initialize the simulator
+
+        Args:
+            predictor: Game predictor used for per-game win probabilities
+            data_collector: SportsDataCollector used for team statistics
+            batch_size: Simulations drawn per batch (bounds memory use)
+        """
+        if data_collector is None:
+            from app.services import get_services
+            data_collector = get_services().data_collector
+        self.predictor = predictor or GamePredictor()
+        self.data_collector = data_collector
+        self.batch_size = batch_size
+
+    def remaining_schedule(self, sport: str, as_of: Optional[date] = None) -> Tuple[List[Tuple[str, str]], Optional[str]]:
+        """
+        Get the games left to play
+
+        The schedule modules hold a fixed sample window; when every listed
+        game is before as_of, the whole window is simulated instead.
+
+        Args:
+            sport: Sport type
+            as_of: First day counted as remaining (defaults to today)
+
+        Returns:
+            ((home_team, away_team) pairs, first date simulated)
+        """
+        source = SCHEDULE_SOURCES.get(sport)
+        if source is None:
+            return [], None
+        schedule = getattr(importlib.import_module(source[0]), source[1], None) or []
+
+        as_of = (as_of or datetime.now().date()).isoformat()
+        remaining = [game for game in schedule if game[2] >= as_of] or list(schedule)
+        if not remaining:
+            return [], None
+        return [(home, away) for away, home, *_ in remaining], min(game[2] for game in remaining)
+
+    def simulate_league(
+        self,
+        sport: str = "nfl",
+        num_simulations: int = 10000,
+        seed: Optional[int] = None,
+        as_of: Optional[date] = None
+    ) -> Dict:
+        """
+        Simulate the remaining season for every team in a league
+
+        Args:
+            sport: Sport type
+            num_simulations: Number of league-seasons to simulate
+            seed: Seed for reproducible results (None draws fresh entropy)
+            as_of: First day counted as remaining (defaults to today)
+
+        Returns:
+            Dictionary with per-team win distributions, playoff and
+            championship probabilities, and projected standings
+
+        Raises:
+            ValueError: If there is no schedule data for the sport
+        """
+        games, schedule_start = self.remaining_schedule(sport, as_of)
+        if not games:
+            raise ValueError(f"No schedule data available for {sport}")
+
+        teams = sorted({team for game in games for team in game})
+        index = {team: i for i, team in enumerate(teams)}
+        num_teams, num_games = len(teams), len(games)
+        home_idx = np.array([index[home] for home, _ in games])
+        away_idx = np.array([index[away] for _, away in games])
+
+        stats = {team: self.data_collector.get_team_stats(team, sport) for team in teams}
+        home_probs, pair_probs = self._win_probabilities(teams, games, stats)
+        # Wins already banked this season; standings rank on current plus simulated wins
+        current_wins = np.array([self._current_wins(stats[team]) for team in teams], dtype=np.int64)
+
+        # wins = home_won @ (H - A) + games_away, with H/A the one-hot
+        # (games x teams) home and away incidence matrices
+        incidence = np.zeros((num_games, num_teams), dtype=np.float32)
+        incidence[np.arange(num_games), home_idx] += 1
+        incidence[np.arange(num_games), away_idx] -= 1
+        away_games = np.bincount(away_idx, minlength=num_teams).astype(np.float32)
+        team_games = np.bincount(home_idx, minlength=num_teams) + np.bincount(away_idx, minlength=num_teams)
+
+        field = min(PLAYOFF_TEAMS.get(sport, 16), num_teams)
+        series_probs = self._series_probabilities(pair_probs, SERIES_LENGTH.get(sport, 1))
+
+        rng = np.random.default_rng(seed)
+        max_wins = num_games
+        wins_hist = np.zeros((num_teams, max_wins + 1), dtype=np.int64)
+        playoff_counts = np.zeros(num_teams, dtype=np.int64)
+        title_counts = np.zeros(num_teams, dtype=np.int64)
+        seed_sums = np.zeros(num_teams, dtype=np.float64)
+
+        remaining = num_simulations
+        while remaining > 0:
+            batch = min(self.batch_size, remaining)
+            remaining -= batch
+
+            home_won = (rng.random((batch, num_games), dtype=np.float32) < home_probs).astype(np.float32)
+            wins = np.rint(home_won @ incidence + away_games).astype(np.int64)
+
+            offsets = np.arange(num_teams) * (max_wins + 1)
+            wins_hist += np.bincount(
+                (wins + offsets).ravel(), minlength=num_teams * (max_wins + 1)
+            ).reshape(num_teams, max_wins + 1)
+
+            # Rank by final wins with a random tiebreak; column j of standings is the (j+1)-th seed
+            standings = np.argsort(-(wins + current_wins + rng.random((batch, num_teams))), axis=1)
+            ranks = np.empty_like(standings)
+            np.put_along_axis(ranks, standings, np.arange(num_teams), axis=1)
+            seed_sums += ranks.sum(axis=0) + batch
+
+            playoff_seeds = standings[:, :field]
+            playoff_counts += np.bincount(playoff_seeds.ravel(), minlength=num_teams)
+
+            champions = self._simulate_bracket(playoff_seeds, series_probs, rng)
+            title_counts += np.bincount(champions, minlength=num_teams)
+
+        return self._summarize(
+            sport, teams, team_games, current_wins, wins_hist, playoff_counts, title_counts, seed_sums,
+            num_simulations, num_games, field, schedule_start
+        )
+
+    @staticmethod
+    def _current_wins(stats: Dict) -> int:
+        """Wins so far this season from a team's home and away records (0 if unknown)"""
+        return sum(int(stats.get(record, {}).get("wins", 0)) for record in ("home_record", "away_record"))
+
+    def _win_probabilities(
+        self,
+        teams: List[str],
+        games: List[Tuple[str, str]],
+        stats: Dict[str, Dict]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get home win probabilities for the schedule and a neutral-site matrix
+
+        Args:
+            teams: Team names
+            games: (home_team, away_team) pairs
+            stats: Team statistics by team name
+
+        Returns:
+            (per-game home win probabilities, teams x teams matrix where
+            [i, j] is the probability team i beats team j at a neutral site)
+        """
+        def home_prob(home: str, away: str) -> float:
+            return self.predictor.predict_game(home, away, stats[home], stats[away]).home_win_probability
+
+        game_probs = np.array([home_prob(home, away) for home, away in games], dtype=np.float32)
+
+        # Average both venues to remove home advantage for playoff games
+        hosted = np.array([[home_prob(a, b) if a != b else 0.5 for b in teams] for a in teams])
+        neutral = (hosted + (1 - hosted.T)) / 2
+        return game_probs, neutral
+
+    @staticmethod
+    def _series_probabilities(game_probs: np.ndarray, length: int) -> np.ndarray:
+        """Probability of winning a best-of-length series given per-game probabilities"""
+        if length <= 1:
+            return game_probs
+        # Winning a best-of-n equals winning at least (n+1)/2 of n games
+        needed = length // 2 + 1
+        total = np.zeros_like(game_probs)
+        for k in range(needed, length + 1):
+            total += math.comb(length, k) * game_probs ** k * (1 - game_probs) ** (length - k)
+        return total
+
+    @staticmethod
+    def _bracket_order(size: int) -> List[int]:
+        """Seed positions of a standard bracket (1 vs N, 2 vs N-1, ...) for a power-of-two size"""
+        order = [0]
+        while len(order) < size:
+            slots = len(order) * 2
+            order = [pos for seed in order for pos in (seed, slots - 1 - seed)]
+        return order
+
+    def _simulate_bracket(self, playoff_seeds: np.ndarray, series_probs: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """
+        Play single-elimination brackets for a batch of seedings
+
+        Args:
+            playoff_seeds: (batch x field) team indices ordered by seed
+            series_probs: teams x teams series win probabilities
+            rng: Random generator
+
+        Returns:
+            Champion team index for each simulation
+        """
+        batch, field = playoff_seeds.shape
+        size = 1 << max(field - 1, 0).bit_length()
+
+        # Top seeds get byes (-1) when the field is not a power of two
+        padded = np.full((batch, size), -1, dtype=np.int64)
+        padded[:, :field] = playoff_seeds
+        alive = padded[:, self._bracket_order(size)]
+
+        while alive.shape[1] > 1:
+            first, second = alive[:, 0::2], alive[:, 1::2]
+            bye = second < 0
+            probs = series_probs[first, np.where(bye, first, second)]
+            first_wins = bye | (rng.random(first.shape) < probs)
+            alive = np.where(first_wins, first, second)
+        return alive[:, 0]
+
+    @staticmethod
+    def _summarize(
+        sport: str,
+        teams: List[str],
+        team_games: np.ndarray,
+        current_wins: np.ndarray,
+        wins_hist: np.ndarray,
+        playoff_counts: np.ndarray,
+        title_counts: np.ndarray,
+        seed_sums: np.ndarray,
+        num_simulations: int,
+        num_games: int,
+        field: int,
+        schedule_start: Optional[str]
+    ) -> Dict:
+        """
+        Turn accumulated counts into per-team results and projected standings
+
+        wins_hist counts wins over the remaining games; expected_wins and
+        wins_distribution are projected final totals (current wins added).
+        """
+        win_values = np.arange(wins_hist.shape[1])
+        cumulative = np.cumsum(wins_hist, axis=1)
+
+        results = {}
+        for i, team in enumerate(teams):
+            counts = wins_hist[i]
+            mean = float(counts @ win_values) / num_simulations
+            std = float(np.sqrt(max(counts @ (win_values ** 2) / num_simulations - mean ** 2, 0.0)))
+            played = np.nonzero(counts)[0]
+            # Smallest win total whose cumulative share reaches each percentile
+            percentiles = np.searchsorted(cumulative[i], np.array(WINS_PERCENTILES) / 100 * num_simulations)
+            current = int(current_wins[i])
+            results[team] = {
+                "games_remaining": int(team_games[i]),
+                "current_wins": current,
+                "expected_remaining_wins": round(mean, 2),
+                "expected_wins": round(current + mean, 2),
+                "wins_distribution": {
+                    "min": current + int(played.min()),
+                    "max": current + int(played.max()),
+                    "mean": round(current + mean, 2),
+                    "std": round(std, 2),
+                    "percentiles": {f"p{p}": current + int(v) for p, v in zip(WINS_PERCENTILES, percentiles)}
+                },
+                "expected_seed": round(float(seed_sums[i]) / num_simulations, 2),
+                "playoff_probability": round(int(playoff_counts[i]) / num_simulations, 4),
+                "championship_probability": round(int(title_counts[i]) / num_simulations, 4)
+            }
+
+        standings = sorted(teams, key=lambda team: (-results[team]["expected_wins"], results[team]["expected_seed"]))
+        return {
+            "sport": sport,
+            "num_simulations": num_simulations,
+            "remaining_games": num_games,
+            "schedule_start": schedule_start,
+            "playoff_teams": field,
+            "standings": [
+                {"rank": rank, "team": team, **results[team]}
+                for rank, team in enumerate(standings, start=1)
+            ],
+            "teams": results
+        }
@@ -1,18 +1,60 @@
 """
 Weather data collection and analysis
 """
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
-import requests
+import time
 from app.config import settings
+from app.cache.redis_cache import get_cache, get_async_cache
+from app.data.city_coordinates import get_city_coordinates
+from app.utils.http_client import HttpClient, AsyncHttpClient, get_http_client, get_async_http_client
+
+
+# Coordinates are rounded to 2 decimals (about 1 km) so nearby lookups share cache entries
+COORDINATE_DECIMALS = 2
+
+# OpenWeatherMap forecasts come in 3-hour slots
+FORECAST_SLOT_SECONDS = 3 * 3600
+
+
+def round_coordinates(lat: float, lon: float) -> Tuple[float, float]:
+    """Round a location to the precision weather is cached at"""
+    return round(float(lat), COORDINATE_DECIMALS), round(float(lon), COORDINATE_DECIMALS)
+
+
+def current_hour() -> int:
+    """Hours since the epoch; current weather is cached per hour bucket"""
+    return int(time.time() // 3600)
+
+
+def weather_cache_key(kind: str, lat: float, lon: float, hour: Optional[int] = None) -> str:
+    """
+    Cache key for weather at a rounded location
+    
+    Args:
+        kind: "current" or "forecast"
+        lat: Rounded latitude
+        lon: Rounded longitude
+        hour: Hour bucket (current weather only)
+    """
+    key = f"weather:{kind}:{lat:.{COORDINATE_DECIMALS}f}:{lon:.{COORDINATE_DECIMALS}f}"
+    return key if hour is None else f"{key}:{hour}"
 
 
 class WeatherAnalyzer:
     """Handles weather data collection and analysis"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[HttpClient] = None):
+        """
+        Initialize the analyzer
+        
+        Args:
+            api_key: OpenWeatherMap API key (defaults to settings.WEATHER_API_KEY)
+            http_client: Pooled HTTP client (defaults to the process-wide one)
+        """
         self.api_key = api_key or settings.WEATHER_API_KEY
         self.base_url = "https://api.openweathermap.org/data/2.5"
+        self.http_client = http_client or get_http_client()
     
     def get_weather_for_location(
         self,
@@ -36,6 +78,13 @@ class WeatherAnalyzer:
             location_str = f"{city}, {state}" if state else city
             return self._get_mock_weather(location_str)
         
+        # Known cities share the coordinate-keyed cache
+        coordinates = get_city_coordinates(city, state)
+        if coordinates:
+            weather = self.get_weather_for_coordinates(*coordinates)
+            weather["location"] = f"{city}, {state}" if state else city
+            return weather
+        
         try:
             location = f"{city},{state},{country}" if state else f"{city},{country}"
             url = f"{self.base_url}/weather"
@@ -45,25 +94,8 @@ class WeatherAnalyzer:
                 "units": "imperial"
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            return {
-                "temp": data["main"]["temp"],
-                "feels_like": data["main"]["feels_like"],
-                "humidity": data["main"]["humidity"],
-                "wind_speed": data["wind"].get("speed", 0),
-                "wind_direction": data["wind"].get("deg", 0),
-                "precipitation": data.get("rain", {}).get("1h", 0) or 
-                               data.get("snow", {}).get("1h", 0),
-                "conditions": data["weather"][0]["main"].lower(),
-                "description": data["weather"][0]["description"],
-                "visibility": data.get("visibility", 10000) / 1000,  # Convert to km
-                "pressure": data["main"]["pressure"],
-                "location": f"{city}, {state}" if state else city
-            }
+            data = self.http_client.get_json(url, params=params)
+            return self._parse_current(data, f"{city}, {state}" if state else city)
         except Exception as e:
             print(f"Error fetching weather: {e}")
             return self._get_mock_weather()
@@ -87,6 +119,13 @@ class WeatherAnalyzer:
             location_str = f"({lat}, {lon})"
             return self._get_mock_weather(location_str)
         
+        lat, lon = round_coordinates(lat, lon)
+        key = weather_cache_key("current", lat, lon, current_hour())
+        cache = get_cache()
+        weather = cache.get(key)
+        if weather is not None:
+            return dict(weather)
+        
         try:
             url = f"{self.base_url}/weather"
             params = {
@@ -96,29 +135,32 @@ class WeatherAnalyzer:
                 "units": "imperial"
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            return {
-                "temp": data["main"]["temp"],
-                "feels_like": data["main"]["feels_like"],
-                "humidity": data["main"]["humidity"],
-                "wind_speed": data["wind"].get("speed", 0),
-                "wind_direction": data["wind"].get("deg", 0),
-                "precipitation": data.get("rain", {}).get("1h", 0) or 
-                               data.get("snow", {}).get("1h", 0),
-                "conditions": data["weather"][0]["main"].lower(),
-                "description": data["weather"][0]["description"],
-                "visibility": data.get("visibility", 10000) / 1000,
-                "pressure": data["main"]["pressure"],
-                "location": f"({lat}, {lon})"
-            }
+            data = self.http_client.get_json(url, params=params)
+            weather = self._parse_current(data, f"({lat}, {lon})")
+            cache.set(key, weather, ttl=settings.WEATHER_CURRENT_TTL)
+            return dict(weather)
         except Exception as e:
             print(f"Error fetching weather: {e}")
             return self._get_mock_weather()
     
+    @staticmethod
+    def _parse_current(data: Dict, location: str) -> Dict:
+        """Convert an OpenWeatherMap current weather response to our weather format"""
+        return {
+            "temp": data["main"]["temp"],
+            "feels_like": data["main"]["feels_like"],
+            "humidity": data["main"]["humidity"],
+            "wind_speed": data["wind"].get("speed", 0),
+            "wind_direction": data["wind"].get("deg", 0),
+            "precipitation": data.get("rain", {}).get("1h", 0) or 
+                           data.get("snow", {}).get("1h", 0),
+            "conditions": data["weather"][0]["main"].lower(),
+            "description": data["weather"][0]["description"],
+            "visibility": data.get("visibility", 10000) / 1000,  # Convert to km
+            "pressure": data["main"]["pressure"],
+            "location": location
+        }
+    
     def get_weather_for_game_date(
         self,
         city: str,
@@ -142,68 +184,23 @@ class WeatherAnalyzer:
         Returns:
             Dictionary with weather data for the game date
         """
-        from datetime import datetime, timedelta
-        
-        # If no game date provided, get current weather
-        if not game_date:
-            if lat and lon:
-                return self.get_weather_for_coordinates(lat, lon)
-            else:
-                return self.get_weather_for_location(city, state, country)
-        
-        # Calculate days until game
-        now = datetime.now()
-        days_until_game = (game_date.date() - now.date()).days
-        
-        # If game is today or in the past, get current weather
-        if days_until_game <= 0:
-            if lat and lon:
-                return self.get_weather_for_coordinates(lat, lon)
-            else:
-                return self.get_weather_for_location(city, state, country)
+        location_str = f"{city}, {state}" if state else city
+        if lat is None or lon is None:
+            coordinates = get_city_coordinates(city, state) if city else None
+            if coordinates:
+                lat, lon = coordinates
         
-        # If game is more than 5 days away, use current weather (forecast limited)
-        if days_until_game > 5:
-            if lat and lon:
-                return self.get_weather_for_coordinates(lat, lon)
+        if game_date:
+            if lat is not None and lon is not None:
+                # Nearest 3-hour slot of the location's cached 5-day forecast
+                weather = self.forecast_slot(self.get_forecast_for_coordinates(lat, lon), game_date)
             else:
-                return self.get_weather_for_location(city, state, country)
-        
-        # Get forecast for the game date
-        forecast = self.get_forecast(city, state, country, days=days_until_game + 1)
-        
-        if forecast and forecast.get("forecasts"):
-            # Find the forecast closest to game time
-            game_timestamp = game_date.timestamp()
-            closest_forecast = None
-            min_diff = float('inf')
-            
-            for fc in forecast["forecasts"]:
-                diff = abs(fc["datetime"] - game_timestamp)
-                if diff < min_diff:
-                    min_diff = diff
-                    closest_forecast = fc
-            
-            if closest_forecast:
-                # Convert forecast to weather format
-                return {
-                    "temp": closest_forecast["temp"],
-                    "feels_like": closest_forecast["temp"],  # Approximate
-                    "humidity": 65,  # Default, forecast doesn't always include
-                    "wind_speed": closest_forecast["wind_speed"],
-                    "wind_direction": 0,  # Forecast doesn't always include
-                    "precipitation": closest_forecast["precipitation"],
-                    "conditions": closest_forecast["conditions"],
-                    "description": closest_forecast["conditions"],
-                    "visibility": 10,  # Default
-                    "pressure": 1013,  # Default
-                    "is_forecast": True,
-                    "forecast_date": game_date.isoformat()
-                }
+                weather = self._city_forecast_weather(city, state, country, game_date)
+            if weather:
+                return weather
         
-        # Fallback to current weather
-        location_str = f"{city}, {state}" if state else city
-        if lat and lon:
+        # No game date, or the game is outside the forecast window: use current weather
+        if lat is not None and lon is not None:
             weather = self.get_weather_for_coordinates(lat, lon)
         else:
             weather = self.get_weather_for_location(city, state, country)
@@ -214,6 +211,156 @@ class WeatherAnalyzer:
         
         return weather
     
+    def _city_forecast_weather(
+        self,
+        city: str,
+        state: Optional[str],
+        country: str,
+        game_date: datetime
+    ) -> Optional[Dict]:
+        """Forecast for a game date at a city without known coordinates (not cached)"""
+        # Calculate days until game; the forecast covers the next 5 days
+        days_until_game = (game_date.date() - datetime.now().date()).days
+        if days_until_game <= 0 or days_until_game > 5:
+            return None
+        
+        forecast = self.get_forecast(city, state, country, days=days_until_game + 1)
+        if not forecast or not forecast.get("forecasts"):
+            return None
+        
+        # Find the forecast closest to game time
+        game_timestamp = game_date.timestamp()
+        closest_forecast = min(forecast["forecasts"], key=lambda fc: abs(fc["datetime"] - game_timestamp))
+        
+        # Convert forecast to weather format
+        return {
+            "temp": closest_forecast["temp"],
+            "feels_like": closest_forecast["temp"],  # Approximate
+            "humidity": 65,  # Default, forecast doesn't always include
+            "wind_speed": closest_forecast["wind_speed"],
+            "wind_direction": 0,  # Forecast doesn't always include
+            "precipitation": closest_forecast["precipitation"],
+            "conditions": closest_forecast["conditions"],
+            "description": closest_forecast["conditions"],
+            "visibility": 10,  # Default
+            "pressure": 1013,  # Default
+            "is_forecast": True,
+            "forecast_date": game_date.isoformat()
+        }
+    
+    def get_forecast_for_coordinates(self, lat: float, lon: float) -> Optional[Dict]:
+        """
+        Raw 5-day / 3-hour OpenWeatherMap forecast for a location
+        
+        The payload is cached once per rounded location for WEATHER_FORECAST_TTL
+        seconds, so every game at a venue within that window shares one API call.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+        
+        Returns:
+            The /forecast response, or None without an API key or on error
+        """
+        if not self.api_key:
+            return None
+        
+        lat, lon = round_coordinates(lat, lon)
+        key = weather_cache_key("forecast", lat, lon)
+        payload = get_cache().get(key)
+        if payload is not None:
+            return payload
+        
+        try:
+            payload = self.http_client.get_json(f"{self.base_url}/forecast", params={
+                "lat": lat,
+                "lon": lon,
+                "appid": self.api_key,
+                "units": "imperial"
+            })
+        except Exception as e:
+            print(f"Error fetching forecast: {e}")
+            return None
+        get_cache().set(key, payload, ttl=settings.WEATHER_FORECAST_TTL)
+        return payload
+    
+    async def refresh_forecast_async(
+        self,
+        lat: float,
+        lon: float,
+        http_client: Optional[AsyncHttpClient] = None
+    ) -> bool:
+        """
+        Fetch a location's forecast and store it in the weather cache
+        
+        Unlike get_forecast_for_coordinates this always calls the API, so a
+        periodic caller keeps the entry fresh before it expires.
+        
+        Args:
+            lat: Latitude
+            lon: Longitude
+            http_client: Async HTTP client (defaults to the process-wide one)
+        
+        Returns:
+            True if the forecast was fetched and stored
+        """
+        if not self.api_key:
+            return False
+        
+        lat, lon = round_coordinates(lat, lon)
+        try:
+            client = http_client or get_async_http_client()
+            payload = await client.get_json(f"{self.base_url}/forecast", params={
+                "lat": lat,
+                "lon": lon,
+                "appid": self.api_key,
+                "units": "imperial"
+            })
+        except Exception as e:
+            print(f"Error fetching forecast for ({lat}, {lon}): {e}")
+            return False
+        return await get_async_cache().set(
+            weather_cache_key("forecast", lat, lon), payload, ttl=settings.WEATHER_FORECAST_TTL
+        )
+    
+    @staticmethod
+    def forecast_slot(payload: Optional[Dict], when: datetime) -> Optional[Dict]:
+        """
+        Weather from the forecast slot nearest to a time
+        
+        Args:
+            payload: Raw /forecast response (see get_forecast_for_coordinates)
+            when: Time to look up (naive datetimes are local time)
+        
+        Returns:
+            Weather dictionary, or None if when is outside the forecast window
+        """
+        slots = (payload or {}).get("list") or []
+        if not slots:
+            return None
+        
+        timestamp = when.timestamp()
+        half_slot = FORECAST_SLOT_SECONDS / 2
+        if timestamp < slots[0]["dt"] - half_slot or timestamp > slots[-1]["dt"] + half_slot:
+            return None
+        
+        slot = min(slots, key=lambda item: abs(item["dt"] - timestamp))
+        return {
+            "temp": slot["main"]["temp"],
+            "feels_like": slot["main"].get("feels_like", slot["main"]["temp"]),
+            "humidity": slot["main"].get("humidity", 65),
+            "wind_speed": slot.get("wind", {}).get("speed", 0),
+            "wind_direction": slot.get("wind", {}).get("deg", 0),
+            "precipitation": slot.get("rain", {}).get("3h", 0) or 
+                           slot.get("snow", {}).get("3h", 0),
+            "conditions": slot["weather"][0]["main"].lower(),
+            "description": slot["weather"][0]["description"],
+            "visibility": slot.get("visibility", 10000) / 1000,  # Convert to km
+            "pressure": slot["main"].get("pressure", 1013),
+            "is_forecast": True,
+            "forecast_date": when.isoformat()
+        }
+    
     def get_forecast(
         self,
         city: str,
@@ -246,10 +393,7 @@ class WeatherAnalyzer:
                 "cnt": days * 8  # 8 forecasts per day (3-hour intervals)
             }
             
-            response = requests.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = self.http_client.get_json(url, params=params)
             
             # Process forecast data
             forecasts = []
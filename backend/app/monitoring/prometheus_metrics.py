@@ -90,6 +90,13 @@ redis_connected = Gauge(
     'Redis connection status (1 = connected, 0 = disconnected)'
 )
 
+# Startup metrics
+startup_duration_seconds = Gauge(
+    'startup_duration_seconds',
+    'Seconds spent on each startup step of this worker',
+    ['kind', 'name']
+)
+
 
 def record_request(method: str, endpoint: str, status_code: int, duration: float):
     """Record HTTP request metrics"""
@@ -137,6 +144,11 @@ def set_redis_status(connected: bool):
     redis_connected.set(1 if connected else 0)
 
 
+def record_startup_duration(kind: str, name: str, seconds: float):
+    """Record how long a module import or warm-up phase took"""
+    startup_duration_seconds.labels(kind=kind, name=name).set(seconds)
+
+
 def get_metrics():
     """Get Prometheus metrics"""
     return generate_latest()
@@ -1,29 +1,19 @@
 """
 API routes for best betting opportunities
 """
-from fastapi import APIRouter, HTTPException
-from typing import List, Optional
-from app.models.betting_models import BettingAnalyzer
-from app.models.prediction_models import GamePredictor, PlayerPropPredictor
-from app.models.weather_analyzer import WeatherAnalyzer
-from app.data.sports_data import SportsDataCollector
-from app.data.odds_collector import OddsCollector
-from app.data.injury_data import InjuryDataCollector
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, List, Optional
+from app.cache.redis_cache import cached_batch
+from app.services import ServiceContainer, get_services
 
 router = APIRouter()
-betting_analyzer = BettingAnalyzer()
-game_predictor = GamePredictor()
-player_predictor = PlayerPropPredictor()
-weather_analyzer = WeatherAnalyzer()
-data_collector = SportsDataCollector()
-odds_collector = OddsCollector()
-injury_collector = InjuryDataCollector()
 
 
 @router.get("/best-bets")
 async def get_best_bets(
     sport: str = "nfl",
-    limit: int = 10
+    limit: int = 10,
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Get the best betting opportunities across all games
@@ -37,117 +27,14 @@ async def get_best_bets(
     """
     try:
         # Get upcoming games
-        games = data_collector.get_upcoming_games(sport, days_ahead=7)
+        games = services.data_collector.get_upcoming_games(sport, days_ahead=7)
         
-        best_bets = []
+        # Check more games than needed; cached games cost one batched read
+        game_bets = await _analyze_games(games[:limit * 2], sport, services)
         
-        for game in games[:limit * 2]:  # Check more games than needed
-            game_id = game["game_id"]
-            
-            # Get prediction
-            try:
-                # Get team stats
-                home_stats = data_collector.get_team_stats(
-                    game["home_team"], sport
-                )
-                away_stats = data_collector.get_team_stats(
-                    game["away_team"], sport
-                )
-                
-                # Get weather
-                weather_data = None
-                if "location" in game:
-                    location = game["location"]
-                    if "city" in location:
-                        weather_data = weather_analyzer.get_weather_for_location(
-                            location["city"],
-                            location.get("state"),
-                            location.get("country", "US")
-                        )
-                
-                # Get injury data
-                home_injuries = injury_collector.get_team_injuries(
-                    game["home_team"], sport
-                )
-                away_injuries = injury_collector.get_team_injuries(
-                    game["away_team"], sport
-                )
-                
-                # Make prediction
-                prediction = game_predictor.predict_game(
-                    game["home_team"],
-                    game["away_team"],
-                    home_stats,
-                    away_stats,
-                    weather_data,
-                    game_id,
-                    home_injuries,
-                    away_injuries
-                )
-                
-                # Get odds
-                odds_data = odds_collector.get_odds_for_game(
-                    game_id,
-                    game["home_team"],
-                    game["away_team"],
-                    sport
-                )
-                
-                # Analyze bets for each platform
-                for platform, odds in odds_data.items():
-                    if not odds.get("available", False):
-                        continue
-                    
-                    # Analyze home team bet
-                    if odds.get("home_team_odds"):
-                        home_opportunity = betting_analyzer.analyze_bet(
-                            prediction.home_win_probability,
-                            odds["home_team_odds"],
-                            "team_win",
-                            game["home_team"],
-                            platform
-                        )
-                        
-                        if home_opportunity.expected_value > 0:
-                            best_bets.append({
-                                "game_id": game_id,
-                                "bet_type": "team_win",
-                                "selection": game["home_team"],
-                                "platform": platform,
-                                "odds": home_opportunity.odds,
-                                "expected_value": round(home_opportunity.expected_value, 3),
-                                "kelly_percentage": round(home_opportunity.kelly_percentage, 3),
-                                "recommendation": home_opportunity.recommendation,
-                                "true_probability": round(home_opportunity.true_probability, 3),
-                                "implied_probability": round(home_opportunity.implied_probability, 3)
-                            })
-                    
-                    # Analyze away team bet
-                    if odds.get("away_team_odds"):
-                        away_opportunity = betting_analyzer.analyze_bet(
-                            prediction.away_win_probability,
-                            odds["away_team_odds"],
-                            "team_win",
-                            game["away_team"],
-                            platform
-                        )
-                        
-                        if away_opportunity.expected_value > 0:
-                            best_bets.append({
-                                "game_id": game_id,
-                                "bet_type": "team_win",
-                                "selection": game["away_team"],
-                                "platform": platform,
-                                "odds": away_opportunity.odds,
-                                "expected_value": round(away_opportunity.expected_value, 3),
-                                "kelly_percentage": round(away_opportunity.kelly_percentage, 3),
-                                "recommendation": away_opportunity.recommendation,
-                                "true_probability": round(away_opportunity.true_probability, 3),
-                                "implied_probability": round(away_opportunity.implied_probability, 3)
-                            })
-            except Exception as e:
-                # Skip games with errors
-                continue
+        best_bets = []
+        for game in games[:limit * 2]:
+            best_bets.extend(game_bets.get(game["game_id"], []))
         
         # Sort by expected value and return top bets
         best_bets.sort(key=lambda x: x["expected_value"], reverse=True)
@@ -161,10 +48,147 @@ async def get_best_bets(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@cached_batch(
+    ttl=300,
+    key_prefix="best_bets",
+    item_key=lambda game: game["game_id"],
+    namespaces=["game:{game_id}"]
+)
+async def _analyze_games(games: List[Dict], sport: str, services: ServiceContainer) -> Dict[str, List[Dict]]:
+    """
+    Find positive expected value team bets for each game
+    
+    Args:
+        games: Game dictionaries
+        sport: Sport type
+        services: Shared collectors and predictors
+    
+    Returns:
+        Mapping of game_id to its positive EV bets (games that fail are omitted)
+    """
+    results = {}
+    for game in games:
+        try:
+            results[game["game_id"]] = _analyze_game(game, sport, services)
+        except Exception as e:
+            # Skip games with errors
+            continue
+    return results
+
+
+def _analyze_game(game: Dict, sport: str, services: ServiceContainer) -> List[Dict]:
+    """Predict a game and return its positive expected value bets across platforms"""
+    game_id = game["game_id"]
+    bets = []
+    
+    # Get team stats
+    home_stats = services.data_collector.get_team_stats(
+        game["home_team"], sport
+    )
+    away_stats = services.data_collector.get_team_stats(
+        game["away_team"], sport
+    )
+    
+    # Get weather
+    weather_data = None
+    if "location" in game:
+        location = game["location"]
+        if "city" in location:
+            weather_data = services.weather_analyzer.get_weather_for_location(
+                location["city"],
+                location.get("state"),
+                location.get("country", "US")
+            )
+    
+    # Get injury data
+    home_injuries = services.injury_collector.get_team_injuries(
+        game["home_team"], sport
+    )
+    away_injuries = services.injury_collector.get_team_injuries(
+        game["away_team"], sport
+    )
+    
+    # Make prediction
+    prediction = services.game_predictor.predict_game(
+        game["home_team"],
+        game["away_team"],
+        home_stats,
+        away_stats,
+        weather_data,
+        game_id,
+        home_injuries,
+        away_injuries
+    )
+    
+    # Get odds
+    odds_data = services.odds_collector.get_odds_for_game(
+        game_id,
+        game["home_team"],
+        game["away_team"],
+        sport
+    )
+    
+    # Analyze bets for each platform
+    for platform, odds in odds_data.items():
+        if not odds.get("available", False):
+            continue
+        
+        # Analyze home team bet
+        if odds.get("home_team_odds"):
+            home_opportunity = services.betting_analyzer.analyze_bet(
+                prediction.home_win_probability,
+                odds["home_team_odds"],
+                "team_win",
+                game["home_team"],
+                platform
+            )
+            
+            if home_opportunity.expected_value > 0:
+                bets.append({
+                    "game_id": game_id,
+                    "bet_type": "team_win",
+                    "selection": game["home_team"],
+                    "platform": platform,
+                    "odds": home_opportunity.odds,
+                    "expected_value": round(home_opportunity.expected_value, 3),
+                    "kelly_percentage": round(home_opportunity.kelly_percentage, 3),
+                    "recommendation": home_opportunity.recommendation,
+                    "true_probability": round(home_opportunity.true_probability, 3),
+                    "implied_probability": round(home_opportunity.implied_probability, 3)
+                })
+        
+        # Analyze away team bet
+        if odds.get("away_team_odds"):
+            away_opportunity = services.betting_analyzer.analyze_bet(
+                prediction.away_win_probability,
+                odds["away_team_odds"],
+                "team_win",
+                game["away_team"],
+                platform
+            )
+            
+            if away_opportunity.expected_value > 0:
+                bets.append({
+                    "game_id": game_id,
+                    "bet_type": "team_win",
+                    "selection": game["away_team"],
+                    "platform": platform,
+                    "odds": away_opportunity.odds,
+                    "expected_value": round(away_opportunity.expected_value, 3),
+                    "kelly_percentage": round(away_opportunity.kelly_percentage, 3),
+                    "recommendation": away_opportunity.recommendation,
+                    "true_probability": round(away_opportunity.true_probability, 3),
+                    "implied_probability": round(away_opportunity.implied_probability, 3)
+                })
+    
+    return bets
+
+
 @router.get("/player-bets/{game_id}")
 async def get_best_player_bets(
     game_id: str,
-    limit: int = 5
+    limit: int = 5,
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Get best player prop bets for a game
@@ -177,7 +201,7 @@ async def get_best_player_bets(
         Dictionary with best player prop bets
     """
     try:
-        game = data_collector.get_game_details(game_id)
+        game = services.data_collector.get_game_details(game_id)
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
         
@@ -195,17 +219,17 @@ async def get_best_player_bets(
             for prop_type in player_info["props"]:
                 try:
                     # Get player prediction
-                    player_stats = data_collector.get_player_stats(
+                    player_stats = services.data_collector.get_player_stats(
                         player_name, game.get("sport", "nfl")
                     )
-                    opponent_stats = data_collector.get_team_stats(
+                    opponent_stats = services.data_collector.get_team_stats(
                         game["away_team"], game.get("sport", "nfl")
                     )
                     
                     historical_avg = player_stats.get(f"{prop_type}_avg", 0)
                     
                     # Get odds first to get the line
-                    odds_data = odds_collector.get_player_prop_odds(
+                    odds_data = services.odds_collector.get_player_prop_odds(
                         player_name, prop_type, game_id, game.get("sport", "nfl")
                     )
                     
@@ -220,7 +244,7 @@ async def get_best_player_bets(
                         continue
                     
                     # Make prediction
-                    prediction = player_predictor.predict_player_prop(
+                    prediction = services.player_predictor.predict_player_prop(
                         player_name,
                         prop_type,
                         player_stats,
@@ -236,7 +260,7 @@ async def get_best_player_bets(
                         
                         # Analyze over bet
                         if platform_odds.get("over_odds"):
-                            over_opportunity = betting_analyzer.analyze_bet(
+                            over_opportunity = services.betting_analyzer.analyze_bet(
                                 prediction.over_probability,
                                 platform_odds["over_odds"],
                                 f"player_{prop_type}_over",
@@ -260,7 +284,7 @@ async def get_best_player_bets(
                         
                         # Analyze under bet
                         if platform_odds.get("under_odds"):
-                            under_opportunity = betting_analyzer.analyze_bet(
+                            under_opportunity = services.betting_analyzer.analyze_bet(
                                 prediction.under_probability,
                                 platform_odds["under_odds"],
                                 f"player_{prop_type}_under",
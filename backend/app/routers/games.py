@@ -1,18 +1,18 @@
 """
 API routes for game data
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Optional
-from app.data.sports_data import SportsDataCollector
+from app.services import ServiceContainer, get_services
 
 router = APIRouter()
-data_collector = SportsDataCollector()
 
 
 @router.get("/")
 async def get_upcoming_games(
     sport: str = "nfl",
-    days_ahead: int = 7
+    days_ahead: int = 7,
+    services: ServiceContainer = Depends(get_services)
 ) -> List[dict]:
     """
     Get upcoming games
@@ -25,14 +25,14 @@ async def get_upcoming_games(
         List of upcoming games
     """
     try:
-        games = data_collector.get_upcoming_games(sport, days_ahead)
+        games = services.data_collector.get_upcoming_games(sport, days_ahead)
         return games
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/{game_id}")
-async def get_game_details(game_id: str) -> dict:
+async def get_game_details(game_id: str, services: ServiceContainer = Depends(get_services)) -> dict:
     """
     Get detailed information about a specific game
     
@@ -42,14 +42,14 @@ async def get_game_details(game_id: str) -> dict:
     Returns:
         Game details
     """
-    game = data_collector.get_game_details(game_id)
+    game = services.data_collector.get_game_details(game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     return game
 
 
 @router.get("/{game_id}/teams")
-async def get_team_stats_for_game(game_id: str) -> dict:
+async def get_team_stats_for_game(game_id: str, services: ServiceContainer = Depends(get_services)) -> dict:
     """
     Get statistics for both teams in a game
     
@@ -59,12 +59,12 @@ async def get_team_stats_for_game(game_id: str) -> dict:
     Returns:
         Dictionary with home and away team statistics
     """
-    game = data_collector.get_game_details(game_id)
+    game = services.data_collector.get_game_details(game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
-    home_stats = data_collector.get_team_stats(game["home_team"], game.get("sport", "nfl"))
-    away_stats = data_collector.get_team_stats(game["away_team"], game.get("sport", "nfl"))
+    home_stats = services.data_collector.get_team_stats(game["home_team"], game.get("sport", "nfl"))
+    away_stats = services.data_collector.get_team_stats(game["away_team"], game.get("sport", "nfl"))
     
     return {
         "game_id": game_id,
@@ -1,30 +1,23 @@
 """
 API routes for ML-based predictions
 """
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Optional
-from app.models.advanced_ml_models import AdvancedMLPredictor, PlayerPropMLPredictor
-from app.models.weather_analyzer import WeatherAnalyzer
-from app.data.sports_data import SportsDataCollector
-from app.data.injury_data import InjuryDataCollector
-from app.cache.redis_cache import get_cache, cached
+from app.cache.redis_cache import cached
 from app.monitoring.prometheus_metrics import record_prediction
+from app.services import ServiceContainer, get_services
 from app.utils.data_normalizer import DataNormalizer
+from app.config import settings
 
 router = APIRouter()
-ml_predictor = AdvancedMLPredictor()
-player_ml_predictor = PlayerPropMLPredictor()
-weather_analyzer = WeatherAnalyzer()
-data_collector = SportsDataCollector()
-injury_collector = InjuryDataCollector()
-cache = get_cache()
 
 
 @router.get("/game/{game_id}")
-@cached(ttl=300, key_prefix="ml_prediction")
+@cached(ttl=300, key_prefix="ml_prediction", namespaces=["game:{game_id}"])
 async def get_ml_game_prediction(
     game_id: str,
-    model_type: str = Query("ensemble", description="Model type: random_forest, gradient_boosting, xgboost, logistic, ensemble")
+    model_type: str = Query("ensemble", description="Model type: random_forest, gradient_boosting, xgboost, logistic, ensemble"),
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Get ML-based prediction for a game outcome
@@ -45,58 +38,31 @@ async def get_ml_game_prediction(
                 detail=f"Invalid model_type. Must be one of: {', '.join(valid_models)}"
             )
         
-        # Get game details
-        game = data_collector.get_game_details(game_id)
+        # Load game inputs once through the request context
+        context = services.game_context(game_id)
+        game = context.game
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
         
+        # Fetch stats, injuries and weather concurrently off the event loop
+        await context.prefetch(timeout=settings.DATA_FETCH_TIMEOUT)
+        
         # Normalize game data
         game = DataNormalizer.normalize_game_data(game)
         sport = game.get("sport", "nfl")
         
-        # Get team statistics
-        home_stats_raw = data_collector.get_team_stats(game["home_team"], sport)
-        away_stats_raw = data_collector.get_team_stats(game["away_team"], sport)
-        
         # Normalize stats
-        home_stats = DataNormalizer.normalize_team_stats(home_stats_raw, sport)
-        away_stats = DataNormalizer.normalize_team_stats(away_stats_raw, sport)
+        home_stats = DataNormalizer.normalize_team_stats(context.home_stats, sport)
+        away_stats = DataNormalizer.normalize_team_stats(context.away_stats, sport)
         
         # Get weather data
-        weather_data = None
-        if "location" in game:
-            location = game["location"]
-            game_date = None
-            if "date" in game:
-                try:
-                    from datetime import datetime
-                    game_date = datetime.fromisoformat(game["date"].replace("Z", "+00:00"))
-                except:
-                    pass
-            
-            if "lat" in location and "lon" in location:
-                weather_data = weather_analyzer.get_weather_for_game_date(
-                    location.get("city", ""),
-                    location.get("state"),
-                    location.get("country", "US"),
-                    game_date,
-                    location["lat"],
-                    location["lon"]
-                )
-            elif "city" in location:
-                weather_data = weather_analyzer.get_weather_for_game_date(
-                    location["city"],
-                    location.get("state"),
-                    location.get("country", "US"),
-                    game_date
-                )
-            
-            if weather_data:
-                weather_data = DataNormalizer.normalize_weather_data(weather_data)
+        weather_data = context.weather
+        if weather_data:
+            weather_data = DataNormalizer.normalize_weather_data(weather_data)
         
         # Get injury data
-        home_injuries = injury_collector.get_team_injuries(game["home_team"], sport)
-        away_injuries = injury_collector.get_team_injuries(game["away_team"], sport)
+        home_injuries = context.home_injuries
+        away_injuries = context.away_injuries
         
         injury_data = {
             "home_injuries": home_injuries,
@@ -104,7 +70,7 @@ async def get_ml_game_prediction(
         }
         
         # Make ML prediction
-        prediction = ml_predictor.predict_game_ml(
+        prediction = services.ml_predictor.predict_game_ml(
             game["home_team"],
             game["away_team"],
             home_stats,
@@ -128,6 +94,7 @@ async def get_ml_game_prediction(
             "away_win_probability": round(prediction["away_win_probability"], 3),
             "confidence": round(prediction["confidence"], 3),
             "model_type": prediction["model_type"],
+            "model_version": prediction["model_version"],
             "features_used": prediction["features_used"],
             "weather_data": weather_data,
             "injury_data": injury_data
@@ -142,12 +109,13 @@ async def get_ml_game_prediction(
 
 
 @router.get("/player/{player_name}")
-@cached(ttl=300, key_prefix="ml_player_prop")
+@cached(ttl=300, key_prefix="ml_player_prop", namespaces=["game:{game_id}", "player:{player_name}"])
 async def get_ml_player_prop_prediction(
     player_name: str,
     prop_type: str = Query("points", description="Type of prop: points, yards, touchdowns, etc."),
     game_id: Optional[str] = None,
-    line: Optional[float] = None
+    line: Optional[float] = None,
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Get ML-based prediction for a player prop bet
@@ -164,31 +132,31 @@ async def get_ml_player_prop_prediction(
     try:
         # Determine sport
         sport = "nfl"
+        game = None
         if game_id:
-            game = data_collector.get_game_details(game_id)
+            context = services.game_context(game_id)
+            game = context.game
             if game:
                 sport = game.get("sport", "nfl")
         
         # Get player statistics
-        player_stats_raw = data_collector.get_player_stats(player_name, sport)
+        if game:
+            player_stats_raw = context.player_stats(player_name)
+        else:
+            player_stats_raw = services.data_collector.get_player_stats(player_name, sport)
         player_stats = DataNormalizer.normalize_player_stats(player_stats_raw, sport)
         
         # Get opponent stats if game_id provided
         opponent_stats = {}
-        if game_id:
-            game = data_collector.get_game_details(game_id)
-            if game:
-                # Determine opponent (simplified)
-                opponent_stats_raw = data_collector.get_team_stats(
-                    game["away_team"], sport
-                )
-                opponent_stats = DataNormalizer.normalize_team_stats(opponent_stats_raw, sport)
+        if game:
+            # Determine opponent (simplified)
+            opponent_stats = DataNormalizer.normalize_team_stats(context.away_stats, sport)
         
         # Historical average
         historical_avg = player_stats.get(f"{prop_type}_avg", 0)
         
         # Make ML prediction
-        prediction = player_ml_predictor.predict_player_prop_ml(
+        prediction = services.player_ml_predictor.predict_player_prop_ml(
             player_name,
             prop_type,
             player_stats,
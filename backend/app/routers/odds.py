@@ -1,17 +1,14 @@
 """
 API routes for betting odds
 """
-from fastapi import APIRouter, HTTPException
-from app.data.odds_collector import OddsCollector
-from app.data.sports_data import SportsDataCollector
+from fastapi import APIRouter, Depends, HTTPException
+from app.services import ServiceContainer, get_services
 
 router = APIRouter()
-odds_collector = OddsCollector()
-data_collector = SportsDataCollector()
 
 
 @router.get("/game/{game_id}")
-async def get_game_odds(game_id: str) -> dict:
+async def get_game_odds(game_id: str, services: ServiceContainer = Depends(get_services)) -> dict:
     """
     Get betting odds for a game from all platforms
     
@@ -22,11 +19,11 @@ async def get_game_odds(game_id: str) -> dict:
         Dictionary with odds from bet365, DraftKings, and TheScore Bet
     """
     try:
-        game = data_collector.get_game_details(game_id)
+        game = services.data_collector.get_game_details(game_id)
         if not game:
             raise HTTPException(status_code=404, detail="Game not found")
         
-        odds = odds_collector.get_odds_for_game(
+        odds = services.odds_collector.get_odds_for_game(
             game_id,
             game["home_team"],
             game["away_team"],
@@ -34,7 +31,7 @@ async def get_game_odds(game_id: str) -> dict:
         )
         
         # Find best odds
-        best_odds = odds_collector.find_best_odds(odds, "team_win")
+        best_odds = services.odds_collector.find_best_odds(odds, "team_win")
         
         return {
             "game_id": game_id,
@@ -53,7 +50,8 @@ async def get_game_odds(game_id: str) -> dict:
 async def get_player_prop_odds(
     player_name: str,
     prop_type: str = "points",
-    game_id: str = None
+    game_id: str = None,
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Get player prop odds from all platforms
@@ -73,7 +71,7 @@ async def get_player_prop_odds(
                 detail="game_id is required for player props"
             )
         
-        odds = odds_collector.get_player_prop_odds(
+        odds = services.odds_collector.get_player_prop_odds(
             player_name,
             prop_type,
             game_id,
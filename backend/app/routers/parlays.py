@@ -1,13 +1,47 @@
 """
 Parlay builder and analysis endpoints
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from pydantic import BaseModel
 import math
+import numpy as np
+from app.models.parlay_pricing import ParlayPricer
+from app.models.parlay_correlation import CorrelatedParlayPricer
+from app.models.parlay_optimizer import CandidateLeg, ParlayOptimizer, OBJECTIVES
+from app.services import ServiceContainer, get_services
+from app.utils.concurrency import run_blocking
+from app.config import settings
 
 router = APIRouter()
+parlay_optimizer = ParlayOptimizer()
+correlated_pricer = CorrelatedParlayPricer(num_simulations=settings.PARLAY_SIMULATIONS)
+
+MAX_PARLAY_LEGS = 10
+PRICING_MODES = ("independent", "correlated")
+
+# Player prop markets priced per sport and position: prop_type -> season average stat
+POSITION_PROPS = {
+    "nfl": {
+        "QB": {"passing_yards": "yards_avg", "passing_touchdowns": "touchdowns_avg"},
+        "RB": {"rushing_yards": "yards_avg", "receptions": "receptions_avg"},
+        "WR": {"receiving_yards": "yards_avg", "receptions": "receptions_avg"},
+        "TE": {"receiving_yards": "yards_avg", "receptions": "receptions_avg"},
+    },
+    "nba": {
+        position: {"points": "points_avg", "assists": "assists_avg", "rebounds": "rebounds_avg"}
+        for position in ("PG", "SG", "SF", "PF", "C")
+    },
+    "mlb": {
+        "P": {"strikeouts": "strikeouts_avg"},
+        **{position: {"hits": "hits_avg"} for position in ("C", "1B", "2B", "3B", "SS", "LF", "CF", "RF", "DH")},
+    },
+    "nhl": {
+        "G": {"saves": "saves_avg"},
+        **{position: {"points": "points_avg", "shots": "shots_avg"} for position in ("C", "LW", "RW", "D")},
+    },
+}
 
 
 class ParlayLeg(BaseModel):
@@ -19,12 +53,15 @@ class ParlayLeg(BaseModel):
     selection: str  # "over" or "under"
     odds: float  # Decimal odds
     win_probability: float  # True probability of winning (0-1)
+    game_id: Optional[str] = None  # Legs sharing a game_id are priced as correlated
 
 
 class ParlayRequest(BaseModel):
     """Request to calculate parlay odds and analysis"""
     legs: List[ParlayLeg]
     bet_amount: float
+    pricing_mode: str = "independent"  # "independent" or "correlated" (joint same-game simulation)
+    seed: Optional[int] = None  # Random seed for correlated pricing
 
 
 @router.post("/calculate")
@@ -32,8 +69,12 @@ async def calculate_parlay(parlay: ParlayRequest) -> dict:
     """
     Calculate parlay odds, payout, and expected value
     
+    In correlated mode, legs from the same game are simulated jointly so
+    stacked props (e.g. a quarterback's passing yards with his receiver's
+    receiving yards) are not priced as independent events.
+    
     Args:
-        parlay: ParlayRequest with legs and bet amount
+        parlay: ParlayRequest with legs, bet amount and pricing mode
     
     Returns:
         Analysis including total odds, payout, EV, and risk metrics
@@ -45,6 +86,12 @@ async def calculate_parlay(parlay: ParlayRequest) -> dict:
         if parlay.bet_amount <= 0:
             raise HTTPException(status_code=400, detail="Bet amount must be positive")
         
+        if parlay.pricing_mode not in PRICING_MODES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"pricing_mode must be one of {', '.join(PRICING_MODES)}"
+            )
+        
         # Calculate combined probability (all legs must win)
         combined_probability = 1.0
         for leg in parlay.legs:
@@ -65,6 +112,12 @@ async def calculate_parlay(parlay: ParlayRequest) -> dict:
                 )
             parlay_odds *= leg.odds
         
+        leg_probabilities = [leg.win_probability for leg in parlay.legs]
+        correlated = None
+        if parlay.pricing_mode == "correlated":
+            correlated = correlated_pricer.price(parlay.legs, seed=parlay.seed)
+            combined_probability = correlated["combined_probability"]
+        
         # Calculate potential payout
         potential_payout = parlay.bet_amount * (parlay_odds - 1)
         total_return = parlay.bet_amount * parlay_odds
@@ -98,22 +151,33 @@ async def calculate_parlay(parlay: ParlayRequest) -> dict:
             recommendation = "avoid_parlay"
             recommendation_text = "Avoid - Negative Expected Value"
         
-        # Calculate probability of hitting different numbers of legs
-        hit_probabilities = {}
-        n = len(parlay.legs)
-        for k in range(n + 1):
-            # Probability of hitting exactly k legs
-            # This is complex for independent events, simplified here
-            if k == n:
-                hit_probabilities[f"{k}_legs"] = combined_probability
-            elif k == 0:
-                miss_prob = 1.0
-                for leg in parlay.legs:
-                    miss_prob *= (1 - leg.win_probability)
-                hit_probabilities[f"{k}_legs"] = miss_prob
-            else:
-                # Simplified: approximate probability
-                hit_probabilities[f"{k}_legs"] = 0.0  # Would need binomial calculation for accuracy
+        # Probability of hitting each number of legs: exact (Poisson-binomial)
+        # for independent legs, simulated for correlated ones
+        if correlated:
+            exact, at_least = correlated["exact"], correlated["at_least"]
+        else:
+            exact = ParlayPricer.hit_distribution(leg_probabilities)
+            at_least = ParlayPricer.at_least(exact)
+        hit_probabilities = {f"{k}_legs": round(float(p), 6) for k, p in enumerate(exact)}
+        at_least_probabilities = {f"{k}_plus_legs": round(float(p), 6) for k, p in enumerate(at_least)}
+        
+        # Round robins of every smaller size, staked so the total matches bet_amount
+        round_robins = []
+        for option in ParlayPricer.round_robin(
+            leg_probabilities,
+            [leg.odds for leg in parlay.legs],
+            expected_returns=correlated["round_robin_returns"] if correlated else None
+        ):
+            stake = parlay.bet_amount / option["tickets"]
+            round_robins.append({
+                "size": option["size"],
+                "tickets": option["tickets"],
+                "stake_per_ticket": round(stake, 2),
+                "expected_return": round(option["expected_return"] * stake, 2),
+                "expected_value": round(option["expected_value"] * stake, 2),
+                "ev_percentage": round(option["ev_percentage"], 2),
+                "max_return": round(option["max_return"] * stake, 2)
+            })
         
         return {
             "parlay_odds": round(parlay_odds, 2),
@@ -140,11 +204,22 @@ async def calculate_parlay(parlay: ParlayRequest) -> dict:
                     "prop_value": leg.prop_value,
                     "selection": leg.selection,
                     "odds": leg.odds,
-                    "win_probability": leg.win_probability
+                    "win_probability": leg.win_probability,
+                    "game_id": leg.game_id
                 }
                 for leg in parlay.legs
             ],
-            "hit_probabilities": hit_probabilities
+            "pricing_mode": parlay.pricing_mode,
+            "correlation": {
+                "independent_probability": round(correlated["independent_probability"], 4),
+                "correlation_lift": round(combined_probability / correlated["independent_probability"], 4),
+                "standard_error": round(correlated["standard_error"], 6),
+                "num_simulations": correlated["num_simulations"],
+                "leg_correlations": np.round(correlated["correlation"], 3).tolist()
+            } if correlated else None,
+            "hit_probabilities": hit_probabilities,
+            "at_least_probabilities": at_least_probabilities,
+            "round_robins": round_robins
         }
     except HTTPException:
         raise
@@ -156,71 +231,137 @@ async def calculate_parlay(parlay: ParlayRequest) -> dict:
 async def get_recommended_parlays(
     sport: str = "nfl",
     num_legs: int = 3,
-    max_legs: int = 5
+    max_legs: int = 5,
+    limit: int = 5,
+    objective: str = "ev",
+    days_ahead: int = 7,
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Get recommended parlay combinations based on best value
     
+    Prices every moneyline and player prop on the slate and searches the
+    positive-edge legs for the best combinations.
+    
     Args:
         sport: Sport type
-        num_legs: Number of legs in parlay
-        max_legs: Maximum number of legs to consider
+        num_legs: Minimum number of legs in a parlay
+        max_legs: Maximum number of legs in a parlay
+        limit: Number of parlays to return
+        objective: Rank by "ev" (expected value) or "kelly" (Kelly growth)
+        days_ahead: Days of upcoming games included in the slate
     
     Returns:
         List of recommended parlay combinations
     """
+    if num_legs < 2:
+        raise HTTPException(status_code=400, detail="Parlay must have at least 2 legs")
+    if max_legs < num_legs or max_legs > MAX_PARLAY_LEGS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"max_legs must be between num_legs and {MAX_PARLAY_LEGS}"
+        )
+    if objective not in OBJECTIVES:
+        raise HTTPException(status_code=400, detail=f"objective must be one of {', '.join(OBJECTIVES)}")
+    
     try:
-        # Mock recommended parlays - in production, this would analyze all combinations
-        # and return the highest EV parlays
-        
-        recommended = []
-        
-        # Example recommended parlay
-        if sport == "nfl":
-            recommended.append({
-                "legs": [
-                    {
-                        "player_name": "Patrick Mahomes",
-                        "team": "Kansas City Chiefs",
-                        "prop_type": "passing_yards",
-                        "prop_value": 275.5,
-                        "selection": "over",
-                        "odds": 1.91,
-                        "win_probability": 0.58
-                    },
-                    {
-                        "player_name": "Travis Kelce",
-                        "team": "Kansas City Chiefs",
-                        "prop_type": "receiving_yards",
-                        "prop_value": 75.5,
-                        "selection": "over",
-                        "odds": 1.91,
-                        "win_probability": 0.55
-                    },
-                    {
-                        "player_name": "Josh Allen",
-                        "team": "Buffalo Bills",
-                        "prop_type": "passing_touchdowns",
-                        "prop_value": 2.5,
-                        "selection": "over",
-                        "odds": 1.83,
-                        "win_probability": 0.60
-                    }
-                ],
-                "parlay_odds": 6.83,
-                "combined_probability": 0.1914,
-                "ev_percentage": 30.8,
-                "recommendation": "strong_parlay"
-            })
+        legs = await run_blocking(_collect_slate_legs, sport, days_ahead, services)
+        recommended = await run_blocking(
+            parlay_optimizer.optimize, legs, num_legs, max_legs, limit, objective
+        )
         
         return {
             "sport": sport,
-            "recommended_parlays": recommended[:5],  # Return top 5
-            "num_legs": num_legs
+            "recommended_parlays": recommended,
+            "num_legs": num_legs,
+            "max_legs": max_legs,
+            "objective": objective,
+            "candidate_legs": len(legs)
         }
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _collect_slate_legs(sport: str, days_ahead: int, services: ServiceContainer) -> List[CandidateLeg]:
+    """Price every moneyline and player prop for the upcoming games"""
+    legs = []
+    for game in services.data_collector.get_upcoming_games(sport, days_ahead=days_ahead):
+        try:
+            legs.extend(_collect_game_legs(game, sport, services))
+        except Exception as e:
+            print(f"Skipping {game.get('game_id')} in parlay search: {e}")
+    return legs
 
 
+def _collect_game_legs(game: Dict, sport: str, services: ServiceContainer) -> List[CandidateLeg]:
+    """Price the moneylines and key player props of one game on every platform"""
+    game_id = game["game_id"]
+    home_team = game["home_team"]
+    away_team = game["away_team"]
+    home_stats = services.data_collector.get_team_stats(home_team, sport)
+    away_stats = services.data_collector.get_team_stats(away_team, sport)
+    legs = []
+    
+    # Moneylines
+    prediction = services.game_predictor.predict_game(home_team, away_team, home_stats, away_stats, None, game_id)
+    for platform, odds in services.odds_collector.get_odds_for_game(game_id, home_team, away_team, sport).items():
+        if not odds.get("available", False):
+            continue
+        for team, odds_key, probability in (
+            (home_team, "home_team_odds", prediction.home_win_probability),
+            (away_team, "away_team_odds", prediction.away_win_probability)
+        ):
+            if odds.get(odds_key):
+                legs.append(CandidateLeg(
+                    game_id=game_id,
+                    market=f"{game_id}:moneyline",
+                    player_name=team,
+                    team=team,
+                    prop_type="moneyline",
+                    prop_value=0.0,
+                    selection="win",
+                    odds=odds[odds_key],
+                    win_probability=probability,
+                    platform=platform
+                ))
+    
+    # Player props
+    for team, opponent_stats in ((home_team, away_stats), (away_team, home_stats)):
+        for player in services.data_collector.get_team_players(team, sport)[:5]:
+            props = POSITION_PROPS.get(sport, {}).get(player.get("position"), {})
+            if not props:
+                continue
+            player_stats = services.data_collector.get_player_stats(player["name"], sport)
+            
+            for prop_type, stat_key in props.items():
+                prop_odds = services.odds_collector.get_player_prop_odds(player["name"], prop_type, game_id, sport)
+                for platform, odds in prop_odds.items():
+                    if not odds.get("available") or not odds.get("line"):
+                        continue
+                    prop_prediction = services.player_predictor.predict_player_prop(
+                        player["name"],
+                        prop_type,
+                        player_stats,
+                        opponent_stats,
+                        player_stats.get(stat_key, 0),
+                        odds["line"]
+                    )
+                    for selection, odds_key, probability in (
+                        ("over", "over_odds", prop_prediction.over_probability),
+                        ("under", "under_odds", prop_prediction.under_probability)
+                    ):
+                        if odds.get(odds_key):
+                            legs.append(CandidateLeg(
+                                game_id=game_id,
+                                market=f"{game_id}:{player['name']}:{prop_type}",
+                                player_name=player["name"],
+                                team=team,
+                                prop_type=prop_type,
+                                prop_value=odds["line"],
+                                selection=selection,
+                                odds=odds[odds_key],
+                                win_probability=probability,
+                                platform=platform,
+                                position=player.get("position")
+                            ))
+    return legs
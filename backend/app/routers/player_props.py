@@ -1,29 +1,55 @@
 """
 API routes for player props
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from typing import List, Optional
-from app.models.prediction_models import PlayerPropPredictor
-from app.data.sports_data import SportsDataCollector
-from app.data.odds_collector import OddsCollector
-from app.data.injury_data import InjuryDataCollector
-from app.data.historical_matchups import HistoricalMatchupAnalyzer
+from app.data.game_context import GameContext
+from app.services import ServiceContainer, get_services
+from app.utils.concurrency import run_blocking
 from typing import Optional as Opt
 
 router = APIRouter()
-player_predictor = PlayerPropPredictor()
-data_collector = SportsDataCollector()
-odds_collector = OddsCollector()
-injury_collector = InjuryDataCollector()
-matchup_analyzer = HistoricalMatchupAnalyzer()
 
 
-async def _get_game_player_props_internal(game_id: str) -> dict:
+async def _get_game_player_props_internal(
+    game_id: str,
+    services: ServiceContainer,
+    context: Optional[GameContext] = None,
+    timeout: Optional[float] = None
+) -> dict:
     """
     Internal function to get player props (can be called from other modules)
+    
+    The props pipeline is blocking (stats, odds and per-prop predictions), so it
+    runs on the shared data fetch pool instead of the event loop.
+    
+    Args:
+        game_id: Unique game identifier
+        services: Shared collectors and predictors
+        context: Request-scoped game context to share loaded data with the caller
+        timeout: Optional timeout in seconds
+    """
+    return await run_blocking(_build_game_player_props, game_id, services, context, timeout=timeout)
+
+
+def _build_game_player_props(
+    game_id: str,
+    services: ServiceContainer,
+    context: Optional[GameContext] = None
+) -> dict:
+    """
+    Build player props for both teams in a game
+    
+    Args:
+        game_id: Unique game identifier
+        services: Shared collectors and predictors
+        context: Request-scoped game context to share loaded data with the caller
     """
+    if context is None:
+        context = services.game_context(game_id)
+    
     # Get game details
-    game = data_collector.get_game_details(game_id)
+    game = context.game
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
     
@@ -32,29 +58,29 @@ async def _get_game_player_props_internal(game_id: str) -> dict:
     sport = game.get("sport", "nfl")
     
     # Get team stats
-    home_stats = data_collector.get_team_stats(home_team, sport)
-    away_stats = data_collector.get_team_stats(away_team, sport)
+    home_stats = context.home_stats
+    away_stats = context.away_stats
     
     # Get coaches for historical matchup analysis
     if sport == "nfl":
-        home_coach = matchup_analyzer.get_team_coach(home_team, sport)
-        away_coach = matchup_analyzer.get_team_coach(away_team, sport)
+        home_coach = services.matchup_analyzer.get_team_coach(home_team, sport)
+        away_coach = services.matchup_analyzer.get_team_coach(away_team, sport)
     else:
-        home_coach = matchup_analyzer.get_team_coach_for_sport(home_team, sport)
-        away_coach = matchup_analyzer.get_team_coach_for_sport(away_team, sport)
+        home_coach = services.matchup_analyzer.get_team_coach_for_sport(home_team, sport)
+        away_coach = services.matchup_analyzer.get_team_coach_for_sport(away_team, sport)
     
     # Get injuries for both teams
-    home_injuries = injury_collector.get_team_injuries(home_team, sport)
-    away_injuries = injury_collector.get_team_injuries(away_team, sport)
+    home_injuries = context.home_injuries
+    away_injuries = context.away_injuries
     
     # Get player stats for each team
-    home_players = data_collector.get_team_players(home_team, sport)
-    away_players = data_collector.get_team_players(away_team, sport)
+    home_players = context.home_players
+    away_players = context.away_players
     
     # Generate props for home team
     home_props = []
     for player in home_players[:5]:  # Top 5 players
-        player_stats = data_collector.get_player_stats(player["name"], sport)
+        player_stats = context.player_stats(player["name"])
         
         # Check if player is injured
         player_injury = None
@@ -71,13 +97,14 @@ async def _get_game_player_props_internal(game_id: str) -> dict:
             away_stats,
             player_injury,
             sport,
+            services,
             opponent_team=away_team,
             opponent_coach=away_coach
         )
         
         # Get odds for these props
         for prop in props:
-            odds = odds_collector.get_player_prop_odds(
+            odds = services.odds_collector.get_player_prop_odds(
                 player["name"], prop["prop_type"], game_id, sport
             )
             prop["odds"] = odds
@@ -87,7 +114,7 @@ async def _get_game_player_props_internal(game_id: str) -> dict:
     # Generate props for away team
     away_props = []
     for player in away_players[:5]:  # Top 5 players
-        player_stats = data_collector.get_player_stats(player["name"], sport)
+        player_stats = context.player_stats(player["name"])
         
         # Check if player is injured
         player_injury = None
@@ -104,13 +131,14 @@ async def _get_game_player_props_internal(game_id: str) -> dict:
             home_stats,
             player_injury,
             sport,
+            services,
             opponent_team=home_team,
             opponent_coach=home_coach
         )
         
         # Get odds for these props
         for prop in props:
-            odds = odds_collector.get_player_prop_odds(
+            odds = services.odds_collector.get_player_prop_odds(
                 player["name"], prop["prop_type"], game_id, sport
             )
             prop["odds"] = odds
@@ -127,7 +155,7 @@ async def _get_game_player_props_internal(game_id: str) -> dict:
 
 
 @router.get("/game/{game_id}")
-async def get_game_player_props(game_id: str) -> dict:
+async def get_game_player_props(game_id: str, services: ServiceContainer = Depends(get_services)) -> dict:
     """
     Get player props for a game, separated by team
     
@@ -138,7 +166,7 @@ async def get_game_player_props(game_id: str) -> dict:
         Dictionary with home_team_props and away_team_props
     """
     try:
-        return await _get_game_player_props_internal(game_id)
+        return await _get_game_player_props_internal(game_id, services)
     except HTTPException:
         raise
     except Exception as e:
@@ -152,6 +180,7 @@ def _generate_player_props(
     opponent_stats: dict,
     injury: Opt,
     sport: str,
+    services: ServiceContainer,
     opponent_team: Optional[str] = None,
     opponent_coach: Optional[str] = None
 ) -> List[dict]:
@@ -364,7 +393,7 @@ def _generate_player_props(
         # Use historical average (season average per game) for prediction
         historical_avg = prop["line"]  # Line is typically set at season average
         
-        prediction = player_predictor.predict_player_prop(
+        prediction = services.player_predictor.predict_player_prop(
             player_name,
             prop["prop_type"],
             player_stats,
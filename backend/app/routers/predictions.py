@@ -1,219 +1,272 @@
 """
 API routes for game and player predictions
 """
-from fastapi import APIRouter, HTTPException
-from typing import Optional
-from app.models.prediction_models import GamePredictor, PlayerPropPredictor
-from app.models.weather_analyzer import WeatherAnalyzer
-from app.models.prediction_tracker import PredictionTracker
-from app.models.adaptive_predictor import AdaptivePredictor
-from app.data.sports_data import SportsDataCollector
-from app.data.injury_data import InjuryDataCollector
+from fastapi import APIRouter, Depends, HTTPException
+from typing import Dict, List, Optional, Tuple
+from datetime import date, timedelta
+from pydantic import BaseModel
+import asyncio
+from app.data.game_context import GameContext
+from app.services import ServiceContainer, get_services
+from app.utils.concurrency import run_blocking
+from app.config import settings
 
 router = APIRouter()
-game_predictor = GamePredictor()
-player_predictor = PlayerPropPredictor()
-weather_analyzer = WeatherAnalyzer()
-data_collector = SportsDataCollector()
-injury_collector = InjuryDataCollector()
-prediction_tracker = PredictionTracker()
-adaptive_predictor = AdaptivePredictor(prediction_tracker)
 
+# Marks a batch input that did not load in time
+_MISSING = object()
 
-@router.get("/game/{game_id}")
-async def get_game_prediction(game_id: str) -> dict:
+
+class BatchPredictionRequest(BaseModel):
+    """Games to predict: explicit game IDs, or a sport and date window"""
+    game_ids: Optional[List[str]] = None
+    sport: Optional[str] = None
+    start_date: Optional[date] = None  # First day of the window (defaults to today)
+    days: int = 7  # Length of the window in days
+
+
+async def _get_game_prediction_internal(
+    game_id: str,
+    services: ServiceContainer,
+    context: Optional[GameContext] = None
+) -> dict:
     """
-    Get prediction for a game outcome
+    Internal function to get a game prediction (can be called from other modules)
     
     Args:
         game_id: Unique game identifier
-    
-    Returns:
-        Game prediction with probabilities
+        services: Shared collectors and predictors
+        context: Request-scoped game context to share loaded data with the caller
     """
-    try:
-        # Get game details
-        game = data_collector.get_game_details(game_id)
-        if not game:
-            raise HTTPException(status_code=404, detail="Game not found")
-        
-        # Get team statistics
-        home_stats = data_collector.get_team_stats(
-            game["home_team"], 
-            game.get("sport", "nfl")
-        )
-        away_stats = data_collector.get_team_stats(
-            game["away_team"],
-            game.get("sport", "nfl")
-        )
-        
-        # Get weather data for the game location and date
-        weather_data = None
-        if "location" in game:
-            location = game["location"]
-            
-            # Parse game date for forecast
-            game_date = None
-            if "date" in game:
-                try:
-                    from datetime import datetime
-                    game_date = datetime.fromisoformat(game["date"].replace("Z", "+00:00"))
-                except:
-                    try:
-                        from datetime import datetime
-                        game_date = datetime.fromisoformat(game["date"])
-                    except:
-                        pass
-            
-            # Log which location is being used for weather
-            location_str = f"{location.get('city', 'Unknown')}, {location.get('state', '')}"
-            if "lat" in location and "lon" in location:
-                print(f"Fetching weather for game at {location_str} (coordinates: {location['lat']}, {location['lon']})")
-                weather_data = weather_analyzer.get_weather_for_game_date(
-                    location.get("city", ""),
-                    location.get("state"),
-                    location.get("country", "US"),
-                    game_date,
-                    location["lat"],
-                    location["lon"]
-                )
-            elif "city" in location:
-                print(f"Fetching weather for game at {location_str}")
-                weather_data = weather_analyzer.get_weather_for_game_date(
-                    location["city"],
-                    location.get("state"),
-                    location.get("country", "US"),
-                    game_date
-                )
-            
-            # Add location info to weather data if not present
-            if weather_data and "location" not in weather_data:
-                weather_data["location"] = location_str
-        
-        # Get injury data for both teams
-        home_injuries = injury_collector.get_team_injuries(
-            game["home_team"], game.get("sport", "nfl")
-        )
-        away_injuries = injury_collector.get_team_injuries(
-            game["away_team"], game.get("sport", "nfl")
-        )
-        
-        # Get player props to enhance prediction (optional but recommended)
-        player_prop_data = None
+    if context is None:
+        context = services.game_context(game_id)
+    
+    # Get game details
+    game = context.game
+    if not game:
+        raise HTTPException(status_code=404, detail="Game not found")
+    
+    # Fetch weather, injuries, team stats and player props concurrently.
+    # Each source has its own timeout and falls back to a default, so the
+    # request waits for the slowest source instead of the sum of all of them.
+    async def fetch_player_props() -> Optional[dict]:
         try:
             # Import the internal player props function
             from app.routers.player_props import _get_game_player_props_internal
-            player_prop_data = await _get_game_player_props_internal(game_id)
+            return await _get_game_player_props_internal(
+                game_id, services, context, timeout=settings.PLAYER_PROPS_TIMEOUT
+            )
         except Exception as e:
             # If player props fail, continue without them
-            print(f"Could not fetch player props: {e}")
-        
-        # Make prediction
-        sport = game.get("sport", "nfl")
-        
-        # Get adaptive weights based on learning
-        adjusted_weights = adaptive_predictor.get_adjusted_weights(sport)
-        
-        # Temporarily update predictor weights (could be refactored to pass as parameters)
-        original_weather_weight = game_predictor.weather_weight
-        game_predictor.weather_weight = adjusted_weights.get("weather", game_predictor.weather_weight)
-        
-        prediction = game_predictor.predict_game(
+            print(f"Could not fetch player props: {e!r}")
+            return None
+    
+    missing_sources, player_prop_data = await asyncio.gather(
+        context.prefetch(timeout=settings.DATA_FETCH_TIMEOUT),
+        fetch_player_props()
+    )
+    
+    # Get team statistics
+    home_stats = context.home_stats
+    away_stats = context.away_stats
+    
+    # Get weather data for the game location and date
+    weather_data = context.weather
+    
+    # Get injury data for both teams
+    home_injuries = context.home_injuries
+    away_injuries = context.away_injuries
+    
+    # Make prediction
+    sport = game.get("sport", "nfl")
+    
+    game_predictor = services.game_predictor
+    adaptive_predictor = services.adaptive_predictor
+    
+    # Get adaptive weights based on learning
+    adjusted_weights = adaptive_predictor.get_adjusted_weights(sport)
+    
+    # Temporarily update predictor weights (could be refactored to pass as parameters)
+    original_weather_weight = game_predictor.weather_weight
+    game_predictor.weather_weight = adjusted_weights.get("weather", game_predictor.weather_weight)
+    
+    prediction = game_predictor.predict_game(
+        game["home_team"],
+        game["away_team"],
+        home_stats,
+        away_stats,
+        weather_data,
+        game_id,
+        home_injuries,
+        away_injuries,
+        sport
+    )
+    
+    # Apply player prop adjustments if available
+    player_prop_adjustment = None
+    if player_prop_data:
+        player_prop_adjustment = game_predictor.analyze_player_props_for_game(
             game["home_team"],
             game["away_team"],
-            home_stats,
-            away_stats,
-            weather_data,
-            game_id,
-            home_injuries,
-            away_injuries,
-            sport
+            player_prop_data.get("home_team_props", []),
+            player_prop_data.get("away_team_props", [])
         )
         
-        # Apply player prop adjustments if available
-        player_prop_adjustment = None
-        if player_prop_data:
-            player_prop_adjustment = game_predictor.analyze_player_props_for_game(
-                game["home_team"],
-                game["away_team"],
-                player_prop_data.get("home_team_props", []),
-                player_prop_data.get("away_team_props", [])
-            )
-            
-            # Adjust probabilities based on player prop insights
-            net_adjustment = player_prop_adjustment.get("net_adjustment", 0.0)
-            prediction.home_win_probability += net_adjustment
-            prediction.away_win_probability = 1.0 - prediction.home_win_probability
-            
-            # Ensure probabilities stay in valid range
-            prediction.home_win_probability = max(0.1, min(0.9, prediction.home_win_probability))
-            prediction.away_win_probability = 1.0 - prediction.home_win_probability
-            
-            # Recalculate confidence
-            prediction.confidence = abs(prediction.home_win_probability - prediction.away_win_probability)
-            
-            # Update predicted winner to match final probabilities
-            if prediction.home_win_probability > prediction.away_win_probability:
-                prediction.predicted_winner = prediction.home_team
-            elif prediction.away_win_probability > prediction.home_win_probability:
-                prediction.predicted_winner = prediction.away_team
-            # If equal, keep existing predicted_winner (defaults to home team)
-            
-            # Update key factors
-            if net_adjustment > 0.02:
-                prediction.key_factors.append(
-                    f"Home team key players have favorable historical matchups (+{net_adjustment*100:.1f}% advantage)"
-                )
-            elif net_adjustment < -0.02:
-                prediction.key_factors.append(
-                    f"Away team key players have favorable historical matchups ({abs(net_adjustment)*100:.1f}% advantage)"
-                )
+        # Adjust probabilities based on player prop insights
+        net_adjustment = player_prop_adjustment.get("net_adjustment", 0.0)
+        prediction.home_win_probability += net_adjustment
+        prediction.away_win_probability = 1.0 - prediction.home_win_probability
         
-        # Restore original weights
-        game_predictor.weather_weight = original_weather_weight
+        # Ensure probabilities stay in valid range
+        prediction.home_win_probability = max(0.1, min(0.9, prediction.home_win_probability))
+        prediction.away_win_probability = 1.0 - prediction.home_win_probability
         
-        # Adjust confidence based on historical accuracy
-        adjusted_confidence = adaptive_predictor.get_confidence_adjustment(prediction.confidence, sport)
-        prediction.confidence = adjusted_confidence
+        # Recalculate confidence
+        prediction.confidence = abs(prediction.home_win_probability - prediction.away_win_probability)
         
-        # Final validation: ensure probabilities sum to 1.0 and predicted_winner matches
-        final_home_prob = prediction.home_win_probability
-        final_away_prob = prediction.away_win_probability
+        # Update predicted winner to match final probabilities
+        if prediction.home_win_probability > prediction.away_win_probability:
+            prediction.predicted_winner = prediction.home_team
+        elif prediction.away_win_probability > prediction.home_win_probability:
+            prediction.predicted_winner = prediction.away_team
+        # If equal, keep existing predicted_winner (defaults to home team)
         
-        # Normalize probabilities to sum to 1.0
-        total_prob = final_home_prob + final_away_prob
-        if abs(total_prob - 1.0) > 0.01:
-            final_home_prob = final_home_prob / total_prob
-            final_away_prob = 1.0 - final_home_prob
+        # Update key factors
+        if net_adjustment > 0.02:
+            prediction.key_factors.append(
+                f"Home team key players have favorable historical matchups (+{net_adjustment*100:.1f}% advantage)"
+            )
+        elif net_adjustment < -0.02:
+            prediction.key_factors.append(
+                f"Away team key players have favorable historical matchups ({abs(net_adjustment)*100:.1f}% advantage)"
+            )
+    
+    # Restore original weights
+    game_predictor.weather_weight = original_weather_weight
+    
+    # Adjust confidence based on historical accuracy
+    adjusted_confidence = adaptive_predictor.get_confidence_adjustment(prediction.confidence, sport)
+    prediction.confidence = adjusted_confidence
+    
+    # Final validation: ensure probabilities sum to 1.0 and predicted_winner matches
+    final_home_prob = prediction.home_win_probability
+    final_away_prob = prediction.away_win_probability
+    
+    # Normalize probabilities to sum to 1.0
+    total_prob = final_home_prob + final_away_prob
+    if abs(total_prob - 1.0) > 0.01:
+        final_home_prob = final_home_prob / total_prob
+        final_away_prob = 1.0 - final_home_prob
+    
+    # Ensure predicted_winner matches the team with higher probability
+    if final_home_prob > final_away_prob:
+        final_predicted_winner = prediction.home_team
+    elif final_away_prob > final_home_prob:
+        final_predicted_winner = prediction.away_team
+    else:
+        final_predicted_winner = prediction.predicted_winner  # Keep original if equal
+    
+    # Convert to dict for JSON response
+    response = {
+        "game_id": prediction.game_id,
+        "home_team": prediction.home_team,
+        "away_team": prediction.away_team,
+        "predicted_winner": final_predicted_winner,
+        "home_win_probability": round(final_home_prob, 3),
+        "away_win_probability": round(final_away_prob, 3),
+        "confidence": round(abs(final_home_prob - final_away_prob), 3),
+        "weather_impact": prediction.weather_impact,
+        "injury_impact": prediction.injury_impact,
+        "coaching_impact": prediction.coaching_impact,
+        "mental_health_impact": prediction.mental_health_impact,
+        "key_factors": prediction.key_factors
+    }
+    
+    # Add player prop adjustment if available
+    if player_prop_adjustment:
+        response["player_prop_adjustment"] = player_prop_adjustment
+    
+    # Flag inputs that timed out and were replaced by defaults
+    if missing_sources:
+        response["missing_inputs"] = missing_sources
+    
+    return response
+
+
+@router.get("/game/{game_id}")
+async def get_game_prediction(game_id: str, services: ServiceContainer = Depends(get_services)) -> dict:
+    """
+    Get prediction for a game outcome
+    
+    Args:
+        game_id: Unique game identifier
+    
+    Returns:
+        Game prediction with probabilities
+    """
+    try:
+        return await _get_game_prediction_internal(game_id, services)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/batch")
+async def get_batch_predictions(
+    request: BatchPredictionRequest,
+    services: ServiceContainer = Depends(get_services)
+) -> dict:
+    """
+    Predict a whole slate of games in one request
+    
+    Team stats are loaded once per team and weather once per game, all
+    concurrently, and every game is scored in one vectorized pass. Player
+    prop adjustments are not applied; use /game/{game_id} for the full
+    single-game analysis.
+    
+    Args:
+        request: Game IDs, or a sport with an optional date window
+    
+    Returns:
+        Predictions in schedule order, plus any game IDs that were not found
+    """
+    try:
+        games, not_found = _resolve_batch_games(request, services)
+        if len(games) > settings.BATCH_PREDICTION_MAX_GAMES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"At most {settings.BATCH_PREDICTION_MAX_GAMES} games per batch"
+            )
         
-        # Ensure predicted_winner matches the team with higher probability
-        if final_home_prob > final_away_prob:
-            final_predicted_winner = prediction.home_team
-        elif final_away_prob > final_home_prob:
-            final_predicted_winner = prediction.away_team
-        else:
-            final_predicted_winner = prediction.predicted_winner  # Keep original if equal
+        team_stats, weather_by_game, missing_sources = await _load_slate_inputs(games, services)
+        predictions = services.game_predictor.predict_games(games, team_stats, weather_by_game)
+        
+        results = []
+        for game, prediction in zip(games, predictions):
+            results.append({
+                "game_id": prediction.game_id,
+                "sport": game.get("sport"),
+                "date": game.get("date"),
+                "home_team": prediction.home_team,
+                "away_team": prediction.away_team,
+                "predicted_winner": prediction.predicted_winner,
+                "home_win_probability": round(prediction.home_win_probability, 3),
+                "away_win_probability": round(prediction.away_win_probability, 3),
+                "confidence": round(prediction.confidence, 3),
+                "weather_impact": prediction.weather_impact,
+                "key_factors": prediction.key_factors
+            })
         
-        # Convert to dict for JSON response
         response = {
-            "game_id": prediction.game_id,
-            "home_team": prediction.home_team,
-            "away_team": prediction.away_team,
-            "predicted_winner": final_predicted_winner,
-            "home_win_probability": round(final_home_prob, 3),
-            "away_win_probability": round(final_away_prob, 3),
-            "confidence": round(abs(final_home_prob - final_away_prob), 3),
-            "weather_impact": prediction.weather_impact,
-            "injury_impact": prediction.injury_impact,
-            "coaching_impact": prediction.coaching_impact,
-            "mental_health_impact": prediction.mental_health_impact,
-            "key_factors": prediction.key_factors
+            "predictions": results,
+            "count": len(results)
         }
-        
-        # Add player prop adjustment if available
-        if player_prop_adjustment:
-            response["player_prop_adjustment"] = player_prop_adjustment
-        
+        if not_found:
+            response["not_found"] = not_found
+        # Flag inputs that timed out and were replaced by defaults
+        if missing_sources:
+            response["missing_inputs"] = missing_sources
         return response
     except HTTPException:
         raise
@@ -221,11 +274,88 @@ async def get_game_prediction(game_id: str) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _resolve_batch_games(request: BatchPredictionRequest, services: ServiceContainer) -> Tuple[List[Dict], List[str]]:
+    """Look up the requested games in the catalog, returning (games, unknown game IDs)"""
+    catalog = services.game_catalog
+    
+    if request.game_ids:
+        games, not_found = [], []
+        for game_id in dict.fromkeys(request.game_ids):
+            game = catalog.get(game_id)
+            if game:
+                games.append(game)
+            else:
+                not_found.append(game_id)
+        return games, not_found
+    
+    if not request.sport:
+        raise HTTPException(status_code=400, detail="Provide game_ids or a sport")
+    if request.days < 1:
+        raise HTTPException(status_code=400, detail="days must be at least 1")
+    
+    start = request.start_date or date.today()
+    end = start + timedelta(days=request.days)
+    games = [
+        game for game in catalog.games_for_sport(request.sport)
+        if start.isoformat() <= game.get("date", "")[:10] < end.isoformat()
+    ]
+    return games, []
+
+
+async def _load_slate_inputs(
+    games: List[Dict],
+    services: ServiceContainer
+) -> Tuple[Dict[str, Dict], Dict[str, Dict], List[str]]:
+    """
+    Load the inputs shared across a slate concurrently on the data fetch pool
+    
+    Returns:
+        (team stats by team, weather by game_id, names of inputs that fell back to defaults)
+    """
+    teams = {}
+    for game in games:
+        sport = game.get("sport", "nfl")
+        teams.setdefault(game["home_team"], sport)
+        teams.setdefault(game["away_team"], sport)
+    contexts = [services.game_context(game["game_id"]) for game in games]
+    
+    stats_results, weather_results = await asyncio.gather(
+        asyncio.gather(*(
+            run_blocking(
+                services.data_collector.get_team_stats, team, sport,
+                timeout=settings.DATA_FETCH_TIMEOUT, fallback=_MISSING, label=f"team_stats for {team}"
+            )
+            for team, sport in teams.items()
+        )),
+        asyncio.gather(*(
+            run_blocking(
+                lambda context=context: context.weather,
+                timeout=settings.DATA_FETCH_TIMEOUT, fallback=_MISSING, label=f"weather for {context.game_id}"
+            )
+            for context in contexts
+        ))
+    )
+    
+    team_stats, weather_by_game, missing = {}, {}, []
+    for team, stats in zip(teams, stats_results):
+        if stats is _MISSING:
+            missing.append(f"team_stats:{team}")
+        else:
+            team_stats[team] = stats
+    for context, weather in zip(contexts, weather_results):
+        if weather is _MISSING:
+            missing.append(f"weather:{context.game_id}")
+        elif weather:
+            weather_by_game[context.game_id] = weather
+    return team_stats, weather_by_game, missing
+
+
 @router.get("/coaching-matchup")
 async def get_coaching_matchup(
     home_team: str,
     away_team: str,
-    sport: str = "nfl"
+    sport: str = "nfl",
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Get detailed coaching matchup information including win/loss records
@@ -239,10 +369,7 @@ async def get_coaching_matchup(
         Detailed coaching matchup with win/loss records
     """
     try:
-        from app.data.historical_matchups import HistoricalMatchupAnalyzer
-        matchup_analyzer = HistoricalMatchupAnalyzer()
-        
-        coaching_matchup = matchup_analyzer.analyze_coaching_matchup(
+        coaching_matchup = services.matchup_analyzer.analyze_coaching_matchup(
             home_team, away_team, sport
         )
         
@@ -265,7 +392,8 @@ async def get_player_prop_prediction(
     player_name: str,
     prop_type: str = "points",
     game_id: Optional[str] = None,
-    line: Optional[float] = None
+    line: Optional[float] = None,
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Get prediction for a player prop bet
@@ -282,29 +410,30 @@ async def get_player_prop_prediction(
     try:
         # Get player statistics
         sport = "nfl"  # Default, could be determined from game_id
+        game = None
         if game_id:
-            game = data_collector.get_game_details(game_id)
+            context = services.game_context(game_id)
+            game = context.game
             if game:
                 sport = game.get("sport", "nfl")
         
-        player_stats = data_collector.get_player_stats(player_name, sport)
+        if game:
+            player_stats = context.player_stats(player_name)
+        else:
+            player_stats = services.data_collector.get_player_stats(player_name, sport)
         
         # Get opponent stats if game_id provided
         opponent_stats = {}
-        if game_id:
-            game = data_collector.get_game_details(game_id)
-            if game:
-                # Determine opponent
-                # This is simplified - in production, determine based on player's team
-                opponent_stats = data_collector.get_team_stats(
-                    game["away_team"], sport
-                )
+        if game:
+            # Determine opponent
+            # This is simplified - in production, determine based on player's team
+            opponent_stats = context.away_stats
         
         # Historical average
         historical_avg = player_stats.get(f"{prop_type}_avg", 0)
         
         # Make prediction
-        prediction = player_predictor.predict_player_prop(
+        prediction = services.player_predictor.predict_player_prop(
             player_name,
             prop_type,
             player_stats,
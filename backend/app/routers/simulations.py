@@ -1,18 +1,24 @@
 """
 Monte Carlo simulation engine for game outcomes
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import Dict, Optional
-import random
-import numpy as np
+from datetime import date
+from app.config import settings
+from app.models.simulation_engine import MonteCarloSimulator
+from app.services import ServiceContainer, get_services
+from app.utils.concurrency import run_blocking
 
 router = APIRouter()
+simulator = MonteCarloSimulator()
 
 
 @router.get("/simulate-game/{game_id}")
 async def simulate_game(
     game_id: str,
-    num_simulations: int = 10000
+    num_simulations: int = Query(10000, ge=1, le=settings.SIMULATION_MAX_RUNS),
+    seed: Optional[int] = None,
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Run Monte Carlo simulation for a game outcome
@@ -20,56 +26,35 @@ async def simulate_game(
     Args:
         game_id: Game identifier
         num_simulations: Number of simulations to run (default 10,000)
+        seed: Optional seed for reproducible results
     
     Returns:
         Simulation results with win probabilities and distribution
     """
     try:
-        from app.data.sports_data import SportsDataCollector
-        from app.routers.predictions import get_game_prediction
+        from app.routers.predictions import _get_game_prediction_internal
         
         # Get game prediction
-        prediction_response = await get_game_prediction(game_id)
+        prediction_response = await _get_game_prediction_internal(game_id, services)
         
         home_win_prob = prediction_response.get("home_win_probability", 0.5)
         away_win_prob = prediction_response.get("away_win_probability", 0.5)
         
-        # Run simulations
-        home_wins = 0
-        away_wins = 0
-        score_differences = []
-        
-        for _ in range(num_simulations):
-            # Simulate game outcome
-            rand = random.random()
-            if rand < home_win_prob:
-                home_wins += 1
-                # Simulate score difference (home win)
-                score_diff = np.random.normal(7, 10)  # Mean 7, std 10
-                score_differences.append(score_diff)
-            else:
-                away_wins += 1
-                # Simulate score difference (away win)
-                score_diff = np.random.normal(-7, 10)
-                score_differences.append(score_diff)
+        # Run simulations off the event loop
+        results = await run_blocking(
+            simulator.simulate_game, home_win_prob, num_simulations, seed=seed
+        )
         
         # Calculate statistics
+        home_wins = results["home_wins"]
+        away_wins = results["away_wins"]
         home_win_rate = home_wins / num_simulations
         away_win_rate = away_wins / num_simulations
         
         # Score distribution
-        score_diffs_array = np.array(score_differences)
-        mean_score_diff = np.mean(score_diffs_array)
-        std_score_diff = np.std(score_diffs_array)
-        
-        # Calculate percentiles
-        percentiles = {
-            "p5": float(np.percentile(score_diffs_array, 5)),
-            "p25": float(np.percentile(score_diffs_array, 25)),
-            "p50": float(np.percentile(score_diffs_array, 50)),
-            "p75": float(np.percentile(score_diffs_array, 75)),
-            "p95": float(np.percentile(score_diffs_array, 95))
-        }
+        mean_score_diff = results["margin_mean"]
+        std_score_diff = results["margin_std"]
+        percentiles = results["margin_percentiles"]
         
         # Confidence intervals
         confidence_95_lower = mean_score_diff - 1.96 * std_score_diff
@@ -106,69 +91,82 @@ async def simulate_game(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/simulate-league")
+async def simulate_league(
+    sport: str = "nfl",
+    num_simulations: int = Query(10000, ge=1, le=settings.SIMULATION_MAX_SEASONS),
+    seed: Optional[int] = None,
+    as_of: Optional[date] = None,
+    services: ServiceContainer = Depends(get_services)
+) -> dict:
+    """
+    Simulate the remaining season for every team in a league
+    
+    Args:
+        sport: Sport type
+        num_simulations: Number of league-seasons to simulate
+        seed: Optional seed for reproducible results
+        as_of: First day counted as remaining (defaults to today)
+    
+    Returns:
+        Projected standings with win distributions, playoff and championship odds
+    """
+    try:
+        return await run_blocking(
+            services.season_simulator.simulate_league, sport, num_simulations, seed=seed, as_of=as_of
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/simulate-season")
 async def simulate_season(
     team: str,
     sport: str = "nfl",
-    num_simulations: int = 1000
+    num_simulations: int = Query(1000, ge=1, le=settings.SIMULATION_MAX_SEASONS),
+    seed: Optional[int] = None,
+    services: ServiceContainer = Depends(get_services)
 ) -> dict:
     """
     Simulate a team's season outcomes
     
+    Runs the league-wide season simulation and reports this team's results,
+    so playoff and championship odds account for its actual opponents.
+    
     Args:
         team: Team name
         sport: Sport type
         num_simulations: Number of season simulations
+        seed: Optional seed for reproducible results
     
     Returns:
         Season simulation results
     """
     try:
-        # Mock season simulation
-        wins_distribution = []
-        playoff_appearances = 0
-        championship_wins = 0
-        
-        for _ in range(num_simulations):
-            # Simulate season wins (assuming 17 games for NFL, 82 for NBA, etc.)
-            games = 17 if sport == "nfl" else 82 if sport == "nba" else 162 if sport == "mlb" else 82
-            wins = np.random.binomial(games, 0.55)  # 55% win probability as base
-            wins_distribution.append(wins)
-            
-            # Playoff appearance (top 50% of teams)
-            if wins >= games * 0.5:
-                playoff_appearances += 1
-            
-            # Championship (top 10% of playoff teams)
-            if wins >= games * 0.6 and random.random() < 0.1:
-                championship_wins += 1
-        
-        wins_array = np.array(wins_distribution)
-        
-        return {
-            "team": team,
-            "sport": sport,
-            "num_simulations": num_simulations,
-            "expected_wins": round(float(np.mean(wins_array)), 2),
-            "wins_distribution": {
-                "min": int(np.min(wins_array)),
-                "max": int(np.max(wins_array)),
-                "mean": round(float(np.mean(wins_array)), 2),
-                "std": round(float(np.std(wins_array)), 2),
-                "percentiles": {
-                    "p10": int(np.percentile(wins_array, 10)),
-                    "p25": int(np.percentile(wins_array, 25)),
-                    "p50": int(np.percentile(wins_array, 50)),
-                    "p75": int(np.percentile(wins_array, 75)),
-                    "p90": int(np.percentile(wins_array, 90))
-                }
-            },
-            "playoff_probability": round(playoff_appearances / num_simulations, 4),
-            "championship_probability": round(championship_wins / num_simulations, 4)
-        }
+        league = await run_blocking(
+            services.season_simulator.simulate_league, sport, num_simulations, seed=seed
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-
-
-
-
+    
+    team_results = league["teams"].get(team)
+    if team_results is None:
+        raise HTTPException(status_code=404, detail=f"{team} has no remaining {sport} games")
+    
+    return {
+        "team": team,
+        "sport": sport,
+        "num_simulations": num_simulations,
+        "games_remaining": team_results["games_remaining"],
+        "current_wins": team_results["current_wins"],
+        "expected_remaining_wins": team_results["expected_remaining_wins"],
+        "expected_wins": team_results["expected_wins"],
+        "wins_distribution": team_results["wins_distribution"],
+        "expected_seed": team_results["expected_seed"],
+        "playoff_probability": team_results["playoff_probability"],
+        "championship_probability": team_results["championship_probability"]
+    }
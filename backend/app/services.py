@@ -0,0 +1,190 @@
+"""
+Process-wide service container shared by every router
+"""
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
+import threading
+
+if TYPE_CHECKING:
+    from app.data.game_catalog import GameCatalog
+    from app.data.game_context import GameContext
+    from app.data.historical_matchups import HistoricalMatchupAnalyzer
+    from app.data.injury_data import InjuryDataCollector
+    from app.data.odds_collector import OddsCollector
+    from app.data.sports_data import SportsDataCollector
+    from app.data.weather_prefetcher import WeatherPrefetcher
+    from app.models.adaptive_predictor import AdaptivePredictor
+    from app.models.advanced_ml_models import AdvancedMLPredictor, PlayerPropMLPredictor
+    from app.models.betting_models import BettingAnalyzer
+    from app.models.prediction_models import GamePredictor, PlayerPropPredictor
+    from app.models.prediction_tracker import PredictionTracker
+    from app.models.simulation_engine import SeasonSimulator
+    from app.models.weather_analyzer import WeatherAnalyzer
+    from app.utils.http_client import HttpClient
+
+
+class ServiceContainer:
+    """
+    Builds each collector, analyzer and predictor once per process
+
+    Services are created on first use, so a worker only imports and
+    initializes what its requests need, and every router shares the same
+    instances (and with them their caches and HTTP connections). Services
+    that depend on each other are wired to the shared instances too.
+
+    Routers receive the container through FastAPI dependency injection:
+
+        async def endpoint(services: ServiceContainer = Depends(get_services)):
+            services.data_collector.get_game_details(...)
+    """
+
+    def __init__(self):
+        self._services: Dict[str, Any] = {}
+        # Reentrant, since building one service may build the services it uses
+        self._lock = threading.RLock()
+
+    def __repr__(self) -> str:
+        # Endpoint arguments are part of @cached keys; the container is the
+        # same for every request, so it must not make keys process-specific
+        return "ServiceContainer()"
+
+    __str__ = __repr__
+
+    def _get(self, name: str, factory: Callable[[], Any]) -> Any:
+        """Return the named service, building it on first use"""
+        service = self._services.get(name)
+        if service is None:
+            with self._lock:
+                service = self._services.get(name)
+                if service is None:
+                    service = factory()
+                    self._services[name] = service
+        return service
+
+    @property
+    def http_client(self) -> "HttpClient":
+        from app.utils.http_client import get_http_client
+        return self._get("http_client", get_http_client)
+
+    @property
+    def data_collector(self) -> "SportsDataCollector":
+        from app.data.sports_data import SportsDataCollector
+        return self._get("data_collector", lambda: SportsDataCollector(http_client=self.http_client))
+
+    @property
+    def odds_collector(self) -> "OddsCollector":
+        from app.data.odds_collector import OddsCollector
+        return self._get("odds_collector", lambda: OddsCollector(http_client=self.http_client))
+
+    @property
+    def injury_collector(self) -> "InjuryDataCollector":
+        from app.data.injury_data import InjuryDataCollector
+        return self._get("injury_collector", InjuryDataCollector)
+
+    @property
+    def weather_analyzer(self) -> "WeatherAnalyzer":
+        from app.models.weather_analyzer import WeatherAnalyzer
+        return self._get("weather_analyzer", lambda: WeatherAnalyzer(http_client=self.http_client))
+
+    @property
+    def weather_prefetcher(self) -> "WeatherPrefetcher":
+        from app.data.weather_prefetcher import WeatherPrefetcher
+        return self._get("weather_prefetcher", lambda: WeatherPrefetcher(self.weather_analyzer, self.game_catalog))
+
+    @property
+    def matchup_analyzer(self) -> "HistoricalMatchupAnalyzer":
+        from app.data.historical_matchups import HistoricalMatchupAnalyzer
+        return self._get("matchup_analyzer", HistoricalMatchupAnalyzer)
+
+    @property
+    def game_catalog(self) -> "GameCatalog":
+        from app.data.game_catalog import get_game_catalog
+        return get_game_catalog()
+
+    @property
+    def game_predictor(self) -> "GamePredictor":
+        from app.models.prediction_models import GamePredictor
+        return self._get("game_predictor", GamePredictor)
+
+    @property
+    def player_predictor(self) -> "PlayerPropPredictor":
+        from app.models.prediction_models import PlayerPropPredictor
+        return self._get("player_predictor", PlayerPropPredictor)
+
+    @property
+    def betting_analyzer(self) -> "BettingAnalyzer":
+        from app.models.betting_models import BettingAnalyzer
+        return self._get("betting_analyzer", BettingAnalyzer)
+
+    @property
+    def ml_predictor(self) -> "AdvancedMLPredictor":
+        from app.models.advanced_ml_models import AdvancedMLPredictor
+        return self._get("ml_predictor", AdvancedMLPredictor)
+
+    @property
+    def player_ml_predictor(self) -> "PlayerPropMLPredictor":
+        from app.models.advanced_ml_models import PlayerPropMLPredictor
+        return self._get("player_ml_predictor", PlayerPropMLPredictor)
+
+    @property
+    def prediction_tracker(self) -> "PredictionTracker":
+        from app.models.prediction_tracker import PredictionTracker
+        return self._get("prediction_tracker", PredictionTracker)
+
+    @property
+    def adaptive_predictor(self) -> "AdaptivePredictor":
+        from app.models.adaptive_predictor import AdaptivePredictor
+        return self._get("adaptive_predictor", lambda: AdaptivePredictor(self.prediction_tracker))
+
+    @property
+    def season_simulator(self) -> "SeasonSimulator":
+        from app.models.simulation_engine import SeasonSimulator
+        return self._get(
+            "season_simulator",
+            lambda: SeasonSimulator(predictor=self.game_predictor, data_collector=self.data_collector)
+        )
+
+    def game_context(self, game_id: str) -> "GameContext":
+        """
+        Create a per-request GameContext backed by the shared collectors
+
+        Args:
+            game_id: Unique game identifier
+        """
+        from app.data.game_context import GameContext
+        return GameContext(
+            game_id,
+            data_collector=self.data_collector,
+            injury_collector=self.injury_collector,
+            weather_analyzer=self.weather_analyzer
+        )
+
+    def close(self) -> None:
+        """Release resources (e.g. HTTP sessions) held by the services built so far"""
+        with self._lock:
+            services, self._services = self._services, {}
+        for name, service in services.items():
+            close = getattr(service, "close", None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    print(f"Error closing {name}: {e}")
+
+
+# Global container instance
+_services: Optional[ServiceContainer] = None
+_services_lock = threading.Lock()
+
+
+def get_services() -> ServiceContainer:
+    """
+    Get or create the process-wide service container
+
+    Also used as a FastAPI dependency: Depends(get_services)
+    """
+    global _services
+    if _services is None:
+        with _services_lock:
+            if _services is None:
+                _services = ServiceContainer()
+    return _services
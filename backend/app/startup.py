@@ -0,0 +1,122 @@
+"""
+Application startup: timed router imports and the background warm-up phase
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from datetime import datetime, timezone
+import importlib
+import time
+from app.utils.concurrency import run_blocking
+
+
+# (name, blocking callable, positional args) of one warm-up step
+WarmupPhase = Tuple[str, Callable, tuple]
+
+
+class StartupState:
+    """
+    Readiness of this worker process
+
+    Records how long each module import and warm-up phase took, so startup
+    regressions show up in /health and the Prometheus metrics. The worker
+    is ready once every warm-up phase has run; a failed phase is recorded
+    in errors and does not block readiness, since requests can still fall
+    back to loading data on demand.
+    """
+
+    def __init__(self):
+        self.ready = False
+        self.started_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+        self.import_times: Dict[str, float] = {}
+        self.phase_times: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.current_phase: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        """Readiness summary for the health endpoint"""
+        return {
+            "ready": self.ready,
+            "phase": self.current_phase,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "import_seconds": self.import_times,
+            "phase_seconds": self.phase_times,
+            "errors": self.errors
+        }
+
+
+# Global startup state of this process
+_startup_state = StartupState()
+
+
+def get_startup_state() -> StartupState:
+    """Get the process-wide startup state"""
+    return _startup_state
+
+
+def _record_metric(kind: str, name: str, seconds: float) -> None:
+    """Export a startup timing to Prometheus (optional)"""
+    try:
+        from app.monitoring.prometheus_metrics import record_startup_duration
+        record_startup_duration(kind, name, seconds)
+    except Exception:
+        pass
+
+
+def timed_import(module_name: str) -> Any:
+    """
+    Import a module and record how long it took
+
+    Args:
+        module_name: Dotted module path
+
+    Returns:
+        The imported module
+    """
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    seconds = round(time.perf_counter() - start, 4)
+    _startup_state.import_times[module_name] = seconds
+    _record_metric("import", module_name, seconds)
+    return module
+
+
+def log_import_times() -> None:
+    """Print recorded import times, slowest first"""
+    total = sum(_startup_state.import_times.values())
+    print(f"Module imports took {total:.2f}s:")
+    for module_name, seconds in sorted(_startup_state.import_times.items(), key=lambda item: -item[1]):
+        print(f"  {seconds:8.3f}s  {module_name}")
+
+
+async def warm_up(phases: List[WarmupPhase]) -> StartupState:
+    """
+    Run warm-up phases one after another on the blocking thread pool
+
+    Args:
+        phases: Steps to run, in order
+
+    Returns:
+        The startup state, marked ready
+    """
+    state = _startup_state
+    for name, func, args in phases:
+        state.current_phase = name
+        start = time.perf_counter()
+        try:
+            result = await run_blocking(func, *args)
+            if result is not None:
+                print(f"Warm-up {name}: {result}")
+        except Exception as e:
+            state.errors[name] = str(e)
+            print(f"Warm-up {name} failed: {e}")
+        seconds = round(time.perf_counter() - start, 4)
+        state.phase_times[name] = seconds
+        _record_metric("warmup", name, seconds)
+
+    state.current_phase = None
+    state.finished_at = datetime.now(timezone.utc)
+    state.ready = True
+    total = (state.finished_at - state.started_at).total_seconds()
+    print(f"Warm-up finished in {total:.2f}s: {state.phase_times}")
+    return state
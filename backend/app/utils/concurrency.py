@@ -0,0 +1,68 @@
+"""
+Bounded thread pool for running blocking data fetches off the event loop
+"""
+from typing import Any, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import threading
+from app.config import settings
+
+
+# Sentinel meaning "propagate errors instead of falling back"
+_NO_FALLBACK = object()
+
+# Global executor instance
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Get or create the shared data fetch thread pool"""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.DATA_FETCH_MAX_WORKERS,
+                    thread_name_prefix="data-fetch"
+                )
+    return _executor
+
+
+async def run_blocking(
+    func: Callable,
+    *args,
+    timeout: Optional[float] = None,
+    fallback: Any = _NO_FALLBACK,
+    label: Optional[str] = None,
+    **kwargs
+) -> Any:
+    """
+    Run a blocking callable on the shared pool without blocking the event loop
+
+    Args:
+        func: Blocking callable
+        *args: Positional arguments for func
+        timeout: Seconds to wait before giving up (None waits forever)
+        fallback: Value returned on timeout or error; if omitted, errors propagate
+        label: Name used in log messages
+        **kwargs: Keyword arguments for func
+
+    Returns:
+        Result of func, or fallback if it timed out or failed
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
+    try:
+        return await asyncio.wait_for(future, timeout)
+    except asyncio.TimeoutError:
+        if fallback is _NO_FALLBACK:
+            raise
+        print(f"{label or getattr(func, '__name__', 'fetch')} timed out after {timeout}s; continuing without it")
+        return fallback
+    except Exception as e:
+        if fallback is _NO_FALLBACK:
+            raise
+        print(f"{label or getattr(func, '__name__', 'fetch')} failed: {e}; continuing without it")
+        return fallback
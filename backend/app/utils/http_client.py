@@ -0,0 +1,268 @@
+"""
+Shared outbound HTTP clients with keep-alive pools, per-host limits and retries
+"""
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+import asyncio
+import functools
+import random
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from app.config import settings
+from app.utils.concurrency import run_blocking
+
+try:
+    import httpx
+except ImportError:
+    # httpx is optional; AsyncHttpClient falls back to the pooled sync client
+    # on the data fetch thread pool without it
+    httpx = None
+
+
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+def backoff_delay(attempt: int, base: float, cap: float, retry_after: Optional[str] = None) -> float:
+    """
+    Seconds to wait before a retry
+
+    Uses "full jitter" (uniform between 0 and the exponential step) so
+    workers that failed together do not retry together. A Retry-After
+    header in seconds takes precedence, capped the same way.
+
+    Args:
+        attempt: Retry number, starting at 0
+        base: Delay of the first step in seconds
+        cap: Maximum delay in seconds
+        retry_after: Retry-After header of the failed response, if any
+    """
+    if retry_after:
+        try:
+            return min(float(retry_after), cap)
+        except ValueError:
+            pass
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def _host(url: str) -> str:
+    return urlsplit(url).netloc
+
+
+class HttpClient:
+    """
+    Blocking HTTP client shared by every collector in the process
+
+    One requests.Session keeps connections alive in per-host pools, so
+    repeated calls to the same API reuse an open TCP/TLS connection instead
+    of handshaking every time. A semaphore per host bounds how many requests
+    the process sends to one API at once (callers beyond the limit wait),
+    and connection errors, timeouts, 429s and 5xx responses are retried with
+    jittered exponential backoff.
+    """
+
+    def __init__(
+        self,
+        max_per_host: Optional[int] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        timeout: Optional[float] = None
+    ):
+        """
+        Initialize the client
+
+        Args:
+            max_per_host: Concurrent requests per host (defaults to settings.HTTP_MAX_PER_HOST)
+            max_retries: Retries after the first attempt (defaults to settings.HTTP_MAX_RETRIES)
+            backoff_base: First backoff step in seconds (defaults to settings.HTTP_BACKOFF_BASE)
+            backoff_max: Maximum backoff in seconds (defaults to settings.HTTP_BACKOFF_MAX)
+            timeout: Default per-request timeout in seconds (defaults to settings.HTTP_TIMEOUT)
+        """
+        self.max_per_host = max_per_host or settings.HTTP_MAX_PER_HOST
+        self.max_retries = settings.HTTP_MAX_RETRIES if max_retries is None else max_retries
+        self.backoff_base = settings.HTTP_BACKOFF_BASE if backoff_base is None else backoff_base
+        self.backoff_max = settings.HTTP_BACKOFF_MAX if backoff_max is None else backoff_max
+        self.timeout = timeout or settings.HTTP_TIMEOUT
+
+        self.session = requests.Session()
+        # Keep at least as many idle connections per host as may be in flight
+        adapter = HTTPAdapter(pool_connections=settings.HTTP_POOL_HOSTS, pool_maxsize=self.max_per_host)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _limit(self, host: str) -> threading.BoundedSemaphore:
+        """Get the concurrency limit for a host"""
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_limits[host]
+
+    def request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """
+        Send a request, retrying transient failures
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            timeout: Per-attempt timeout in seconds (defaults to the client's)
+            **kwargs: Passed to requests (params, json, headers, ...)
+
+        Returns:
+            The response (the last one if every retry failed with a retryable status)
+
+        Raises:
+            requests.RequestException: If the last attempt failed to connect or timed out
+        """
+        limit = self._limit(_host(url))
+        for attempt in range(self.max_retries + 1):
+            retry_after = None
+            try:
+                with limit:
+                    response = self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == self.max_retries:
+                    raise
+            time.sleep(backoff_delay(attempt, self.backoff_base, self.backoff_max, retry_after))
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request (see request)"""
+        return self.request("GET", url, **kwargs)
+
+    def get_json(self, url: str, **kwargs) -> Any:
+        """
+        GET a URL and decode its JSON body
+
+        Raises:
+            requests.RequestException: On connection errors and non-2xx responses
+        """
+        response = self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self) -> None:
+        """Close pooled connections (new ones are opened on the next request)"""
+        self.session.close()
+
+
+class AsyncHttpClient:
+    """
+    Non-blocking counterpart of HttpClient for use inside request handlers
+
+    Uses an httpx.AsyncClient with the same pool size, per-host limit and
+    retry policy. Without httpx installed, requests run on the pooled
+    HttpClient through the data fetch thread pool instead. Either way the
+    responses expose status_code, headers, json() and raise_for_status().
+
+    Create it inside the running event loop (see get_async_http_client).
+    """
+
+    def __init__(self, sync_client: Optional[HttpClient] = None):
+        """
+        Initialize the client
+
+        Args:
+            sync_client: Client providing the limits and the fallback transport
+                (defaults to the process-wide HttpClient)
+        """
+        self.sync_client = sync_client or get_http_client()
+        self.max_per_host = self.sync_client.max_per_host
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self.client = None
+        if httpx is not None:
+            self.client = httpx.AsyncClient(
+                timeout=self.sync_client.timeout,
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_POOL_HOSTS * self.max_per_host,
+                    max_keepalive_connections=settings.HTTP_POOL_HOSTS * self.max_per_host
+                )
+            )
+
+    def _limit(self, host: str) -> asyncio.Semaphore:
+        """Get the concurrency limit for a host (event loop only, so no lock needed)"""
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_limits[host]
+
+    async def request(self, method: str, url: str, timeout: Optional[float] = None, **kwargs):
+        """
+        Send a request, retrying transient failures (see HttpClient.request)
+
+        Raises:
+            httpx.TransportError or requests.RequestException: If the last attempt
+                failed to connect or timed out
+        """
+        if self.client is None:
+            # partial keeps timeout as the per-attempt request timeout rather
+            # than run_blocking's overall deadline
+            return await run_blocking(functools.partial(self.sync_client.request, method, url, timeout=timeout, **kwargs))
+
+        client = self.sync_client
+        limit = self._limit(_host(url))
+        for attempt in range(client.max_retries + 1):
+            retry_after = None
+            try:
+                async with limit:
+                    response = await self.client.request(method, url, timeout=timeout or client.timeout, **kwargs)
+                if response.status_code not in RETRY_STATUSES or attempt == client.max_retries:
+                    return response
+                retry_after = response.headers.get("Retry-After")
+            except httpx.TransportError:
+                if attempt == client.max_retries:
+                    raise
+            await asyncio.sleep(backoff_delay(attempt, client.backoff_base, client.backoff_max, retry_after))
+
+    async def get(self, url: str, **kwargs):
+        """Send a GET request (see request)"""
+        return await self.request("GET", url, **kwargs)
+
+    async def get_json(self, url: str, **kwargs) -> Any:
+        """GET a URL and decode its JSON body, raising on non-2xx responses"""
+        response = await self.get(url, **kwargs)
+        response.raise_for_status()
+        return response.json()
+
+    async def close(self) -> None:
+        """Close pooled connections"""
+        if self.client is not None:
+            await self.client.aclose()
+
+
+# Global client instances
+_http_client: Optional[HttpClient] = None
+_http_client_lock = threading.Lock()
+_async_http_client: Optional[AsyncHttpClient] = None
+
+
+def get_http_client() -> HttpClient:
+    """Get or create the process-wide blocking HTTP client"""
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = HttpClient()
+    return _http_client
+
+
+def get_async_http_client() -> AsyncHttpClient:
+    """Get or create the async HTTP client (call from within the running event loop)"""
+    global _async_http_client
+    if _async_http_client is None:
+        _async_http_client = AsyncHttpClient()
+    return _async_http_client
+
+
+async def close_async_http_client():
+    """Close the async HTTP client (call on application shutdown)"""
+    global _async_http_client
+    if _async_http_client is not None:
+        await _async_http_client.close()
+        _async_http_client = None
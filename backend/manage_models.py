@@ -0,0 +1,64 @@
+"""
+Inspect and switch the model versions in the model registry
+
+Usage:
+    python manage_models.py list nfl
+    python manage_models.py promote nfl <version>
+    python manage_models.py rollback nfl
+    python manage_models.py verify nfl <version>
+"""
+import argparse
+import json
+import sys
+from app.models.model_registry import ModelRegistry
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Manage versioned model artifacts")
+    parser.add_argument("--model-dir", help="Registry root directory (default: settings.MODEL_DIR)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="List versions, newest first")
+    list_parser.add_argument("sport")
+
+    promote_parser = commands.add_parser("promote", help="Make a version current")
+    promote_parser.add_argument("sport")
+    promote_parser.add_argument("version")
+
+    rollback_parser = commands.add_parser("rollback", help="Return to the previously promoted version")
+    rollback_parser.add_argument("sport")
+
+    verify_parser = commands.add_parser("verify", help="Check a version's files against its manifest")
+    verify_parser.add_argument("sport")
+    verify_parser.add_argument("version")
+
+    args = parser.parse_args()
+    registry = ModelRegistry(args.model_dir)
+
+    try:
+        if args.command == "list":
+            for manifest in registry.versions(args.sport):
+                print(json.dumps({
+                    "version": manifest["version"],
+                    "current": manifest["current"],
+                    "created_at": manifest.get("created_at"),
+                    "validation_passed": manifest.get("validation_passed"),
+                    "metrics": manifest.get("metrics")
+                }))
+        elif args.command == "promote":
+            registry.promote(args.sport, args.version)
+            print(f"{args.sport}: {args.version} is now current")
+        elif args.command == "rollback":
+            print(f"{args.sport}: rolled back to {registry.rollback(args.sport)}")
+        elif args.command == "verify":
+            ok = registry.verify(args.sport, args.version)
+            print(f"{args.sport} {args.version}: {'ok' if ok else 'MISMATCH'}")
+            return 0 if ok else 1
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
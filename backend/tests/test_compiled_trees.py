@@ -0,0 +1,148 @@
+"""
+Parity of the compiled tree backend with sklearn/XGBoost inference
+"""
+import numpy as np
+import pytest
+import xgboost as xgb
+from sklearn.ensemble import RandomForestClassifier, GradientBoostingClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+from app.models.advanced_ml_models import (
+    AdvancedMLPredictor, COMPILED_ARTIFACT, COMPILED_PARITY_TOLERANCE, ENSEMBLE_MEMBERS, FEATURE_NAMES
+)
+from app.models.compiled_trees import CompiledTreeEnsemble
+from app.models.model_registry import ModelRegistry
+from app.models.model_trainer import ModelTrainer
+
+
+@pytest.fixture(scope="module")
+def training_data():
+    return ModelTrainer(model_dir="unused").load_training_data("nfl", n_samples=600, seed=7)
+
+
+@pytest.fixture(scope="module")
+def fitted(training_data):
+    """Small fitted ensemble members, logistic model and their shared scaler"""
+    X, y = training_data
+    scaler = StandardScaler().fit(X)
+    X_scaled = scaler.transform(X)
+    models = {
+        "random_forest": RandomForestClassifier(n_estimators=20, max_depth=6, random_state=0),
+        "gradient_boosting": GradientBoostingClassifier(n_estimators=20, max_depth=3, random_state=0),
+        "xgboost": xgb.XGBClassifier(n_estimators=20, max_depth=3, learning_rate=0.3, random_state=0),
+        "logistic": LogisticRegression(max_iter=1000),
+    }
+    for model in models.values():
+        model.fit(X_scaled, y)
+    return models, scaler
+
+
+@pytest.fixture(scope="module")
+def compiled(fitted):
+    models, scaler = fitted
+    return CompiledTreeEnsemble({mt: models[mt] for mt in ENSEMBLE_MEMBERS}, scaler)
+
+
+def _members(fitted):
+    models, _ = fitted
+    return {mt: models[mt] for mt in ENSEMBLE_MEMBERS}
+
+
+def test_parity_on_batch(fitted, compiled, training_data):
+    X, _ = training_data
+    assert compiled.parity_error(_members(fitted), X, fitted[1]) < COMPILED_PARITY_TOLERANCE
+
+
+def test_parity_on_single_row(fitted, compiled, training_data):
+    X, _ = training_data
+    assert compiled.parity_error(_members(fitted), X[:1], fitted[1]) < COMPILED_PARITY_TOLERANCE
+
+
+def test_parity_out_of_training_range(fitted, compiled):
+    rng = np.random.default_rng(1)
+    X = np.vstack([
+        rng.random((200, len(FEATURE_NAMES))) * 20 - 10,
+        np.full((1, len(FEATURE_NAMES)), 1e6),
+        np.full((1, len(FEATURE_NAMES)), -1e6),
+    ])
+    assert compiled.parity_error(_members(fitted), X, fitted[1]) < COMPILED_PARITY_TOLERANCE
+
+
+def test_arrays_round_trip(compiled, training_data):
+    X, _ = training_data
+    rebuilt = CompiledTreeEnsemble.from_arrays(compiled.to_arrays())
+    assert rebuilt.model_types == compiled.model_types
+    np.testing.assert_array_equal(rebuilt.predict_proba(X), compiled.predict_proba(X))
+
+
+@pytest.fixture
+def predictor(fitted, compiled, tmp_path):
+    """Predictor serving a registry version with the compiled artifact"""
+    models, scaler = fitted
+    registry = ModelRegistry(str(tmp_path))
+    manifest = registry.register(
+        "nfl",
+        {**models, "scaler": scaler, COMPILED_ARTIFACT: compiled.to_arrays()},
+        FEATURE_NAMES,
+        {"model_types": list(models)}
+    )
+    registry.promote("nfl", manifest["version"])
+
+    predictor = AdvancedMLPredictor(str(tmp_path))
+    predictor.inference_backend = "compiled"
+    predictor._ensure_loaded("nfl")
+    return predictor
+
+
+class _CountingEnsemble:
+    """Wraps a compiled ensemble and counts predict_proba calls"""
+
+    def __init__(self, ensemble):
+        self.ensemble = ensemble
+        self.model_types = ensemble.model_types
+        self.calls = 0
+
+    def predict_proba(self, X):
+        self.calls += 1
+        return self.ensemble.predict_proba(X)
+
+
+def _game(home_stats=None):
+    return {"home_team": "Home", "away_team": "Away", "home_stats": home_stats or {}, "away_stats": {}}
+
+
+def _library_probability(fitted, model_types, features):
+    models, scaler = fitted
+    X = scaler.transform(features)
+    return float(np.mean([models[mt].predict_proba(X)[:, 1] for mt in model_types]))
+
+
+def test_compiled_path_loads_no_library_models(predictor):
+    spy = predictor.compiled["nfl"] = _CountingEnsemble(predictor.compiled["nfl"])
+    predictor.predict_games_ml([_game()], sport="nfl")
+    assert spy.calls == 1
+    assert predictor.models == {}
+
+
+def test_nan_rows_use_library_path(predictor, fitted):
+    spy = predictor.compiled["nfl"] = _CountingEnsemble(predictor.compiled["nfl"])
+    game = _game({"win_rate": float("nan")})
+    # XGBoost treats NaN as missing (GradientBoostingClassifier rejects it)
+    result = predictor.predict_games_ml([game], sport="nfl", model_type="xgboost")[0]
+
+    assert spy.calls == 0
+    assert list(predictor.models) == ["nfl_xgboost"]
+    features = predictor._feature_matrix([game])
+    assert np.isnan(features).any()
+    assert result["home_win_probability"] == pytest.approx(_library_probability(fitted, ["xgboost"], features))
+
+
+def test_logistic_uses_library_path(predictor, fitted):
+    spy = predictor.compiled["nfl"] = _CountingEnsemble(predictor.compiled["nfl"])
+    game = _game()
+    result = predictor.predict_games_ml([game], sport="nfl", model_type="logistic")[0]
+
+    assert spy.calls == 0
+    assert list(predictor.models) == ["nfl_logistic"]
+    features = predictor._feature_matrix([game])
+    assert result["home_win_probability"] == pytest.approx(_library_probability(fitted, ["logistic"], features))
@@ -0,0 +1,43 @@
+"""
+Train, validate and publish the game outcome ML models
+
+Usage:
+    python train_models.py --sport nfl
+    python train_models.py --sport all --workers 8 --n-jobs 2
+    python train_models.py --sport nba --samples 5000 --no-publish
+"""
+import argparse
+import json
+import sys
+from app.models.model_trainer import ModelTrainer, MODEL_TYPES
+
+
+SPORTS = ["nfl", "nba", "mlb", "nhl"]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Train versioned model artifacts for the ML predictor")
+    parser.add_argument("--sport", required=True, choices=SPORTS + ["all"], help="Sport to train, or all")
+    parser.add_argument("--models", nargs="+", choices=MODEL_TYPES, help="Model types to train (default: all)")
+    parser.add_argument("--model-dir", help="Artifact root directory (default: settings.MODEL_DIR)")
+    parser.add_argument("--samples", type=int, default=1000, help="Training set size")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--workers", type=int, help="Training processes (default: settings.MODEL_TRAIN_WORKERS)")
+    parser.add_argument("--n-jobs", type=int, help="Tree-building threads per model (default: settings.MODEL_TRAIN_N_JOBS)")
+    parser.add_argument("--no-publish", action="store_true", help="Write the version without making it current")
+    args = parser.parse_args()
+
+    trainer = ModelTrainer(model_dir=args.model_dir, max_workers=args.workers, n_jobs=args.n_jobs)
+    results = trainer.train_all(
+        SPORTS if args.sport == "all" else [args.sport],
+        model_types=args.models,
+        n_samples=args.samples,
+        seed=args.seed,
+        publish=not args.no_publish
+    )
+    print(json.dumps(results, indent=2))
+    return 0 if all(result["validation_passed"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())